@@ -0,0 +1,15 @@
+"""
+문제 풀이용 라이브러리
+자주 쓰는 자료구조와 알고리즘을 Python에서 빠르게 동작하도록 구현해 둔 모듈들입니다.
+
+풀이에서는 `from boj_lib.<모듈> import <이름>` 형식으로 가져다 쓰고,
+제출할 때는 tools/boj_bundle.py가 사용한 부분만 solution.py 안에 합쳐 줍니다.
+(로컬 실행기는 lib/를 import 경로에 추가함)
+
+- fastio: 입력 전체를 한 번에 읽어 토큰으로 나누기, 한 번에 출력하기
+- fenwick: 펜윅 트리 (구간 합, array 기반)
+- segtree: 세그먼트 트리 (임의의 결합 연산, array 기반)
+- dsu: 분리 집합 (유니온 파인드)
+- bsearch: 답에 대한 이분 탐색 (매개 변수 탐색)
+- pattern: 단어 패턴 정규화 (첫 등장 순서 번호)
+"""
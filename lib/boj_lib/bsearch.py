@@ -0,0 +1,37 @@
+"""
+답에 대한 이분 탐색 (매개 변수 탐색)
+"답이 x 이상(이하)이 될 수 있는가?"를 판정하는 함수로 최적의 x를 찾습니다.
+"""
+
+
+def max_true(lo: int, hi: int, pred) -> int:
+    """
+    [lo, hi]에서 pred(x)가 참인 가장 큰 정수 x
+
+    pred는 x가 커질수록 참에서 거짓으로 한 번만 바뀌어야 합니다. 참인 x가 없으면 lo - 1을 반환합니다.
+    (예: 과자를 길이 x로 잘라서 m명에게 줄 수 있는 최대 x)
+    """
+    lo -= 1
+    while lo < hi:
+        mid = (lo + hi + 1) >> 1
+        if pred(mid):
+            lo = mid
+        else:
+            hi = mid - 1
+    return lo
+
+
+def min_true(lo: int, hi: int, pred) -> int:
+    """
+    [lo, hi]에서 pred(x)가 참인 가장 작은 정수 x
+
+    pred는 x가 커질수록 거짓에서 참으로 한 번만 바뀌어야 합니다. 참인 x가 없으면 hi + 1을 반환합니다.
+    """
+    hi += 1
+    while lo < hi:
+        mid = (lo + hi) >> 1
+        if pred(mid):
+            hi = mid
+        else:
+            lo = mid + 1
+    return lo
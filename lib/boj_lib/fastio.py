@@ -0,0 +1,63 @@
+"""
+빠른 입출력
+입력 전체를 sys.stdin.buffer에서 한 번에 읽어서 공백으로 나누고, 출력은 한 번의 write로 씁니다.
+"""
+import sys
+
+
+def read_tokens() -> list:
+    """입력 전체를 공백 기준으로 나눈 bytes 토큰 리스트"""
+    return sys.stdin.buffer.read().split()
+
+
+class Tokens:
+    """
+    입력 토큰을 앞에서부터 꺼내 쓰는 읽기 도구
+
+        tokens = Tokens()
+        n, m = tokens.ints(2)
+        array = tokens.ints(n)
+    """
+
+    __slots__ = ('data', 'pos')
+
+    def __init__(self, data: list = None):
+        self.data = read_tokens() if data is None else data
+        self.pos = 0
+
+    def int(self) -> int:
+        value = int(self.data[self.pos])
+        self.pos += 1
+        return value
+
+    def ints(self, count: int) -> list:
+        """정수 count개 (한 번의 map으로 변환)"""
+        start = self.pos
+        self.pos += count
+        return list(map(int, self.data[start:self.pos]))
+
+    def word(self) -> str:
+        value = self.data[self.pos].decode()
+        self.pos += 1
+        return value
+
+    def words(self, count: int) -> list:
+        start = self.pos
+        self.pos += count
+        return [token.decode() for token in self.data[start:self.pos]]
+
+    def rest(self) -> list:
+        """남은 토큰 전체 (bytes)"""
+        start = self.pos
+        self.pos = len(self.data)
+        return self.data[start:]
+
+
+def write_lines(lines) -> None:
+    """값들을 한 줄에 하나씩 한 번에 출력"""
+    sys.stdout.write('\n'.join(map(str, lines)) + '\n')
+
+
+def write_rows(rows) -> None:
+    """줄마다 값들을 공백으로 구분해서 한 번에 출력"""
+    sys.stdout.write('\n'.join(' '.join(map(str, row)) for row in rows) + '\n')
@@ -0,0 +1,77 @@
+"""
+펜윅 트리 (Binary Indexed Tree)
+점 갱신과 구간 합을 O(log N)에 처리합니다. 값은 array에 저장해서 리스트보다 메모리를 적게 씁니다.
+"""
+from array import array
+
+
+class Fenwick:
+    """
+    0-based 인덱스를 쓰는 펜윅 트리
+
+    typecode 'q'(64비트 정수)는 합이 2^63을 넘으면 OverflowError가 나므로,
+    그보다 큰 합이 필요하면 typecode='d'(실수)나 리스트 기반 구현을 사용하세요.
+    """
+
+    __slots__ = ('n', 'tree')
+
+    def __init__(self, size_or_values, typecode: str = 'q'):
+        """
+        Args:
+            size_or_values: 크기 (모두 0으로 시작) 또는 초기값 리스트 (O(N)에 구성)
+            typecode: array 타입 코드 (기본값: 'q', 64비트 정수)
+        """
+        if isinstance(size_or_values, int):
+            self.n = size_or_values
+            self.tree = array(typecode, bytes(array(typecode).itemsize * (self.n + 1)))
+            return
+
+        self.n = len(size_or_values)
+        tree = array(typecode, [0])
+        tree.extend(size_or_values)
+        n = self.n
+        for i in range(1, n + 1):
+            j = i + (i & -i)
+            if j <= n:
+                tree[j] += tree[i]
+        self.tree = tree
+
+    def add(self, index: int, delta) -> None:
+        """index 위치에 delta를 더합니다."""
+        tree = self.tree
+        n = self.n
+        i = index + 1
+        while i <= n:
+            tree[i] += delta
+            i += i & -i
+
+    def prefix_sum(self, end: int):
+        """[0, end) 구간의 합"""
+        tree = self.tree
+        total = 0
+        i = end
+        while i > 0:
+            total += tree[i]
+            i &= i - 1
+        return total
+
+    def range_sum(self, start: int, end: int):
+        """[start, end) 구간의 합"""
+        return self.prefix_sum(end) - self.prefix_sum(start)
+
+    def lower_bound(self, target) -> int:
+        """
+        prefix_sum(i + 1) >= target인 가장 작은 i (모든 값이 0 이상일 때)
+
+        target이 전체 합보다 크면 n을 반환합니다. (k번째 원소 찾기 등)
+        """
+        tree = self.tree
+        pos = 0
+        step = 1 << self.n.bit_length()
+        while step:
+            nxt = pos + step
+            if nxt <= self.n and tree[nxt] < target:
+                pos = nxt
+                target -= tree[nxt]
+            step >>= 1
+        return pos
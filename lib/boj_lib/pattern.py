@@ -0,0 +1,23 @@
+"""
+단어 패턴 정규화
+각 글자를 처음 등장한 순서 번호로 바꿔서, 글자를 일대일로 바꾸면 같아지는 단어끼리 같은 키를 갖게 합니다.
+(예: 'abca' -> (0, 1, 2, 0), 'xyzx' -> (0, 1, 2, 0))
+"""
+from collections import Counter
+
+
+def pattern_key(word) -> tuple:
+    """
+    단어의 패턴 키
+
+    word.index(글자)는 그 글자가 처음 나온 위치이므로, 같은 패턴이면 같은 튜플이 됩니다.
+    (글자 번호 대신 첫 등장 위치를 쓰지만 비교 결과는 같음, 반복은 모두 C에서 처리됨)
+    """
+    return tuple(map(word.index, word))
+
+
+def count_pattern_pairs(words) -> int:
+    """패턴이 같은 단어 쌍의 수"""
+    # 단어마다 pattern_key()를 부르는 비용을 줄이려고 같은 식을 직접 씀
+    counts = Counter([tuple(map(word.index, word)) for word in words])
+    return sum(count * (count - 1) // 2 for count in counts.values())
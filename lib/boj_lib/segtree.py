@@ -0,0 +1,68 @@
+"""
+세그먼트 트리
+점 갱신과 구간 질의를 O(log N)에 처리하는 bottom-up(비재귀) 세그먼트 트리입니다.
+결합 법칙을 만족하는 연산(min, max, 합, gcd 등)이면 모두 쓸 수 있습니다.
+"""
+from array import array
+
+
+class SegTree:
+    """
+    0-based 인덱스를 쓰는 세그먼트 트리
+
+        tree = SegTree(values, min, 10 ** 18)
+        tree.update(3, 5)
+        tree.query(2, 7)   # min(values[2:7])
+    """
+
+    __slots__ = ('n', 'op', 'identity', 'tree')
+
+    def __init__(self, values, op, identity, typecode: str = 'q'):
+        """
+        Args:
+            values: 초기값 리스트
+            op: 결합 연산 (두 값을 받아 하나를 반환, 예: min, max, operator.add)
+            identity: 연산의 항등원 (min이면 충분히 큰 값, 합이면 0)
+            typecode: array 타입 코드 (기본값: 'q', 64비트 정수)
+        """
+        n = len(values)
+        self.n = n
+        self.op = op
+        self.identity = identity
+        tree = array(typecode, [identity]) * (2 * n)
+        tree[n:] = array(typecode, values)
+        for i in range(n - 1, 0, -1):
+            tree[i] = op(tree[2 * i], tree[2 * i + 1])
+        self.tree = tree
+
+    def get(self, index: int):
+        return self.tree[index + self.n]
+
+    def update(self, index: int, value) -> None:
+        """index 위치의 값을 value로 바꿉니다."""
+        tree = self.tree
+        op = self.op
+        i = index + self.n
+        tree[i] = value
+        i >>= 1
+        while i:
+            tree[i] = op(tree[2 * i], tree[2 * i + 1])
+            i >>= 1
+
+    def query(self, start: int, end: int):
+        """[start, end) 구간에 연산을 적용한 값 (빈 구간이면 항등원)"""
+        tree = self.tree
+        op = self.op
+        left = right = self.identity
+        lo = start + self.n
+        hi = end + self.n
+        while lo < hi:
+            if lo & 1:
+                left = op(left, tree[lo])
+                lo += 1
+            if hi & 1:
+                hi -= 1
+                right = op(tree[hi], right)
+            lo >>= 1
+            hi >>= 1
+        return op(left, right)
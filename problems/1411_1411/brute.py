@@ -0,0 +1,22 @@
+"""
+BOJ 1411 - 비슷한 단어 (참조 풀이)
+두 단어의 글자 대응이 일대일인지 집합 크기로 직접 확인하는 완전 탐색
+"""
+
+import sys
+
+
+def solve(words):
+    count = 0
+    for i in range(len(words)):
+        for j in range(i + 1, len(words)):
+            a, b = words[i], words[j]
+            if len(set(a)) == len(set(b)) == len(set(zip(a, b))):
+                count += 1
+    return count
+
+
+if __name__ == "__main__":
+    lines = sys.stdin.read().split()
+    n = int(lines[0])
+    print(solve(lines[1:n + 1]))
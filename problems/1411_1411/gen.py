@@ -0,0 +1,33 @@
+"""
+BOJ 1411 - 비슷한 단어 입력 생성기
+사용법: python gen.py <seed> [n]
+"""
+
+import sys
+import random
+
+
+def generate(seed, n=None):
+    rng = random.Random(seed)
+
+    # 작은 알파벳을 써야 비슷한 단어 쌍이 자주 나옴
+    if n is None:
+        length = rng.randint(1, 6)
+        alphabet = 'abcd'[:rng.randint(1, 4)]
+        n = rng.randint(1, min(len(alphabet) ** length, 10))
+    else:
+        # 크기를 지정하면 최대 길이의 단어로 채움
+        length = 50
+        alphabet = 'abc'
+
+    words = set()
+    while len(words) < n:
+        words.add(''.join(rng.choice(alphabet) for _ in range(length)))
+
+    return [str(n)] + sorted(words, key=lambda _: rng.random())
+
+
+if __name__ == "__main__":
+    seed = int(sys.argv[1]) if len(sys.argv) > 1 else 0
+    n = int(sys.argv[2]) if len(sys.argv) > 2 else None
+    print('\n'.join(generate(seed, n)))
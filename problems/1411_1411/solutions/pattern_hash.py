@@ -0,0 +1,65 @@
+"""
+BOJ 1411 - 비슷한 단어 (패턴 해싱)
+
+최적화 아이디어:
+1. 패턴 해싱: 각 단어를 패턴으로 변환하여 O(1)에 비교
+   예: "aabbcc" -> (0, 0, 1, 1, 2, 2), "ddeeff" -> (0, 0, 1, 1, 2, 2) (같은 패턴)
+
+2. 패턴 생성 방식:
+   - 각 문자가 처음 등장한 순서대로 번호 부여
+   - 예: "abca" -> (0, 1, 2, 0) (a=0, b=1, c=2, a는 이미 0)
+   - 번호를 문자열로 이어 붙이면 10번 이상에서 다른 패턴이 같아질 수 있으므로 튜플 사용
+
+3. 같은 패턴을 가진 단어끼리만 비슷한 단어
+
+시간복잡도: O(N^2 * L) -> O(N * L + N^2)
+"""
+
+import sys
+from collections import defaultdict
+
+
+def read_input():
+    """입력을 읽어서 반환"""
+    data = sys.stdin.read().split()
+    n = int(data[0])
+    return n, data[1:n + 1]
+
+
+def write_output(output_data):
+    """출력 데이터를 출력"""
+    print(output_data)
+
+
+def get_pattern(word):
+    """단어를 패턴 튜플로 변환"""
+    char_map = {}
+    pattern = []
+
+    for char in word:
+        if char not in char_map:
+            char_map[char] = len(char_map)
+        pattern.append(char_map[char])
+
+    return tuple(pattern)
+
+
+def solve(n, input_data):
+    # 각 단어의 패턴을 계산하여 그룹화
+    pattern_count = defaultdict(int)
+
+    for word in input_data:
+        pattern_count[get_pattern(word)] += 1
+
+    # 같은 패턴을 가진 단어들의 조합 개수 계산 (nC2)
+    output_data = 0
+    for count in pattern_count.values():
+        output_data += count * (count - 1) // 2
+
+    return output_data
+
+
+if __name__ == "__main__":
+    n, input_data = read_input()
+    output_data = solve(n, input_data)
+    write_output(output_data)
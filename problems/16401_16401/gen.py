@@ -0,0 +1,28 @@
+"""
+BOJ 16401 - 과자 나눠주기 입력 생성기
+사용법: python gen.py <seed> [n]
+"""
+
+import sys
+import random
+
+
+def generate(seed, n=None):
+    rng = random.Random(seed)
+
+    if n is None:
+        n = rng.randint(1, 10)
+        max_length = rng.choice([10, 100, 1000000000])
+    else:
+        max_length = 1000000000
+
+    m = rng.randint(1, 1000000)
+    lengths = [rng.randint(1, max_length) for _ in range(n)]
+
+    return f"{m} {n}\n{' '.join(map(str, lengths))}"
+
+
+if __name__ == "__main__":
+    seed = int(sys.argv[1]) if len(sys.argv) > 1 else 0
+    n = int(sys.argv[2]) if len(sys.argv) > 2 else None
+    print(generate(seed, n))
@@ -0,0 +1,32 @@
+"""
+BOJ 16401 - 과자 나눠주기 (boj_lib 사용: read_tokens, max_true)
+"""
+
+import sys
+
+from boj_lib.fastio import read_tokens
+from boj_lib.bsearch import max_true
+
+
+def read_input():
+    """입력 전체를 한 번에 읽어서 반환"""
+    data = read_tokens()
+    m, n = int(data[0]), int(data[1])
+    l = list(map(int, data[2:2 + n]))
+    return m, n, l
+
+
+def write_output(output_data):
+    """출력 데이터를 출력"""
+    sys.stdout.write(f"{output_data}\n")
+
+
+def solve(m, n, l):
+    # 길이 length로 잘라서 m명 이상에게 줄 수 있는 가장 긴 길이 (없으면 0)
+    return max_true(1, max(l), lambda length: sum(snack // length for snack in l) >= m)
+
+
+if __name__ == "__main__":
+    m, n, l = read_input()
+    output_data = solve(m, n, l)
+    write_output(output_data)
@@ -6,19 +6,16 @@ import sys
 from collections import deque
 
 def read_input():
-    """입력을 읽어서 반환"""
-    t = int(sys.stdin.readline())
-    input_data = []
-    for i in range(t):
-        line = list(map(int, sys.stdin.readline().rstrip().split()))
-        input_data.append(line)
-    return input_data
+    """입력 전체를 한 번에 읽어서 반환 (첫 줄과 다음 N줄)"""
+    data = sys.stdin.buffer.read().split()
+    t = int(data[0])
+    values = list(map(int, data[1:1 + t * 9]))
+    return [values[i:i + 9] for i in range(0, len(values), 9)]
 
 
 def write_output(output_data):
-    """출력 데이터를 출력"""
-    for data in output_data:
-        print(' '.join(map(str, data)))
+    """출력 데이터를 한 번에 출력"""
+    sys.stdout.write('\n'.join(' '.join(map(str, data)) for data in output_data) + '\n')
 
 
 def solve(input_data):
@@ -0,0 +1,57 @@
+"""
+백준 도구 통합 실행기
+`python tools/boj.py <명령> [옵션]`으로 tools/의 스크립트들을 실행합니다.
+
+명령에 해당하는 모듈만 그때 import 하므로, requests/bs4(setup, random, submit)나
+selenium(submit --backend selenium) 같은 무거운 의존성은 그 명령을 쓸 때만 불러옵니다.
+명령 뒤의 옵션은 각 스크립트의 main()에 그대로 전달됩니다.
+"""
+import sys
+import argparse
+import importlib
+from typing import List, Optional
+
+# 명령 -> (모듈, 설명)
+COMMANDS = {
+    'setup': ('boj_setup', '문제 세팅 (문제 크롤링, 예제, solution.py 템플릿)'),
+    'random': ('boj_random', '랜덤 문제를 골라서 세팅'),
+    'test': ('boj_test', '예제로 solution.py 실행 (감시 모드, 프로파일링, 인터프리터 비교)'),
+    'verify': ('verify', '예제 입출력으로 풀이 검증 (메모리 프로파일링, 인터프리터 비교)'),
+    'submit': ('boj_submit', '백준에 제출하고 채점 결과 확인'),
+    'bench': ('boj_bench', 'solution.py와 solutions/*.py 풀이 비교'),
+    'stress': ('boj_stress', '정답 풀이와 비교하는 스트레스 테스트'),
+    'complexity': ('boj_complexity', '입력 크기별 실행 시간으로 시간 복잡도 추정'),
+    'bundle': ('boj_bundle', 'boj_lib을 합친 제출용 단일 파일 만들기'),
+    'status': ('boj_status', '제출 번호의 채점 결과 확인'),
+}
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(
+        prog='boj',
+        description='백준 풀이 도구들을 하나의 명령으로 실행합니다.',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="명령:\n" + "\n".join(f"  {name:<12}{description}" for name, (_, description) in COMMANDS.items())
+               + """
+
+사용 예시:
+  python tools/boj.py setup 1000
+  python tools/boj.py test 1000 --watch
+  python tools/boj.py verify --all
+  python tools/boj.py submit 1000 --backend http
+  python tools/boj.py test --help           # 명령별 옵션
+        """
+    )
+    parser.add_argument('command', choices=COMMANDS, metavar='command', help='실행할 명령 (아래 목록 참고)')
+    parser.add_argument('args', nargs=argparse.REMAINDER, help='명령에 전달할 옵션')
+
+    args = parser.parse_args(argv)
+
+    module = importlib.import_module(COMMANDS[args.command][0])
+    # 명령별 사용법에 'boj <명령>'으로 표시되도록 (argparse는 sys.argv[0]을 프로그램 이름으로 사용)
+    sys.argv[0] = f"boj {args.command}"
+    module.main(args.args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,206 @@
+"""
+풀이 변형 비교 벤치마크 스크립트
+solution.py와 solutions/*.py를 같은 입력으로 실행해서 출력이 모두 같은지 확인하고,
+반복 실행한 시간을 중앙값과 백분위수로 비교해서 가장 빠른 풀이를 표시합니다.
+
+입력은 문제의 예제 입력을 사용하고, --size를 주면 입력 생성기(python gen.py <seed> <n>)로 만듭니다.
+반복할 때마다 풀이의 실행 순서를 돌려서 시스템 부하의 변화가 한 풀이에만 몰리지 않게 합니다.
+"""
+import os
+import sys
+import argparse
+import statistics
+import tempfile
+from contextlib import ExitStack
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from boj_compare import compare_text, format_mismatch
+from boj_registry import find_test_cases, find_variants, resolve_problem_dir
+from boj_runner import RUNNER_MODES, create_runner, pad
+
+
+def percentile(values: List[float], p: float) -> float:
+    """p 백분위수 (두 값 사이는 선형 보간)"""
+    ordered = sorted(values)
+    position = (len(ordered) - 1) * p / 100
+    lower = int(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+
+class BOJBench:
+    """풀이 변형들을 같은 입력으로 실행해서 출력과 실행 시간을 비교하는 클래스"""
+
+    def __init__(self, problem_dir: Path, variants: List[Tuple[str, Path]],
+                 runner_mode: str = 'auto', timeout: float = 10):
+        self.problem_dir = Path(problem_dir)
+        self.variants = variants
+        self.runner_mode = runner_mode
+        self.timeout = timeout
+
+    def run(self, inputs: List[Tuple[str, Path]], repeat: int) -> Optional[Dict[str, List[float]]]:
+        """
+        모든 풀이의 출력이 같은지 확인한 뒤 실행 시간을 측정합니다.
+
+        첫 번째 풀이(보통 solution.py)의 출력을 기준으로 비교하고, 실행에 실패하거나 출력이 다른 풀이가
+        있으면 측정하지 않습니다. (첫 실행은 확인과 함께 준비 실행을 겸함)
+
+        Args:
+            inputs: (입력 이름, 입력 파일) 리스트
+            repeat: 반복 횟수
+
+        Returns:
+            {풀이 이름: 반복마다 모든 입력을 실행한 시간 합계(초) 리스트} 또는 None (확인 실패)
+        """
+        with ExitStack() as stack:
+            runners = [stack.enter_context(create_runner(path, mode=self.runner_mode, cwd=self.problem_dir))
+                       for _, path in self.variants]
+
+            if not self._check(runners, inputs):
+                return None
+
+            totals = {name: [] for name, _ in self.variants}
+            for round_index in range(repeat):
+                # 반복마다 실행 순서를 한 칸씩 돌림
+                shift = round_index % len(self.variants)
+                order = list(range(len(self.variants)))
+                for i in order[shift:] + order[:shift]:
+                    name = self.variants[i][0]
+                    totals[name].append(sum(runners[i].run(path, timeout=self.timeout).wall_time
+                                            for _, path in inputs))
+            return totals
+
+    def _check(self, runners: list, inputs: List[Tuple[str, Path]]) -> bool:
+        """모든 풀이가 모든 입력에서 정상 종료하고 기준 풀이와 같은 출력을 내는지 확인합니다."""
+        ok = True
+        base_name = self.variants[0][0]
+        for input_name, path in inputs:
+            expected = None
+            for (name, _), runner in zip(self.variants, runners):
+                result = runner.run(path, timeout=self.timeout)
+                if result.timed_out or result.returncode != 0:
+                    reason = "시간 초과" if result.timed_out else f"런타임 에러\n{result.stderr.rstrip()}"
+                    print(f"[X] {name}: 입력 {input_name}에서 {reason}")
+                    ok = False
+                    continue
+                if expected is None:
+                    expected = result.stdout
+                    continue
+                mismatch = compare_text(result.stdout, expected)
+                if mismatch:
+                    print(f"[X] {name}: 입력 {input_name}의 출력이 기준 풀이({base_name})와 다릅니다.")
+                    print(format_mismatch(mismatch))
+                    ok = False
+        return ok
+
+
+def generate_inputs(problem_dir: Path, generator: str, tmp_dir: Path, size: int,
+                    count: int, seed: int, runner_mode: str) -> List[Tuple[str, Path]]:
+    """입력 생성기로 크기 size의 입력 count개를 만듭니다."""
+    inputs = []
+    with create_runner(problem_dir / generator, mode=runner_mode, cwd=problem_dir) as runner:
+        for case_seed in range(seed, seed + count):
+            generated = runner.run(os.devnull, timeout=60, args=(case_seed, size))
+            if generated.returncode != 0:
+                raise RuntimeError(f"생성기 오류 (시드 {case_seed})\n{generated.stderr}")
+            path = tmp_dir / f"{case_seed}.txt"
+            path.write_text(generated.stdout, encoding='utf-8')
+            inputs.append((f"시드 {case_seed}", path))
+    return inputs
+
+
+def print_comparison(totals: Dict[str, List[float]], p: float):
+    """풀이별 중앙값, 백분위수, 최솟값과 가장 빠른 풀이 대비 배수를 표로 출력합니다."""
+    medians = {name: statistics.median(times) for name, times in totals.items()}
+    fastest = min(medians, key=medians.get)
+
+    print(pad('풀이', 20) + pad('중앙값', 12, right=True) + pad(f'p{p:g}', 12, right=True)
+          + pad('최소', 12, right=True) + pad('비교', 10, right=True))
+    print("-" * 66)
+    for name, times in sorted(totals.items(), key=lambda item: medians[item[0]]):
+        ratio = medians[name] / medians[fastest]
+        mark = "  <- 가장 빠름" if name == fastest and len(totals) > 1 else ""
+        print(pad(name, 20) + pad(f"{medians[name] * 1000:.1f} ms", 12, right=True)
+              + pad(f"{percentile(times, p) * 1000:.1f} ms", 12, right=True)
+              + pad(f"{min(times) * 1000:.1f} ms", 12, right=True)
+              + pad(f"{ratio:.2f}x", 10, right=True) + mark)
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(
+        description='solution.py와 solutions/*.py 풀이들의 출력과 실행 시간을 비교합니다.',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+사용 예시:
+  python boj_bench.py 1411                          # 예제 입력으로 모든 풀이 비교
+  python boj_bench.py 1411 --size 1000 -r 20        # gen.py로 만든 크기 1000 입력으로 20회 반복
+  python boj_bench.py 1411 --only solution pattern_hash
+        """
+    )
+    parser.add_argument('problem_id', type=str, help='백준 문제 번호 또는 문제 디렉토리 경로')
+    parser.add_argument('--dir', type=str, default='problems', help='문제가 저장된 기본 디렉토리')
+    parser.add_argument('--only', type=str, nargs='+', help='비교할 풀이 이름 (기본값: 전체)')
+    parser.add_argument('-r', '--repeat', type=int, default=10, help='반복 횟수 (기본값: 10)')
+    parser.add_argument('-p', '--percentile', type=float, default=90, help='함께 보여줄 백분위수 (기본값: 90)')
+    parser.add_argument('--size', type=int, help='입력 생성기로 만들 입력 크기 (생략하면 예제 입력 사용)')
+    parser.add_argument('--inputs', type=int, default=3, help='--size로 만들 입력 수 (기본값: 3)')
+    parser.add_argument('--seed', type=int, default=0, help='--size로 만들 입력의 시작 시드 (기본값: 0)')
+    parser.add_argument('--gen', type=str, default='gen.py', help='입력 생성기 파일 (기본값: gen.py)')
+    parser.add_argument('--timeout', type=float, default=10, help='실행당 시간 제한 (초, 기본값: 10)')
+    parser.add_argument('--runner', type=str, choices=RUNNER_MODES, default='auto',
+                        help='실행 방식 (기본값: auto)')
+
+    args = parser.parse_args(argv)
+
+    problem_dir = resolve_problem_dir(args.problem_id, args.dir)
+    if not problem_dir:
+        print(f"[X] 문제 디렉토리를 찾을 수 없습니다: {args.problem_id}")
+        sys.exit(1)
+
+    variants = find_variants(problem_dir)
+    if args.only:
+        unknown = set(args.only) - {name for name, _ in variants}
+        if unknown:
+            print(f"[X] 풀이를 찾을 수 없습니다: {', '.join(sorted(unknown))} "
+                  f"(있는 풀이: {', '.join(name for name, _ in variants)})")
+            sys.exit(1)
+        variants = [variant for variant in variants if variant[0] in args.only]
+    if not variants:
+        print(f"[X] 풀이 파일이 없습니다: {problem_dir}/solution.py, {problem_dir}/solutions/*.py")
+        sys.exit(1)
+
+    with tempfile.TemporaryDirectory(prefix='boj_bench_') as tmp_dir:
+        if args.size is None:
+            inputs = [(f"{path.stem}번", path) for path, _ in find_test_cases(problem_dir)]
+        else:
+            if not (problem_dir / args.gen).exists():
+                print(f"[X] 입력 생성기를 찾을 수 없습니다: {problem_dir / args.gen}")
+                sys.exit(1)
+            try:
+                inputs = generate_inputs(problem_dir, args.gen, Path(tmp_dir), args.size,
+                                         args.inputs, args.seed, args.runner)
+            except RuntimeError as e:
+                print(f"[X] {e}")
+                sys.exit(1)
+
+        if not inputs:
+            print("[X] 입력이 없습니다. 예제 입력을 추가하거나 --size로 입력을 만드세요.")
+            sys.exit(1)
+
+        print(f"[*] 풀이 {len(variants)}개: {', '.join(name for name, _ in variants)}")
+        print(f"[*] 입력 {len(inputs)}개, {args.repeat}회 반복 (반복마다 모든 입력을 실행한 시간 합계)\n")
+
+        bench = BOJBench(problem_dir, variants, runner_mode=args.runner, timeout=args.timeout)
+        totals = bench.run(inputs, max(1, args.repeat))
+
+    if totals is None:
+        print("\n[X] 출력이 다르거나 실행에 실패한 풀이가 있어 시간을 측정하지 않았습니다.")
+        sys.exit(1)
+
+    print("[O] 모든 풀이의 출력이 같습니다.\n")
+    print_comparison(totals, args.percentile)
+
+
+if __name__ == "__main__":
+    main()
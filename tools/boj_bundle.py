@@ -0,0 +1,260 @@
+"""
+제출용 단일 파일 번들러
+백준은 파일 하나만 제출할 수 있으므로, solution.py의 `from boj_lib.<모듈> import <이름>` 문을
+lib/boj_lib에서 실제로 쓰는 정의로 바꿔서 하나의 파일로 합칩니다.
+
+모듈 전체를 붙이지 않고, 가져온 이름과 그 정의가 참조하는 모듈 안의 이름(함수, 클래스, 상수, import)만
+따라가서 필요한 부분만 넣습니다. (라이브러리 모듈끼리의 import도 같은 방식으로 따라감)
+"""
+import ast
+import sys
+import argparse
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Union
+
+from boj_paths import LIB_DIR
+
+LIB_PACKAGE = "boj_lib"
+
+BUNDLE_BEGIN = "# ---- boj_lib (tools/boj_bundle.py로 합친 부분) ----"
+BUNDLE_END = "# ---- boj_lib 끝 ----"
+
+
+class BundleError(Exception):
+    """번들링할 수 없는 import (지원하지 않는 형식, 없는 모듈/이름)"""
+
+
+class _LibModule:
+    """라이브러리 모듈 하나의 최상위 문장과 이름 정보"""
+
+    def __init__(self, name: str, lib_dir: Path):
+        path = lib_dir / LIB_PACKAGE / f"{name}.py"
+        if not path.exists():
+            raise BundleError(f"{LIB_PACKAGE}.{name} 모듈이 없습니다. ({path})")
+
+        self.name = name
+        self.lines = path.read_text(encoding='utf-8').splitlines()
+        tree = ast.parse('\n'.join(self.lines), filename=str(path))
+
+        # 문장 번호 -> 문장, 이름 -> 그 이름을 정의하는 문장 번호들
+        self.statements = []
+        self.definitions = {}
+        for node in tree.body:
+            if _is_docstring(node):
+                continue
+            index = len(self.statements)
+            self.statements.append(node)
+            for name in _defined_names(node):
+                self.definitions.setdefault(name, []).append(index)
+
+    def source(self, index: int) -> str:
+        node = self.statements[index]
+        start = min([node.lineno] + [d.lineno for d in getattr(node, 'decorator_list', [])])
+        return '\n'.join(self.lines[start - 1:node.end_lineno])
+
+
+def lib_imports(tree: ast.Module) -> List[ast.ImportFrom]:
+    """
+    solution.py의 boj_lib import 문들
+
+    `from boj_lib.<모듈> import <이름>` 형식만 지원합니다.
+    (모듈째 import 하면 어떤 이름을 쓰는지 알 수 없어서 필요한 부분만 넣을 수 없음)
+    """
+    imports = []
+    top_level = set(map(id, tree.body))
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            for alias in node.names:
+                if alias.name.split('.')[0] == LIB_PACKAGE:
+                    raise BundleError(f"{node.lineno}번째 줄: 'import {alias.name}' 대신 "
+                                      f"'from {LIB_PACKAGE}.<모듈> import <이름>' 형식을 사용하세요.")
+        elif isinstance(node, ast.ImportFrom) and (node.module or '').split('.')[0] == LIB_PACKAGE:
+            if node.module == LIB_PACKAGE or node.module.count('.') != 1:
+                raise BundleError(f"{node.lineno}번째 줄: 'from {LIB_PACKAGE}.<모듈> import <이름>' "
+                                  f"형식을 사용하세요.")
+            if any(alias.name == '*' for alias in node.names):
+                raise BundleError(f"{node.lineno}번째 줄: '*' import는 번들링할 수 없습니다.")
+            if id(node) not in top_level:
+                raise BundleError(f"{node.lineno}번째 줄: {LIB_PACKAGE} import는 파일 최상위에 있어야 합니다.")
+            imports.append(node)
+    return imports
+
+
+def bundle_source(source: str, filename: str = '<solution>', lib_dir: Path = LIB_DIR) -> str:
+    """
+    풀이 코드의 boj_lib import를 필요한 정의로 바꾼 코드를 반환합니다.
+
+    boj_lib을 쓰지 않는 코드는 그대로 반환합니다.
+
+    Raises:
+        BundleError: 지원하지 않는 import 형식이거나 모듈/이름이 없는 경우
+        SyntaxError: 풀이 코드에 문법 오류가 있는 경우
+    """
+    tree = ast.parse(source, filename=filename)
+    imports = lib_imports(tree)
+    if not imports:
+        return source
+
+    wanted = [(node.module.split('.', 1)[1], alias.name) for node in imports for alias in node.names]
+    # 풀이에 이미 있는 import 문은 다시 넣지 않음
+    existing = {ast.get_source_segment(source, node) for node in tree.body
+                if isinstance(node, (ast.Import, ast.ImportFrom))}
+    block = _render(_collect(wanted, lib_dir), existing)
+
+    # 풀이에서 다른 이름으로 가져온 경우 (from boj_lib.dsu import DSU as UnionFind)
+    aliases = [f"{alias.asname} = {alias.name}" for node in imports for alias in node.names
+               if alias.asname and alias.asname != alias.name]
+
+    lines = source.splitlines()
+    first = imports[0].lineno
+    removed = {line for node in imports for line in range(node.lineno, node.end_lineno + 1)}
+    result = []
+    for number, line in enumerate(lines, 1):
+        if number == first:
+            result += [BUNDLE_BEGIN, block, *aliases, BUNDLE_END]
+            if lines[number:] and lines[number].strip():
+                result.append('')
+        if number not in removed:
+            result.append(line)
+
+    bundled = '\n'.join(result) + '\n'
+    compile(bundled, filename, 'exec')
+    return bundled
+
+
+def bundle_file(path: Union[str, Path], lib_dir: Path = LIB_DIR) -> str:
+    """파일을 읽어서 bundle_source()를 적용합니다."""
+    path = Path(path)
+    return bundle_source(path.read_text(encoding='utf-8'), filename=str(path), lib_dir=lib_dir)
+
+
+def _collect(wanted: List[Tuple[str, str]], lib_dir: Path) -> List[Tuple[_LibModule, List[int]]]:
+    """
+    가져온 이름들에서 시작해서 필요한 문장들을 모읍니다.
+
+    Returns:
+        (모듈, 넣을 문장 번호 리스트) 튜플 리스트 (다른 모듈이 참조하는 모듈이 먼저 오는 순서)
+    """
+    modules: Dict[str, _LibModule] = {}
+    needed: Dict[str, set] = {}
+    order: List[str] = []
+    visited = set()
+
+    def visit(module_name: str, name: str):
+        if (module_name, name) in visited:
+            return
+        visited.add((module_name, name))
+
+        if module_name not in modules:
+            modules[module_name] = _LibModule(module_name, lib_dir)
+            needed[module_name] = set()
+        module = modules[module_name]
+        if name not in module.definitions:
+            raise BundleError(f"{LIB_PACKAGE}.{module_name}에 '{name}'이(가) 없습니다.")
+
+        for index in module.definitions[name]:
+            if index in needed[module_name]:
+                continue
+            needed[module_name].add(index)
+            node = module.statements[index]
+            if isinstance(node, ast.ImportFrom) and _lib_module(node):
+                # 라이브러리 안의 다른 모듈에서 가져온 이름은 그 모듈의 정의로 대체
+                needed[module_name].discard(index)
+                for alias in node.names:
+                    if (alias.asname or alias.name) == name:
+                        visit(_lib_module(node), alias.name)
+                continue
+            for used in _used_names(node):
+                if used in module.definitions and used != name:
+                    visit(module_name, used)
+
+        # 참조되는 모듈이 먼저 나오도록 처음 방문이 끝난 순서대로
+        if module_name not in order:
+            order.append(module_name)
+
+    for module_name, name in wanted:
+        visit(module_name, name)
+
+    return [(modules[name], sorted(needed[name])) for name in order]
+
+
+def _render(parts: List[Tuple[_LibModule, List[int]]], existing: set) -> str:
+    """
+    모은 문장들을 표준 라이브러리 import(중복 제거)와 정의 순서로 이어 붙입니다.
+
+    existing에 있는 import 문(풀이에 이미 있는 것)은 넣지 않습니다.
+    """
+    imports = []
+    definitions = []
+    for module, indices in parts:
+        for index in indices:
+            text = module.source(index)
+            if isinstance(module.statements[index], (ast.Import, ast.ImportFrom)):
+                if text not in imports and text not in existing:
+                    imports.append(text)
+            else:
+                definitions.append(text)
+    return '\n\n\n'.join(filter(None, ['\n'.join(imports), *definitions]))
+
+
+def _lib_module(node: ast.ImportFrom) -> Optional[str]:
+    """라이브러리 안의 import면 대상 모듈 이름 (from .fenwick import / from boj_lib.fenwick import)"""
+    if node.level == 1 and node.module:
+        return node.module
+    if node.level == 0 and (node.module or '').startswith(LIB_PACKAGE + '.'):
+        return node.module.split('.', 1)[1]
+    return None
+
+
+def _is_docstring(node: ast.stmt) -> bool:
+    return (isinstance(node, ast.Expr) and isinstance(node.value, ast.Constant)
+            and isinstance(node.value.value, str))
+
+
+def _defined_names(node: ast.stmt) -> List[str]:
+    """최상위 문장이 정의하는 이름들"""
+    if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+        return [node.name]
+    if isinstance(node, (ast.Import, ast.ImportFrom)):
+        return [(alias.asname or alias.name).split('.')[0] for alias in node.names]
+    if isinstance(node, (ast.Assign, ast.AnnAssign, ast.AugAssign)):
+        targets = node.targets if isinstance(node, ast.Assign) else [node.target]
+        return [n.id for target in targets for n in ast.walk(target) if isinstance(n, ast.Name)]
+    return []
+
+
+def _used_names(node: ast.stmt) -> set:
+    """문장 안에서 읽는 이름들 (지역 변수도 포함되지만 모듈에 없는 이름은 무시됨)"""
+    return {n.id for n in ast.walk(node) if isinstance(n, ast.Name) and isinstance(n.ctx, ast.Load)}
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(
+        description='solution.py의 boj_lib import를 필요한 정의로 바꿔서 제출용 단일 파일을 만듭니다.',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+사용 예시:
+  python boj_bundle.py ../problems/16401_16401/solutions/library.py    # 합친 코드를 출력
+  python boj_bundle.py ../problems/16401_16401/solutions/library.py -o bundled.py
+        """
+    )
+    parser.add_argument('solution', type=str, help='solution.py 경로')
+    parser.add_argument('-o', '--output', type=str, help='결과 파일 경로 (기본값: 표준 출력)')
+
+    args = parser.parse_args(argv)
+
+    try:
+        bundled = bundle_file(args.solution)
+    except (OSError, BundleError, SyntaxError) as e:
+        print(f"[X] 번들링 실패: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    if args.output:
+        Path(args.output).write_text(bundled, encoding='utf-8')
+        print(f"[O] {args.output} ({len(bundled.encode('utf-8'))} bytes)")
+    else:
+        sys.stdout.write(bundled)
+
+
+if __name__ == "__main__":
+    main()
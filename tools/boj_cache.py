@@ -0,0 +1,153 @@
+"""
+HTTP 응답 디스크 캐시 모듈
+URL별로 응답 본문을 저장해 두고, TTL이 지나면 ETag/Last-Modified로 조건부 재검증합니다.
+오프라인 모드에서는 네트워크 없이 캐시에 있는 응답만 사용합니다.
+"""
+import os
+import json
+import time
+import hashlib
+import tempfile
+from pathlib import Path
+from typing import Iterator, Optional, Tuple
+
+import requests
+
+from boj_paths import CACHE_DIR
+
+# 문제 지문은 거의 바뀌지 않으므로 기본 TTL은 길게 둠
+DEFAULT_TTL = 7 * 24 * 60 * 60
+
+
+class CacheMiss(requests.RequestException):
+    """오프라인 모드에서 캐시에 없는 URL을 요청한 경우"""
+
+
+class HTTPCache:
+    """URL을 키로 응답 본문을 디스크에 저장하는 캐시"""
+
+    def __init__(self, cache_dir: Optional[Path] = None, ttl: float = DEFAULT_TTL,
+                 offline: bool = False):
+        """
+        Args:
+            cache_dir: 캐시 디렉토리 (기본값: 저장소 루트의 .boj_cache/http)
+            ttl: 재검증 없이 캐시를 그대로 쓰는 시간 (초)
+            offline: True면 네트워크 요청 없이 캐시만 사용
+        """
+        self.cache_dir = Path(cache_dir) if cache_dir else CACHE_DIR / "http"
+        self.ttl = ttl
+        self.offline = offline
+
+    def get(self, session: requests.Session, url: str, params: Optional[dict] = None,
+            timeout: float = 10) -> str:
+        """
+        GET 요청의 응답 본문을 캐시를 거쳐 가져옵니다.
+
+        Args:
+            session: 요청에 사용할 세션
+            url: 요청 URL
+            params: 쿼리 파라미터
+            timeout: 요청 제한 시간 (초)
+
+        Returns:
+            응답 본문 문자열
+
+        Raises:
+            CacheMiss: 오프라인 모드에서 캐시에 없는 경우
+            requests.RequestException: 요청 실패 (캐시도 없는 경우)
+
+        재검증 요청이 실패하면 (네트워크 오류, 5xx 응답 등) 경고를 출력하고 오래된 캐시를 사용합니다.
+        """
+        full_url = requests.Request('GET', url, params=params).prepare().url
+        meta_path, body_path = self._paths(full_url)
+        meta = self._load_meta(meta_path, body_path)
+
+        if meta is None:
+            if self.offline:
+                raise CacheMiss(f"오프라인 모드: 캐시에 없는 URL입니다 ({full_url})")
+            response = session.get(full_url, timeout=timeout)
+            response.raise_for_status()
+            return self._store(full_url, response)
+
+        if self.offline or time.time() - meta['fetched_at'] < self.ttl:
+            return self._read_body(body_path, meta)
+
+        # TTL이 지난 항목은 조건부 요청으로 재검증
+        headers = {}
+        if meta.get('etag'):
+            headers['If-None-Match'] = meta['etag']
+        if meta.get('last_modified'):
+            headers['If-Modified-Since'] = meta['last_modified']
+
+        try:
+            response = session.get(full_url, headers=headers, timeout=timeout)
+            if response.status_code != 304:
+                response.raise_for_status()
+        except requests.RequestException as e:
+            # 네트워크가 불안정하거나 서버 오류가 나면 오래된 캐시라도 사용
+            print(f"[!] 재검증 실패, 오래된 캐시를 사용합니다: {full_url} ({e})")
+            return self._read_body(body_path, meta)
+
+        if response.status_code == 304:
+            meta['fetched_at'] = time.time()
+            self._write_atomic(meta_path, json.dumps(meta).encode())
+            return self._read_body(body_path, meta)
+
+        return self._store(full_url, response)
+
+    def entries(self) -> Iterator[Tuple[str, str]]:
+        """캐시에 저장된 모든 응답을 (URL, 본문) 튜플로 순회합니다."""
+        if not self.cache_dir.exists():
+            return
+
+        for meta_path in sorted(self.cache_dir.glob('*/*.json')):
+            body_path = meta_path.with_suffix('.body')
+            meta = self._load_meta(meta_path, body_path)
+            if meta is not None:
+                yield meta['url'], self._read_body(body_path, meta)
+
+    def _paths(self, url: str) -> tuple:
+        """URL에 대응하는 (메타데이터 경로, 본문 경로) 튜플"""
+        key = hashlib.sha256(url.encode()).hexdigest()
+        base = self.cache_dir / key[:2] / key
+        return base.with_suffix('.json'), base.with_suffix('.body')
+
+    def _load_meta(self, meta_path: Path, body_path: Path) -> Optional[dict]:
+        """캐시 메타데이터를 읽습니다. 본문이 없거나 손상된 경우 None"""
+        if not meta_path.exists() or not body_path.exists():
+            return None
+        try:
+            with open(meta_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _read_body(self, body_path: Path, meta: dict) -> str:
+        return body_path.read_bytes().decode(meta.get('encoding') or 'utf-8', errors='replace')
+
+    def _store(self, url: str, response: requests.Response) -> str:
+        """응답을 캐시에 저장하고 본문 문자열을 반환합니다."""
+        meta_path, body_path = self._paths(url)
+        meta = {
+            'url': url,
+            'fetched_at': time.time(),
+            'etag': response.headers.get('ETag'),
+            'last_modified': response.headers.get('Last-Modified'),
+            'encoding': response.encoding or 'utf-8',
+        }
+
+        self._write_atomic(body_path, response.content)
+        self._write_atomic(meta_path, json.dumps(meta).encode())
+        return response.text
+
+    def _write_atomic(self, path: Path, data: bytes):
+        """여러 스레드가 같은 항목을 쓰더라도 깨진 파일이 남지 않도록 임시 파일로 쓴 뒤 교체"""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix='.tmp_')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
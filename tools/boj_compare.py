@@ -0,0 +1,278 @@
+"""
+출력 비교 모듈
+실제 출력과 예상 출력을 파일 전체를 메모리에 올리지 않고 조각 단위로 읽으며 비교합니다.
+
+백준 채점 기준과 같이 다음 차이는 무시합니다.
+    - 각 줄 끝의 공백, 탭, '\\r' (CRLF 줄바꿈 포함)
+    - 출력 끝의 빈 줄
+줄 앞의 공백이나 줄 중간의 공백 개수 차이는 무시하지 않습니다.
+
+다른 부분이 나오면 바로 멈추고 줄 번호, 칸 번호, 그 주변 내용을 반환합니다.
+"""
+import unicodedata
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, Optional, Union
+
+# 한 번에 읽는 크기
+CHUNK_SIZE = 64 * 1024
+
+# 다른 부분 앞뒤로 보여줄 최대 바이트 수
+CONTEXT = 40
+
+# 줄 끝에서 무시하는 문자
+TRAILING_WHITESPACE = b' \t\r'
+
+# 비교 규칙이 바뀌면 올려서 지난 검증 결과(verify --all 캐시)를 다시 확인하게 함
+COMPARE_RULES = 1
+
+# UTF-8 연속 바이트 (글자 수를 셀 때 제외)
+_CONTINUATION = bytes(range(0x80, 0xC0))
+_CONTINUATION_SET = {bytes([b]) for b in _CONTINUATION}
+
+
+def output_limit(expected_size: int) -> int:
+    """
+    예상 출력 크기에 대한 출력 초과 기준 (바이트)
+
+    예상 출력의 2배에 1MB를 더한 만큼까지는 허용하고, 그보다 많이 출력하면 실행을 중단합니다.
+    (디버그 출력이나 무한 루프 출력으로 디스크를 채우는 것을 막기 위한 기준)
+    """
+    return expected_size * 2 + 1024 * 1024
+
+
+def read_chunks(path: Union[str, Path], chunk_size: int = CHUNK_SIZE) -> Iterator[bytes]:
+    """파일을 chunk_size 바이트씩 읽습니다."""
+    with open(path, 'rb') as f:
+        while True:
+            chunk = f.read(chunk_size)
+            if not chunk:
+                return
+            yield chunk
+
+
+def normalize(chunks: Iterable[bytes]) -> Iterator[bytes]:
+    """
+    줄 끝 공백과 출력 끝 빈 줄을 지운 내용을 조각 단위로 돌려줍니다.
+
+    조각 끝의 공백/줄바꿈은 줄 끝 공백인지 다음 조각을 봐야 알 수 있으므로 들고 있다가,
+    뒤에 내용이 이어지면 다음 조각과 함께 정리해서 내보냅니다. (아무리 긴 줄이어도 들고 있는 것은 공백뿐)
+    """
+    pending = b''
+    for chunk in chunks:
+        data = pending + chunk
+        body = data.rstrip(TRAILING_WHITESPACE + b'\n')
+        pending = data[len(body):]
+        if not body:
+            continue
+        # 대부분의 출력에는 줄 끝 공백이 없으므로 있는지 먼저 확인 (줄 단위로 나누는 것보다 훨씬 빠름)
+        if b' \n' in body or b'\t\n' in body or b'\r\n' in body:
+            body = b'\n'.join([line.rstrip(TRAILING_WHITESPACE) for line in body.split(b'\n')])
+        yield body
+
+
+class _Cursor:
+    """정규화된 조각들을 필요한 만큼씩 읽는 커서"""
+
+    def __init__(self, chunks: Iterable[bytes]):
+        self._chunks = iter(chunks)
+        self.buffer = b''
+
+    def fill(self, size: int = 1) -> bool:
+        """버퍼에 size 바이트 이상 있도록 읽습니다. 출력이 끝났으면 남은 만큼만 채우고 False"""
+        while len(self.buffer) < size:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                return False
+            self.buffer += chunk
+        return True
+
+    def consume(self, size: int):
+        self.buffer = self.buffer[size:]
+
+    def rest_of_line(self) -> bytes:
+        """현재 위치부터 줄 끝까지 (최대 CONTEXT 바이트)"""
+        self.fill(CONTEXT)
+        return self.buffer[:CONTEXT].split(b'\n', 1)[0]
+
+
+def compare_chunks(actual: Iterable[bytes], expected: Iterable[bytes]) -> Optional[Dict]:
+    """
+    실제 출력과 예상 출력을 비교합니다.
+
+    Args:
+        actual: 실제 출력 조각들
+        expected: 예상 출력 조각들
+
+    Returns:
+        같으면 None, 다르면 처음 다른 위치의 정보
+        {'line': 줄 번호, 'column': 칸 번호 (글자 단위, 1부터), 'prefix': 그 줄의 앞부분,
+         'expected': 예상 출력의 나머지 부분, 'actual': 실제 출력의 나머지 부분,
+         'expected_token': 예상 단어, 'actual_token': 실제 단어}
+        출력이 끝났거나 줄이 끝난 쪽의 나머지 부분은 빈 문자열, 단어는 None('출력 끝') 또는 ''('줄 끝')
+    """
+    actual_cursor = _Cursor(normalize(actual))
+    expected_cursor = _Cursor(normalize(expected))
+
+    line = 1
+    column = 0
+    # 현재 줄에서 지금 위치 바로 앞까지 (최대 CONTEXT 바이트)
+    prefix = b''
+
+    while True:
+        actual_more = actual_cursor.fill()
+        expected_more = expected_cursor.fill()
+        if not actual_more and not expected_more:
+            return None
+
+        a = actual_cursor.buffer
+        e = expected_cursor.buffer
+        size = min(len(a), len(e))
+        same = size if a[:size] == e[:size] else _common_prefix(a, e, size)
+
+        if same < size or not (actual_more and expected_more):
+            # 여러 바이트 글자의 중간에서 달라지면 그 글자의 처음을 가리키도록 되돌림
+            while same and (a[same:same + 1] in _CONTINUATION_SET or
+                            e[same:same + 1] in _CONTINUATION_SET):
+                same -= 1
+        matched = a[:same]
+
+        newline = matched.rfind(b'\n')
+        if newline >= 0:
+            line += matched.count(b'\n')
+            prefix = matched[newline + 1:][-CONTEXT:]
+            column = _char_count(matched[newline + 1:])
+        else:
+            prefix = (prefix + matched)[-CONTEXT:]
+            column += _char_count(matched)
+
+        actual_cursor.consume(len(matched))
+        expected_cursor.consume(len(matched))
+
+        if same == size and actual_more and expected_more:
+            continue
+
+        return _mismatch(line, column, prefix, actual_cursor, expected_cursor)
+
+
+def compare_output(actual_path: Union[str, Path], expected: Union[str, Path, bytes]) -> Optional[Dict]:
+    """
+    실제 출력 파일을 예상 출력과 비교합니다. 반환값은 compare_chunks()와 같습니다.
+
+    expected는 예상 출력 파일 경로 또는 이미 메모리에 읽어 둔 예상 출력 내용(bytes)입니다.
+    """
+    expected_chunks = [expected] if isinstance(expected, bytes) else read_chunks(expected)
+    return compare_chunks(read_chunks(actual_path), expected_chunks)
+
+
+def compare_text(actual: str, expected: str) -> Optional[Dict]:
+    """두 문자열을 비교합니다. 반환값은 compare_chunks()와 같습니다."""
+    return compare_chunks([actual.encode('utf-8')], [expected.encode('utf-8')])
+
+
+def format_mismatch(mismatch: Dict) -> str:
+    """
+    비교 결과를 출력할 문자열로 만듭니다.
+
+        3번째 줄 5번째 글자부터 다릅니다. (예상 '4', 실제 '5')
+          예상: 1 2 3 4
+          실제: 1 2 3 5
+                      ^
+    """
+    prefix = mismatch['prefix']
+    if mismatch['column'] - 1 > len(prefix):
+        prefix = '...' + prefix
+
+    lines = [
+        f"{mismatch['line']}번째 줄 {mismatch['column']}번째 글자부터 다릅니다. "
+        f"(예상 {_describe_token(mismatch['expected_token'])}, "
+        f"실제 {_describe_token(mismatch['actual_token'])})",
+        f"  예상: {prefix}{mismatch['expected']}",
+        f"  실제: {prefix}{mismatch['actual']}",
+        "        " + " " * _display_width(prefix) + "^",
+    ]
+    return '\n'.join(lines)
+
+
+def preview(source: Union[str, Path, bytes], max_lines: int = 10, max_bytes: int = 1024) -> str:
+    """
+    파일(또는 메모리에 읽어 둔 파일 내용) 앞부분을 보여줍니다. (실패한 케이스의 입력을 출력할 때 사용)
+
+    max_lines줄 또는 max_bytes바이트까지만 읽고, 더 있으면 생략 표시를 붙입니다.
+    """
+    if isinstance(source, bytes):
+        head = source[:max_bytes + 1]
+    else:
+        with open(source, 'rb') as f:
+            head = f.read(max_bytes + 1)
+
+    truncated = len(head) > max_bytes
+    lines = head[:max_bytes].decode('utf-8', errors='ignore').splitlines()
+    if len(lines) > max_lines:
+        lines = lines[:max_lines]
+        truncated = True
+
+    text = '\n'.join(lines)
+    return f"{text}\n... (생략)" if truncated else text
+
+
+def _common_prefix(a: bytes, b: bytes, size: int) -> int:
+    """a[:size]와 b[:size]가 처음 달라지는 위치 (슬라이스 비교로 이분 탐색)"""
+    lo, hi = 0, size
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if a[lo:mid] == b[lo:mid]:
+            lo = mid
+        else:
+            hi = mid - 1
+    return lo
+
+
+def _char_count(data: bytes) -> int:
+    """UTF-8 바이트열의 글자 수"""
+    return len(data.translate(None, _CONTINUATION))
+
+
+def _mismatch(line: int, column: int, prefix: bytes, actual: _Cursor, expected: _Cursor) -> Dict:
+    actual_rest = actual.rest_of_line()
+    expected_rest = expected.rest_of_line()
+
+    # 다른 부분이 단어 중간이면 단어 전체를 보여줌
+    word_start = b''
+    if prefix and not prefix[-1:].isspace():
+        word_start = prefix.split()[-1]
+
+    def token(cursor: _Cursor, rest: bytes) -> Optional[str]:
+        if not cursor.buffer:
+            return None
+        word = rest.split(None, 1)[0] if rest[:1] and not rest[:1].isspace() else b''
+        if word:
+            return _decode(word_start + word)
+        # 단어가 아니면 다른 글자 하나 (줄이 끝났으면 빈 문자열)
+        return _decode(rest[:1])
+
+    return {
+        'line': line,
+        'column': column + 1,
+        'prefix': _decode(prefix),
+        'expected': _decode(expected_rest),
+        'actual': _decode(actual_rest),
+        'expected_token': token(expected, expected_rest),
+        'actual_token': token(actual, actual_rest),
+    }
+
+
+def _describe_token(token: Optional[str]) -> str:
+    if token is None:
+        return "출력 끝"
+    if token == '':
+        return "줄 끝"
+    return repr(token)
+
+
+def _decode(data: bytes) -> str:
+    # 앞뒤를 잘라낸 부분이라 글자 중간에서 잘렸을 수 있음
+    return data.decode('utf-8', errors='ignore')
+
+
+def _display_width(text: str) -> int:
+    return sum(2 if unicodedata.east_asian_width(ch) in 'WF' else 1 for ch in text)
@@ -0,0 +1,282 @@
+"""
+백준 문제 시간 복잡도 추정 스크립트
+입력 생성기로 크기를 기하급수적으로 늘려 가며 solution.py를 실행하고,
+측정 시간을 O(n), O(n log n), O(n^2) 등의 곡선에 맞춰 최대 입력에서의 실행 시간을 예측합니다.
+
+입력 생성기는 boj_stress.py와 같은 규약(python gen.py <seed> [n])을 따릅니다.
+"""
+import os
+import re
+import sys
+import math
+import argparse
+import tempfile
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from boj_limits import judge_limits
+from boj_registry import ProblemRegistry, resolve_problem_dir
+from boj_runner import RUNNER_MODES, create_runner
+
+
+# (이름, 성장 함수) - 측정 시간은 t = a * f(n) + b 로 맞춤
+MODELS = [
+    ('O(log n)', lambda n: math.log2(n)),
+    ('O(n)', lambda n: n),
+    ('O(n log n)', lambda n: n * math.log2(n)),
+    ('O(n^2)', lambda n: n ** 2),
+    ('O(n^3)', lambda n: n ** 3),
+]
+
+
+def parse_max_n(readme: str, var: str = 'N') -> Optional[int]:
+    """
+    README.md의 입력 설명에서 변수의 최댓값을 찾습니다.
+
+    예: 'N (1 ≤ N ≤ 1,000,000)', '1 ≤ N ≤ 100', 'N은 100보다 작거나 같은'
+
+    Args:
+        readme: README.md 내용
+        var: 변수 이름
+
+    Returns:
+        최댓값 또는 None
+    """
+    v = re.escape(var)
+    patterns = [
+        rf'(?<![A-Za-z]){v}\s*[≤<]=?\s*([\d,]+)',
+        rf'(?<![A-Za-z]){v}\s*[은는이가]\s*([\d,]+)\s*보다\s*작거나\s*같',
+        rf'(?<![A-Za-z]){v}\s*[은는이가]\s*최대\s*([\d,]+)',
+    ]
+
+    for pattern in patterns:
+        match = re.search(pattern, readme)
+        if match:
+            return int(match.group(1).replace(',', ''))
+
+    return None
+
+
+def fit_model(sizes: List[int], times: List[float], func) -> Tuple[float, float, float]:
+    """
+    t = a * f(n) + b 를 상대 오차 기준 가중 최소제곱으로 맞춥니다.
+
+    실행 시간이 크기마다 몇 자릿수씩 차이 나므로, 큰 입력의 오차가 작은 입력을
+    압도하지 않도록 각 점의 가중치를 1 / t^2 로 둡니다.
+
+    Returns:
+        (a, b, 상대 오차 제곱합) 튜플
+    """
+    xs = [func(n) for n in sizes]
+    ws = [1 / (t * t) for t in times]
+
+    sw = sum(ws)
+    sx = sum(w * x for w, x in zip(ws, xs))
+    sy = sum(w * y for w, y in zip(ws, times))
+    sxx = sum(w * x * x for w, x in zip(ws, xs))
+    sxy = sum(w * x * y for w, x, y in zip(ws, xs, times))
+
+    det = sw * sxx - sx * sx
+    if det == 0:
+        return 0.0, sy / sw, float('inf')
+
+    a = (sw * sxy - sx * sy) / det
+    b = (sy - a * sx) / sw
+
+    # 시간이 줄어드는 곡선은 의미가 없으므로 상수 시간으로 취급
+    if a < 0:
+        a, b = 0.0, sy / sw
+
+    error = sum(w * (y - (a * x + b)) ** 2 for w, x, y in zip(ws, xs, times))
+    return a, b, error
+
+
+class BOJComplexity:
+    """입력 크기별 실행 시간을 측정하고 복잡도를 추정하는 클래스"""
+
+    def __init__(self, problem_dir: Path, solution: str = "solution.py", generator: str = "gen.py",
+                 runner_mode: str = 'auto', repeat: int = 3, budget: float = 5.0):
+        self.problem_dir = Path(problem_dir)
+        self.solution_path = self.problem_dir / solution
+        self.generator_path = self.problem_dir / generator
+        self.runner_mode = runner_mode
+        self.repeat = max(1, repeat)
+        self.budget = budget
+
+    def measure(self, sizes: List[int]) -> List[Tuple[int, float]]:
+        """
+        크기별로 입력을 생성해 solution.py의 실행 시간을 측정합니다.
+
+        반복 실행 중 가장 짧은 시간을 사용하고, 한 번의 실행이 budget초를 넘으면
+        더 큰 크기는 측정하지 않습니다. (budget의 2배가 지나도 끝나지 않으면 중단하고 그 크기는 제외)
+
+        Returns:
+            (크기, 초) 튜플 리스트
+        """
+        samples = []
+        with create_runner(self.generator_path, mode=self.runner_mode, cwd=self.problem_dir) as generator, \
+                create_runner(self.solution_path, mode=self.runner_mode, cwd=self.problem_dir) as solution, \
+                tempfile.TemporaryDirectory(prefix='boj_complexity_') as tmp_dir:
+            for n in sizes:
+                generated = generator.run(os.devnull, timeout=60, args=(0, n))
+                if generated.returncode != 0:
+                    print(f"[X] n={n}: 생성기 오류\n{generated.stderr}")
+                    break
+
+                input_path = Path(tmp_dir) / f"{n}.txt"
+                input_path.write_text(generated.stdout, encoding='utf-8')
+
+                best = None
+                for _ in range(self.repeat):
+                    result = solution.run(input_path, timeout=self.budget * 2)
+                    if result.timed_out:
+                        print(f"[!] n={n}: {self.budget * 2:g}초 안에 끝나지 않아서 (시간 예산 {self.budget:g}초의 2배) "
+                              f"더 큰 입력은 측정하지 않습니다.")
+                        return samples
+                    if result.returncode != 0:
+                        print(f"[X] n={n}: 실행 실패 (종료 코드 {result.returncode})")
+                        return samples
+                    best = result.wall_time if best is None else min(best, result.wall_time)
+
+                samples.append((n, best))
+                print(f"  n = {n:>10,}  {best * 1000:>10.1f} ms")
+
+                if best > self.budget:
+                    print(f"[!] {self.budget:g}초를 넘어서 더 큰 입력은 측정하지 않습니다.")
+                    break
+
+        return samples
+
+    def estimate(self, samples: List[Tuple[int, float]]) -> List[Dict]:
+        """
+        측정값을 각 복잡도 모델에 맞추고 오차가 작은 순서로 반환합니다.
+
+        Returns:
+            {'name', 'func', 'a', 'b', 'error'} 딕셔너리 리스트
+        """
+        sizes = [n for n, _ in samples]
+        times = [max(t, 1e-6) for _, t in samples]
+
+        fits = []
+        for name, func in MODELS:
+            a, b, error = fit_model(sizes, times, func)
+            fits.append({'name': name, 'func': func, 'a': a, 'b': b, 'error': error})
+
+        return sorted(fits, key=lambda fit: fit['error'])
+
+
+def geometric_sizes(min_n: int, max_n: int, factor: float) -> List[int]:
+    """min_n부터 factor배씩 늘린 크기 목록 (마지막은 max_n)"""
+    sizes = []
+    n = float(min_n)
+    while n < max_n:
+        if not sizes or int(n) != sizes[-1]:
+            sizes.append(int(n))
+        n *= factor
+    sizes.append(max_n)
+    return sizes
+
+
+def loglog_slope(samples: List[Tuple[int, float]]) -> Optional[float]:
+    """마지막 두 측정점의 log-log 기울기 (경험적 차수)"""
+    if len(samples) < 2:
+        return None
+    (n1, t1), (n2, t2) = samples[-2], samples[-1]
+    if t1 <= 0 or t2 <= 0 or n1 == n2:
+        return None
+    return math.log(t2 / t1) / math.log(n2 / n1)
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(
+        description='입력 크기를 늘려 가며 실행 시간을 측정하고 시간 복잡도를 추정합니다.',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+사용 예시:
+  python boj_complexity.py 1411                  # README의 N 최댓값까지 측정
+  python boj_complexity.py 1411 --max-size 3200  # 최댓값보다 크게 측정해서 곡선을 뚜렷하게
+  python boj_complexity.py 16401 --max-size 200000
+  python boj_complexity.py 16401 --var N --max-n 1000000
+
+입력 생성기(gen.py)는 `python gen.py <seed> <n>` 형식으로 실행되며,
+크기 n인 입력을 표준 출력으로 출력해야 합니다.
+        """
+    )
+    parser.add_argument('problem_id', type=str, help='백준 문제 번호 또는 문제 디렉토리 경로')
+    parser.add_argument('--dir', type=str, default='problems', help='문제가 저장된 기본 디렉토리')
+    parser.add_argument('--solution', type=str, default='solution.py', help='측정할 풀이 파일 (기본값: solution.py)')
+    parser.add_argument('--gen', type=str, default='gen.py', help='입력 생성기 파일 (기본값: gen.py)')
+    parser.add_argument('--var', type=str, default='N', help='README에서 최댓값을 찾을 변수 이름 (기본값: N)')
+    parser.add_argument('--max-n', type=int, help='최대 입력 크기 (기본값: README에서 파싱)')
+    parser.add_argument('--min-size', type=int, default=8, help='측정 시작 크기 (기본값: 8)')
+    parser.add_argument('--max-size', type=int, help='측정할 최대 크기 (기본값: 최대 입력 크기, 곡선이 잘 안 보이면 더 크게 지정)')
+    parser.add_argument('--factor', type=float, default=2.0, help='크기 증가 배수 (기본값: 2)')
+    parser.add_argument('--repeat', type=int, default=3, help='크기별 반복 횟수 (기본값: 3)')
+    parser.add_argument('--budget', type=float, default=5.0,
+                        help='한 번의 실행이 이 시간(초)을 넘으면 측정을 멈춤 (기본값: 5)')
+    parser.add_argument('--runner', type=str, choices=RUNNER_MODES, default='auto',
+                        help='실행 방식 (기본값: auto)')
+
+    args = parser.parse_args(argv)
+
+    problem_dir = resolve_problem_dir(args.problem_id, args.dir)
+    if not problem_dir:
+        print(f"[X] 문제 디렉토리를 찾을 수 없습니다: {args.problem_id}")
+        sys.exit(1)
+
+    complexity = BOJComplexity(problem_dir, solution=args.solution, generator=args.gen,
+                               runner_mode=args.runner, repeat=args.repeat, budget=args.budget)
+    for path in (complexity.solution_path, complexity.generator_path):
+        if not path.exists():
+            print(f"[X] 파일을 찾을 수 없습니다: {path}")
+            sys.exit(1)
+
+    max_n = args.max_n
+    readme_path = problem_dir / "README.md"
+    if max_n is None and readme_path.exists():
+        max_n = parse_max_n(readme_path.read_text(encoding='utf-8'), args.var)
+    if max_n is None:
+        print(f"[X] README.md에서 {args.var}의 최댓값을 찾을 수 없습니다. --max-n 옵션을 사용하세요.")
+        sys.exit(1)
+
+    max_size = args.max_size or max_n
+    sizes = geometric_sizes(min(args.min_size, max_size), max_size, args.factor)
+
+    print(f"[*] 문제 디렉토리: {problem_dir}")
+    print(f"[*] 최대 입력: {args.var} = {max_n:,}")
+    print(f"[*] {len(sizes)}개의 크기로 실행 시간을 측정합니다...\n")
+
+    samples = complexity.measure(sizes)
+    if len(samples) < 3:
+        print("[X] 복잡도를 추정하려면 최소 3개의 측정값이 필요합니다.")
+        sys.exit(1)
+
+    fits = complexity.estimate(samples)
+    best = fits[0]
+
+    print("\n" + "=" * 50)
+    print(f"{'모델':<14}{'상대 오차':>12}")
+    print("-" * 30)
+    for fit in fits:
+        mark = "  <- 추정" if fit is best else ""
+        print(f"{fit['name']:<16}{fit['error']:>12.4f}{mark}")
+
+    slope = loglog_slope(samples)
+    if slope is not None:
+        print(f"\n[*] 경험적 차수 (마지막 두 점의 log-log 기울기): n^{slope:.2f}")
+
+    predicted = best['a'] * best['func'](max_n) + best['b']
+    print(f"[*] 추정 복잡도: {best['name']}")
+    print(f"[*] {args.var} = {max_n:,}에서 예상 실행 시간: {predicted:.3f}초")
+
+    limits = ProblemRegistry(args.dir).describe(problem_dir)['limits']
+    if limits:
+        limit = judge_limits(limits)['time']
+        if predicted > limit:
+            print(f"[X] 최대 입력에서 시간 초과가 예상됩니다. (제한 {limit:g}초, Python 3 기준)")
+        else:
+            print(f"[O] 최대 입력에서도 제한 안에 들어올 것으로 예상됩니다. (제한 {limit:g}초, Python 3 기준)")
+
+
+if __name__ == "__main__":
+    main()
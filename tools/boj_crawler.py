@@ -1,10 +1,106 @@
 """
 백준 온라인 저지 문제 크롤링 모듈
 """
+import re
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from bs4 import BeautifulSoup, SoupStrainer
 from typing import Dict, List, Optional
 
+from boj_cache import HTTPCache
+from boj_meta import ProblemIndex, tier_name
+
+
+# BeautifulSoup 파서 백엔드 (lxml은 설치되어 있을 때만 사용 가능)
+PARSER_BACKENDS = ('html.parser', 'lxml')
+
+# 문제 페이지에서 실제로 읽는 요소들의 id
+PROBLEM_SECTION_IDS = frozenset({
+    'problem_title', 'problem_description', 'problem_input', 'problem_output', 'problem-info',
+})
+SAMPLE_ID_PREFIXES = ('sample-input-', 'sample-output-')
+
+
+def _is_problem_section(element_id: Optional[str]) -> bool:
+    if not element_id:
+        return False
+    return element_id in PROBLEM_SECTION_IDS or element_id.startswith(SAMPLE_ID_PREFIXES)
+
+
+# 필요한 요소(와 그 하위 요소)만 트리로 만들고, 헤더/메뉴/푸터 등 나머지는 버림
+PROBLEM_STRAINER = SoupStrainer(id=_is_problem_section)
+
+
+def parse_problem_page(html: str, parser: str = 'html.parser',
+                       targeted: bool = True) -> Optional[Dict]:
+    """
+    백준 문제 페이지 HTML에서 제목, 지문, 제한, 예제를 추출합니다.
+
+    Args:
+        html: 문제 페이지 HTML
+        parser: BeautifulSoup 파서 백엔드 ('html.parser' 또는 'lxml')
+        targeted: True면 필요한 요소만 파싱 (False면 전체 문서 트리를 만듦)
+
+    Returns:
+        title, description, input, output, time_limit, memory_limit, examples 키를 가진
+        딕셔너리 또는 None (제목이 없는 경우)
+    """
+    soup = BeautifulSoup(html, parser, parse_only=PROBLEM_STRAINER if targeted else None)
+
+    # 문제 제목
+    title_elem = soup.select_one('#problem_title')
+    if not title_elem:
+        return None
+
+    # 문제 설명
+    description = soup.select_one('#problem_description')
+    description_text = description.get_text(' ', strip=True) if description else ""
+
+    # 입력 설명
+    input_desc = soup.select_one('#problem_input')
+    input_text = input_desc.get_text(' ', strip=True) if input_desc else ""
+
+    # 출력 설명
+    output_desc = soup.select_one('#problem_output')
+    output_text = output_desc.get_text(' ', strip=True) if output_desc else ""
+
+    # 시간 제한, 메모리 제한
+    limit_info = soup.select_one('#problem-info')
+    time_limit = ""
+    memory_limit = ""
+    if limit_info:
+        info_items = limit_info.select('td')
+        if len(info_items) >= 2:
+            time_limit = info_items[0].text.strip()
+            memory_limit = info_items[1].text.strip()
+
+    return {
+        'title': title_elem.text.strip(),
+        'description': description_text,
+        'input': input_text,
+        'output': output_text,
+        'time_limit': time_limit,
+        'memory_limit': memory_limit,
+        'examples': _parse_examples(soup),
+    }
+
+
+def _parse_examples(soup: BeautifulSoup) -> List[Dict[str, str]]:
+    """예제 입력/출력을 파싱합니다."""
+    examples = []
+
+    # 예제 입력
+    sample_inputs = soup.select('pre[id^="sample-input-"]')
+    sample_outputs = soup.select('pre[id^="sample-output-"]')
+
+    for i, (input_elem, output_elem) in enumerate(zip(sample_inputs, sample_outputs)):
+        examples.append({
+            'input': input_elem.text.strip(),
+            'output': output_elem.text.strip()
+        })
+
+    return examples
+
 
 class BOJCrawler:
     """백준 문제 크롤러"""
@@ -12,12 +108,31 @@ class BOJCrawler:
     BASE_URL = "https://www.acmicpc.net"
     PROBLEM_URL = f"{BASE_URL}/problem/"
 
-    def __init__(self):
+    def __init__(self, pool_size: int = 10, cache: Optional[HTTPCache] = None,
+                 index: Optional[ProblemIndex] = None, parser: str = 'html.parser'):
+        """
+        Args:
+            pool_size: 호스트별로 유지할 커넥션 수 (여러 스레드에서 동시에 크롤링할 때의 최대 동시 요청 수)
+            cache: 문제 페이지 응답 캐시 (None이면 캐시 없이 매번 요청)
+            index: solved.ac 문제 메타데이터 인덱스 (None이면 기본 경로의 인덱스 사용)
+            parser: 문제 페이지 파서 백엔드 ('html.parser' 또는 'lxml')
+        """
+        if parser not in PARSER_BACKENDS:
+            raise ValueError(f"지원하지 않는 파서입니다: {parser} (가능한 값: {', '.join(PARSER_BACKENDS)})")
+
+        self.cache = cache
+        self.parser = parser
+        self.index = index or ProblemIndex()
         self.session = requests.Session()
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
         })
 
+        # 백준과 solved.ac 요청이 같은 커넥션 풀을 재사용하도록 설정
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=max(1, pool_size))
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
     def get_problem(self, problem_id: int) -> Optional[Dict]:
         """
         문제 정보를 크롤링합니다.
@@ -30,57 +145,29 @@ class BOJCrawler:
         """
         try:
             url = f"{self.PROBLEM_URL}{problem_id}"
-            response = self.session.get(url)
-            response.raise_for_status()
+            html = self._fetch(url, timeout=10)
 
-            soup = BeautifulSoup(response.text, 'html.parser')
-
-            # 문제 제목
-            title_elem = soup.select_one('#problem_title')
-            if not title_elem:
+            page = parse_problem_page(html, parser=self.parser)
+            if page is None:
                 print(f"문제 {problem_id}를 찾을 수 없습니다.")
                 return None
 
-            title = title_elem.text.strip()
-
-            # 영문 제목 추출 (solved.ac API 사용)
+            # 영문 제목 추출 (solved.ac 메타데이터 인덱스 사용)
             title_en = self._get_title_en(problem_id)
-
-            # 문제 설명
-            description = soup.select_one('#problem_description')
-            description_text = description.get_text(' ', strip=True) if description else ""
-
-            # 입력 설명
-            input_desc = soup.select_one('#problem_input')
-            input_text = input_desc.get_text(' ', strip=True) if input_desc else ""
-
-            # 출력 설명
-            output_desc = soup.select_one('#problem_output')
-            output_text = output_desc.get_text(' ', strip=True) if output_desc else ""
-
-            # 시간 제한, 메모리 제한
-            limit_info = soup.select_one('#problem-info')
-            time_limit = ""
-            memory_limit = ""
-            if limit_info:
-                info_items = limit_info.select('td')
-                if len(info_items) >= 2:
-                    time_limit = info_items[0].text.strip()
-                    memory_limit = info_items[1].text.strip()
-
-            # 예제 입력/출력
-            examples = self._parse_examples(soup)
+            meta = self.get_meta(problem_id)
 
             return {
                 'id': problem_id,
-                'title': title,
+                'title': page['title'],
                 'title_en': title_en,
-                'description': description_text,
-                'input': input_text,
-                'output': output_text,
-                'time_limit': time_limit,
-                'memory_limit': memory_limit,
-                'examples': examples,
+                'tier': tier_name(meta['level']) if meta else "TBD",
+                'tags': meta['tags'] if meta else [],
+                'description': page['description'],
+                'input': page['input'],
+                'output': page['output'],
+                'time_limit': page['time_limit'],
+                'memory_limit': page['memory_limit'],
+                'examples': page['examples'],
                 'url': url
             }
 
@@ -88,25 +175,34 @@ class BOJCrawler:
             print(f"문제를 가져오는 중 오류 발생: {e}")
             return None
 
-    def _parse_examples(self, soup: BeautifulSoup) -> List[Dict[str, str]]:
-        """예제 입력/출력을 파싱합니다."""
-        examples = []
+    def _fetch(self, url: str, params: Optional[dict] = None, timeout: float = 10) -> str:
+        """URL의 응답 본문을 가져옵니다. 캐시가 설정되어 있으면 캐시를 거칩니다."""
+        if self.cache:
+            return self.cache.get(self.session, url, params=params, timeout=timeout)
 
-        # 예제 입력
-        sample_inputs = soup.select('pre[id^="sample-input-"]')
-        sample_outputs = soup.select('pre[id^="sample-output-"]')
+        response = self.session.get(url, params=params, timeout=timeout)
+        response.raise_for_status()
+        return response.text
 
-        for i, (input_elem, output_elem) in enumerate(zip(sample_inputs, sample_outputs)):
-            examples.append({
-                'input': input_elem.text.strip(),
-                'output': output_elem.text.strip()
-            })
+    def get_meta(self, problem_id: int) -> Optional[Dict]:
+        """
+        solved.ac 문제 메타데이터(제목, 티어, 태그, 맞은 사람 수)를 반환합니다.
 
-        return examples
+        인덱스에 없으면 solved.ac에서 조회해 인덱스에 추가합니다. (오프라인 모드에서는 조회하지 않음)
+        """
+        if problem_id not in self.index and not (self.cache and self.cache.offline):
+            self.index.fetch_missing(self.session, [problem_id])
+        return self.index.get(problem_id)
+
+    def prefetch_meta(self, problem_ids: List[int]):
+        """여러 문제의 메타데이터를 한 번에 묶어서 인덱스에 채워 둡니다."""
+        if self.cache and self.cache.offline:
+            return
+        self.index.fetch_missing(self.session, problem_ids)
 
     def _get_title_en(self, problem_id: int) -> str:
         """
-        solved.ac API를 사용하여 영문 제목을 가져옵니다.
+        solved.ac 메타데이터로 디렉토리 이름에 쓸 영문 제목을 만듭니다.
         실패 시 문제 번호를 반환합니다.
 
         Args:
@@ -116,19 +212,12 @@ class BOJCrawler:
             영문 제목 또는 문제 번호
         """
         try:
-            api_url = f"https://solved.ac/api/v3/problem/show"
-            params = {'problemId': problem_id}
-
-            response = requests.get(api_url, params=params, timeout=5)
-            response.raise_for_status()
-
-            data = response.json()
+            meta = self.get_meta(problem_id)
 
             # titleKo에서 영문/숫자만 추출하거나, tags에서 영문 이름 생성
-            title_ko = data.get('titleKo', str(problem_id))
+            title_ko = meta['title'] if meta and meta['title'] else str(problem_id)
 
             # 간단하게 영문/숫자/하이픈/언더스코어만 남기기
-            import re
             title_en = re.sub(r'[^a-zA-Z0-9\-_]', '_', title_ko)
             title_en = re.sub(r'_+', '_', title_en).strip('_')
 
@@ -159,45 +248,67 @@ class BOJCrawler:
         Returns:
             문제 번호 또는 None
         """
+        candidates = self.search_random_problems(tier=tier, tag=tag)
+        return candidates[0] if candidates else None
+
+    def search_random_problems(self, tier: Optional[str] = None,
+                               tag: Optional[str] = None) -> List[int]:
+        """
+        solved.ac 검색 API로 조건에 맞는 랜덤 문제 번호 한 페이지(최대 50개)를 가져옵니다.
+        한국어 문제만 선택합니다.
+
+        Args:
+            tier: 난이도 (예: 'gold', 'silver', 'bronze')
+            tag: 알고리즘 태그 (예: 'dp', 'greedy')
+
+        Returns:
+            문제 번호 리스트 (실패 시 빈 리스트)
+        """
         try:
             # solved.ac API 사용
             api_url = "https://solved.ac/api/v3/search/problem"
             params = {
-                'query': '',
+                'query': self.build_query(tier=tier, tag=tag),
                 'sort': 'random',
                 'direction': 'asc',
                 'page': 1
             }
 
-            # 난이도 필터
-            if tier:
-                tier_map = {
-                    'bronze': 'b',
-                    'silver': 's',
-                    'gold': 'g',
-                    'platinum': 'p',
-                    'diamond': 'd',
-                    'ruby': 'r'
-                }
-                tier_prefix = tier_map.get(tier.lower(), 's')
-                params['query'] += f'tier:{tier_prefix} '
-
-            # 태그 필터
-            if tag:
-                params['query'] += f'#{tag} '
-
-            # 한국어 문제만 필터링
-            params['query'] += 'lang:ko '
-
-            response = requests.get(api_url, params=params)
+            response = self.session.get(api_url, params=params, timeout=5)
             response.raise_for_status()
 
-            data = response.json()
-            if data.get('items') and len(data['items']) > 0:
-                return data['items'][0]['problemId']
-
-            return None
+            items = response.json().get('items', [])
+            # 검색 결과에도 문제 정보가 들어 있으므로 인덱스에 저장
+            self.index.update(items)
+            return [item['problemId'] for item in items]
 
         except Exception as e:
             print(f"solved.ac API 호출 중 오류 발생: {e}")
-            return None
+            return []
+
+    @staticmethod
+    def build_query(tier: Optional[str] = None, tag: Optional[str] = None) -> str:
+        """solved.ac 검색 쿼리를 만듭니다. (한국어 문제만)"""
+        query = ''
+
+        # 난이도 필터
+        if tier:
+            tier_map = {
+                'bronze': 'b',
+                'silver': 's',
+                'gold': 'g',
+                'platinum': 'p',
+                'diamond': 'd',
+                'ruby': 'r'
+            }
+            tier_prefix = tier_map.get(tier.lower(), 's')
+            query += f'tier:{tier_prefix} '
+
+        # 태그 필터
+        if tag:
+            query += f'#{tag} '
+
+        # 한국어 문제만 필터링
+        query += 'lang:ko '
+
+        return query
@@ -0,0 +1,317 @@
+"""
+boj_lib 마이크로 벤치마크 스크립트
+라이브러리의 각 기능을 풀이에 흔히 직접 작성하는 방식(줄 단위 입력, 리스트/재귀 구현 등)과
+실행 시간과 최대 메모리(tracemalloc)로 비교하고, 두 방식의 결과가 같은지 확인합니다.
+"""
+import io
+import sys
+import time
+import random
+import argparse
+import statistics
+import tracemalloc
+from typing import Callable, Dict, List, Optional, Tuple
+
+from boj_paths import LIB_DIR
+from boj_runner import pad
+
+sys.path.insert(0, str(LIB_DIR))
+
+from boj_lib.bsearch import max_true
+from boj_lib.dsu import DSU
+from boj_lib.fastio import Tokens
+from boj_lib.fenwick import Fenwick
+from boj_lib.pattern import count_pattern_pairs
+from boj_lib.segtree import SegTree
+
+
+def _with_stdin(data: bytes, func: Callable) -> Callable:
+    """data를 표준 입력으로 바꿔서 func를 실행하는 함수"""
+    def run():
+        stdin = sys.stdin
+        sys.stdin = io.TextIOWrapper(io.BytesIO(data))
+        try:
+            return func()
+        finally:
+            sys.stdin = stdin
+    return run
+
+
+def bench_fastio(n: int, rng: random.Random) -> Tuple:
+    """정수 n개(한 줄에 하나) 읽기: readline 반복 vs 한 번에 읽어서 나누기"""
+    data = ('\n'.join(str(rng.randint(-10 ** 9, 10 ** 9)) for _ in range(n)) + '\n').encode()
+
+    def baseline():
+        readline = sys.stdin.readline
+        return [int(readline()) for _ in range(n)]
+
+    def library():
+        return Tokens().ints(n)
+
+    return "readline 반복", _with_stdin(data, baseline), _with_stdin(data, library)
+
+
+def bench_fenwick(n: int, rng: random.Random) -> Tuple:
+    """점 갱신 n번 + 구간 합 n번: 리스트와 함수로 작성한 펜윅 트리 vs Fenwick"""
+    values = [rng.randint(0, 10 ** 6) for _ in range(n)]
+    ops = [(rng.randrange(n), rng.randint(-100, 100), rng.randrange(n + 1)) for _ in range(n)]
+
+    def baseline():
+        tree = [0] * (n + 1)
+
+        def add(i, delta):
+            i += 1
+            while i <= n:
+                tree[i] += delta
+                i += i & -i
+
+        def prefix_sum(i):
+            total = 0
+            while i > 0:
+                total += tree[i]
+                i -= i & -i
+            return total
+
+        for i, value in enumerate(values):
+            add(i, value)
+        result = []
+        for index, delta, end in ops:
+            add(index, delta)
+            result.append(prefix_sum(end))
+        return result
+
+    def library():
+        tree = Fenwick(values)
+        result = []
+        for index, delta, end in ops:
+            tree.add(index, delta)
+            result.append(tree.prefix_sum(end))
+        return result
+
+    return "리스트 펜윅 (함수)", baseline, library
+
+
+def bench_segtree(n: int, rng: random.Random) -> Tuple:
+    """점 갱신 n번 + 구간 최솟값 n번: 재귀 세그먼트 트리 vs SegTree"""
+    values = [rng.randint(0, 10 ** 9) for _ in range(n)]
+    ops = []
+    for _ in range(n):
+        start = rng.randrange(n)
+        ops.append((rng.randrange(n), rng.randint(0, 10 ** 9), start, rng.randrange(start, n) + 1))
+    inf = 10 ** 18
+
+    def baseline():
+        tree = [inf] * (4 * n)
+
+        def build(node, lo, hi):
+            if lo == hi:
+                tree[node] = values[lo]
+                return
+            mid = (lo + hi) // 2
+            build(node * 2, lo, mid)
+            build(node * 2 + 1, mid + 1, hi)
+            tree[node] = min(tree[node * 2], tree[node * 2 + 1])
+
+        def update(node, lo, hi, index, value):
+            if lo == hi:
+                tree[node] = value
+                return
+            mid = (lo + hi) // 2
+            if index <= mid:
+                update(node * 2, lo, mid, index, value)
+            else:
+                update(node * 2 + 1, mid + 1, hi, index, value)
+            tree[node] = min(tree[node * 2], tree[node * 2 + 1])
+
+        def query(node, lo, hi, left, right):
+            if right < lo or hi < left:
+                return inf
+            if left <= lo and hi <= right:
+                return tree[node]
+            mid = (lo + hi) // 2
+            return min(query(node * 2, lo, mid, left, right),
+                       query(node * 2 + 1, mid + 1, hi, left, right))
+
+        build(1, 0, n - 1)
+        result = []
+        for index, value, start, end in ops:
+            update(1, 0, n - 1, index, value)
+            result.append(query(1, 0, n - 1, start, end - 1))
+        return result
+
+    def library():
+        tree = SegTree(values, min, inf)
+        result = []
+        for index, value, start, end in ops:
+            tree.update(index, value)
+            result.append(tree.query(start, end))
+        return result
+
+    return "재귀 세그먼트 트리", baseline, library
+
+
+def bench_dsu(n: int, rng: random.Random) -> Tuple:
+    """합치기 n번 + 같은 집합 확인 n번: 재귀 find vs DSU"""
+    pairs = [(rng.randrange(n), rng.randrange(n)) for _ in range(2 * n)]
+
+    def baseline():
+        sys.setrecursionlimit(max(sys.getrecursionlimit(), n + 1000))
+        parent = list(range(n))
+
+        def find(x):
+            if parent[x] != x:
+                parent[x] = find(parent[x])
+            return parent[x]
+
+        result = []
+        for i, (a, b) in enumerate(pairs):
+            if i < n:
+                parent[find(a)] = find(b)
+            else:
+                result.append(find(a) == find(b))
+        return result
+
+    def library():
+        dsu = DSU(n)
+        result = []
+        for i, (a, b) in enumerate(pairs):
+            if i < n:
+                dsu.union(a, b)
+            else:
+                result.append(dsu.same(a, b))
+        return result
+
+    return "재귀 find", baseline, library
+
+
+def bench_bsearch(n: int, rng: random.Random) -> Tuple:
+    """과자 n개로 매개 변수 탐색 (16401): 기존 풀이(실수 나눗셈) vs max_true"""
+    snacks = [rng.randint(1, 10 ** 9) for _ in range(n)]
+    m = rng.randint(1, n * 10)
+
+    def baseline():
+        first, last, answer = 1, max(snacks), 0
+        while first <= last:
+            mid = int((first + last) / 2)
+            total = 0
+            for snack in snacks:
+                total += int(snack / mid)
+            if total >= m:
+                answer = mid
+                first = mid + 1
+            else:
+                last = mid - 1
+        return answer
+
+    def library():
+        return max_true(1, max(snacks), lambda length: sum(snack // length for snack in snacks) >= m)
+
+    return "while 루프 (16401)", baseline, library
+
+
+def bench_pattern(n: int, rng: random.Random) -> Tuple:
+    """길이 50인 단어 n / 5개의 같은 패턴 쌍 세기 (1411): 딕셔너리로 패턴 만들기 vs count_pattern_pairs"""
+    words = [''.join(rng.choice('abcdefghijklmnopqrstuvwxyz') for _ in range(50)) for _ in range(n // 5)]
+
+    def baseline():
+        counts = {}
+        for word in words:
+            char_map = {}
+            pattern = []
+            for char in word:
+                if char not in char_map:
+                    char_map[char] = len(char_map)
+                pattern.append(char_map[char])
+            key = tuple(pattern)
+            counts[key] = counts.get(key, 0) + 1
+        return sum(count * (count - 1) // 2 for count in counts.values())
+
+    def library():
+        return count_pattern_pairs(words)
+
+    return "딕셔너리 패턴 (1411)", baseline, library
+
+
+BENCHMARKS: Dict[str, Callable] = {
+    'fastio': bench_fastio,
+    'fenwick': bench_fenwick,
+    'segtree': bench_segtree,
+    'dsu': bench_dsu,
+    'bsearch': bench_bsearch,
+    'pattern': bench_pattern,
+}
+
+
+def time_call(func: Callable, repeat: int) -> float:
+    """func를 repeat번 실행한 시간의 중앙값 (초)"""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return statistics.median(times)
+
+
+def peak_memory(func: Callable) -> int:
+    """func 실행 중 새로 할당된 메모리의 최댓값 (바이트, 결과 값 포함)"""
+    tracemalloc.start()
+    try:
+        func()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(
+        description='boj_lib의 각 기능을 직접 작성한 흔한 구현과 비교합니다.',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=f"""
+사용 예시:
+  python boj_lib_bench.py                     # 모든 기능 비교
+  python boj_lib_bench.py fenwick dsu -n 200000 -r 5
+
+기능: {', '.join(BENCHMARKS)}
+        """
+    )
+    parser.add_argument('names', nargs='*', metavar='name', help='비교할 기능 (기본값: 전체)')
+    parser.add_argument('-n', '--size', type=int, default=100000, help='데이터 크기 (기본값: 100000)')
+    parser.add_argument('-r', '--repeat', type=int, default=3, help='반복 횟수 (기본값: 3)')
+    parser.add_argument('--seed', type=int, default=0, help='데이터 생성 시드 (기본값: 0)')
+
+    args = parser.parse_args(argv)
+    names: List[str] = args.names or list(BENCHMARKS)
+    unknown = [name for name in names if name not in BENCHMARKS]
+    if unknown:
+        parser.error(f"알 수 없는 기능: {', '.join(unknown)} (가능한 기능: {', '.join(BENCHMARKS)})")
+
+    print(f"[*] 데이터 크기 {args.size}, {args.repeat}회 반복 (시간은 중앙값)\n")
+    print(pad('기능', 10) + pad('비교 대상', 24) + pad('시간 (ms)', 24, right=True)
+          + pad('메모리 (MB)', 24, right=True))
+    print(pad('', 34) + pad('비교 대상 -> boj_lib', 24, right=True) * 2)
+    print("-" * 82)
+
+    mismatches = []
+    for name in names:
+        label, baseline, library = BENCHMARKS[name](args.size, random.Random(args.seed))
+        if baseline() != library():
+            mismatches.append(name)
+        base_time = time_call(baseline, args.repeat)
+        lib_time = time_call(library, args.repeat)
+        base_memory = peak_memory(baseline) / 1024 / 1024
+        lib_memory = peak_memory(library) / 1024 / 1024
+        times = f"{base_time * 1000:.1f} -> {lib_time * 1000:.1f} ({base_time / lib_time:.1f}x)"
+        memory = f"{base_memory:.1f} -> {lib_memory:.1f}"
+        print(pad(name, 10) + pad(label, 24) + pad(times, 24, right=True) + pad(memory, 24, right=True))
+
+    print()
+    if mismatches:
+        for name in mismatches:
+            print(f"[X] {name}: 결과가 비교 대상과 다릅니다.")
+        sys.exit(1)
+
+    print("[O] 모든 기능의 결과가 비교 대상과 같습니다.")
+
+
+if __name__ == "__main__":
+    main()
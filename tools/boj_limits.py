@@ -0,0 +1,108 @@
+"""
+문제 시간/메모리 제한 모듈
+세팅 시 problem.json에 저장한 제한을 읽고, 없으면 README.md의 '제한' 항목을 파싱합니다.
+"""
+import re
+import json
+from pathlib import Path
+from typing import Dict, Optional
+
+
+LIMITS_FILE = "problem.json"
+
+# 백준 언어별 추가 시간/메모리 (시간 × 배수 + 초, 메모리 × 배수 + MB)
+# '추가 시간 없음' 문제는 원래 제한을 그대로 사용합니다.
+LANGUAGE_BONUS = {
+    'Python 3': {'time': (3, 2), 'memory': (2, 32)},
+    'PyPy3': {'time': (3, 2), 'memory': (2, 128)},
+}
+
+
+def parse_limits(time_text: str, memory_text: str) -> Optional[Dict]:
+    """
+    '2 초', '128 MB' 같은 제한 문자열을 파싱합니다.
+
+    Args:
+        time_text: 시간 제한 문자열 (예: '1 초 (추가 시간 없음)')
+        memory_text: 메모리 제한 문자열 (예: '256 MB')
+
+    Returns:
+        {'time': 초, 'memory': MB, 'extra_time': 추가 시간 여부} 또는 None
+    """
+    time_match = re.search(r'([\d.]+)\s*초', time_text or "")
+    memory_match = re.search(r'([\d.]+)\s*MB', memory_text or "")
+    if not time_match or not memory_match:
+        return None
+
+    return {
+        'time': float(time_match.group(1)),
+        'memory': float(memory_match.group(1)),
+        'extra_time': '추가 시간 없음' not in time_text,
+    }
+
+
+def save_limits(problem_dir: Path, problem: dict):
+    """크롤링한 문제 정보에서 제한을 파싱해 problem.json으로 저장합니다."""
+    limits = parse_limits(problem['time_limit'], problem['memory_limit'])
+    data = {
+        'id': problem['id'],
+        'title': problem['title'],
+        'limits': limits,
+    }
+
+    with open(Path(problem_dir) / LIMITS_FILE, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+
+
+def load_limits(problem_dir: Path) -> Optional[Dict]:
+    """
+    문제 디렉토리에서 제한을 읽습니다.
+
+    problem.json이 있으면 사용하고, 없으면 README.md의 '제한' 항목을 파싱합니다.
+
+    Returns:
+        parse_limits()와 같은 형식의 딕셔너리 또는 None
+    """
+    problem_dir = Path(problem_dir)
+
+    limits_path = problem_dir / LIMITS_FILE
+    if limits_path.exists():
+        with open(limits_path, 'r', encoding='utf-8') as f:
+            return json.load(f).get('limits')
+
+    readme_path = problem_dir / "README.md"
+    if not readme_path.exists():
+        return None
+
+    readme = readme_path.read_text(encoding='utf-8')
+    time_match = re.search(r'\*\*시간 제한\*\*:\s*(.+)', readme)
+    memory_match = re.search(r'\*\*메모리 제한\*\*:\s*(.+)', readme)
+    if not time_match or not memory_match:
+        return None
+
+    return parse_limits(time_match.group(1), memory_match.group(1))
+
+
+def judge_limits(limits: Dict, language: Optional[str] = 'Python 3') -> Dict:
+    """
+    채점 서버가 실제로 적용하는 제한을 계산합니다.
+
+    Args:
+        limits: load_limits()가 반환한 제한
+        language: 언어 이름 (None이면 추가 시간/메모리 없이 원래 제한 사용)
+
+    Returns:
+        {'time': 초, 'memory': MB}
+    """
+    time_limit = limits['time']
+    memory_limit = limits['memory']
+
+    bonus = LANGUAGE_BONUS.get(language)
+    if bonus:
+        if limits.get('extra_time', True):
+            factor, extra = bonus['time']
+            time_limit = time_limit * factor + extra
+        factor, extra = bonus['memory']
+        memory_limit = memory_limit * factor + extra
+
+    return {'time': time_limit, 'memory': memory_limit}
@@ -0,0 +1,134 @@
+"""
+문제 메타데이터 인덱스 모듈
+solved.ac의 문제 정보(제목, 티어, 태그, 맞은 사람 수)를 로컬 JSON-lines 파일에 저장해 두고,
+없는 문제는 한 번의 요청에 여러 문제씩 묶어서 채웁니다.
+"""
+import json
+import threading
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+from boj_paths import CACHE_DIR
+
+
+LOOKUP_URL = "https://solved.ac/api/v3/problem/lookup"
+
+# solved.ac problem/lookup은 한 번에 최대 100문제까지 조회 가능
+LOOKUP_BATCH = 100
+
+TIER_NAMES = ['Unrated'] + [
+    f"{tier} {rank}"
+    for tier in ('Bronze', 'Silver', 'Gold', 'Platinum', 'Diamond', 'Ruby')
+    for rank in ('V', 'IV', 'III', 'II', 'I')
+]
+
+
+def tier_name(level: Optional[int]) -> str:
+    """solved.ac 레벨(0~30)을 티어 이름으로 변환합니다. (예: 6 -> 'Silver V')"""
+    if level is None or not 0 <= level < len(TIER_NAMES):
+        return "TBD"
+    return TIER_NAMES[level]
+
+
+class ProblemIndex:
+    """문제 번호 -> 메타데이터 로컬 인덱스"""
+
+    def __init__(self, path: Optional[Path] = None):
+        """
+        Args:
+            path: 인덱스 파일 경로 (기본값: 저장소 루트의 .boj_cache/meta.jsonl)
+        """
+        self.path = Path(path) if path else CACHE_DIR / "meta.jsonl"
+        self._entries = {}
+        self._lock = threading.Lock()
+        self._load()
+
+    def __contains__(self, problem_id: int) -> bool:
+        return int(problem_id) in self._entries
+
+    def get(self, problem_id: int) -> Optional[Dict]:
+        """인덱스에 있는 문제 메타데이터를 반환합니다. 없으면 None"""
+        return self._entries.get(int(problem_id))
+
+    def update(self, items: Iterable[dict]):
+        """
+        solved.ac 문제 객체들을 인덱스에 추가합니다.
+
+        검색/조회 API 응답의 items를 그대로 넘기면 됩니다.
+        """
+        entries = [self._normalize(item) for item in items if 'problemId' in item]
+        if not entries:
+            return
+
+        with self._lock:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path, 'a', encoding='utf-8') as f:
+                for entry in entries:
+                    self._entries[entry['id']] = entry
+                    f.write(json.dumps(entry, ensure_ascii=False) + '\n')
+
+    def fetch_missing(self, session, problem_ids: Iterable[int]) -> List[int]:
+        """
+        인덱스에 없는 문제들을 solved.ac에서 묶음 단위로 조회해 채웁니다.
+
+        Args:
+            session: 요청에 사용할 requests.Session
+            problem_ids: 필요한 문제 번호들
+
+        Returns:
+            조회 후에도 찾지 못한 문제 번호 리스트
+        """
+        import requests
+
+        missing = sorted({int(pid) for pid in problem_ids if int(pid) not in self._entries})
+
+        for i in range(0, len(missing), LOOKUP_BATCH):
+            batch = missing[i:i + LOOKUP_BATCH]
+            try:
+                response = session.get(LOOKUP_URL,
+                                       params={'problemIds': ','.join(map(str, batch))},
+                                       timeout=10)
+                response.raise_for_status()
+                self.update(response.json())
+            except (requests.RequestException, ValueError) as e:
+                print(f"solved.ac 문제 정보 조회 중 오류 발생: {e}")
+                break
+
+        return [pid for pid in missing if pid not in self._entries]
+
+    def _load(self):
+        """인덱스 파일을 읽습니다. 같은 문제가 여러 줄이면 마지막 줄이 최신입니다."""
+        if not self.path.exists():
+            return
+
+        lines = 0
+        with open(self.path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue
+                self._entries[entry['id']] = entry
+                lines += 1
+
+        # 갱신이 쌓여서 중복 줄이 많아지면 한 번 정리
+        if lines > 2 * len(self._entries) + 100:
+            self._compact()
+
+    def _compact(self):
+        tmp_path = self.path.with_suffix('.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            for entry in self._entries.values():
+                f.write(json.dumps(entry, ensure_ascii=False) + '\n')
+        tmp_path.replace(self.path)
+
+    @staticmethod
+    def _normalize(item: dict) -> Dict:
+        """solved.ac 문제 객체에서 필요한 필드만 뽑습니다."""
+        return {
+            'id': item['problemId'],
+            'title': item.get('titleKo', ''),
+            'level': item.get('level'),
+            'tags': [tag['key'] for tag in item.get('tags', []) if 'key' in tag],
+            'accepted_users': item.get('acceptedUserCount'),
+        }
@@ -0,0 +1,269 @@
+"""
+백준 모의 서버
+로그인, 제출, 채점 현황 페이지를 흉내 내는 로컬 HTTP 서버입니다.
+실제 백준에 제출하지 않고 boj_submit.py(--backend http)와 boj_status.py를 확인할 때 사용합니다.
+
+- GET  /login          로그인 폼 (hidden next, login_user_id, login_password, auto_login)
+- POST /signin         아이디/비밀번호가 맞으면 OnlineJudge 쿠키를 주고 이동, 틀리면 에러 메시지
+- GET  /submit/<번호>   제출 폼 (세션별 csrf_key, 언어 select, 공개 여부 radio, source)
+- POST /submit/<번호>   CSRF 토큰을 확인하고 채점 현황 페이지로 이동
+- GET  /status         채점 현황 (기다리는 중 -> 채점 중 -> 맞았습니다!! / 컴파일 에러)
+"""
+import time
+import secrets
+import argparse
+import threading
+from html import escape
+from http.cookies import SimpleCookie
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import List, Optional
+from urllib.parse import parse_qs, urlparse
+
+
+SESSION_COOKIE = "OnlineJudge"
+LANGUAGES = {'28': 'Python 3', '73': 'PyPy3'}
+
+# 제출 후 결과가 바뀌는 시각 (초)
+WAIT_SECONDS = 0.5
+JUDGE_SECONDS = 1.5
+
+
+class MockJudge:
+    """모의 서버의 상태 (세션, 제출 기록)"""
+
+    def __init__(self, username: str, password: str):
+        self.username = username
+        self.password = password
+        self.sessions = {}      # 세션 토큰 -> {'user', 'csrf'}
+        self.solutions = []     # 최근 제출이 앞
+        self.next_solution_id = 70000001
+        self.lock = threading.Lock()
+
+    def new_session(self) -> str:
+        token = secrets.token_hex(16)
+        with self.lock:
+            self.sessions[token] = {'user': None, 'csrf': secrets.token_hex(16)}
+        return token
+
+    def add_solution(self, user: str, problem_id: int, language: str, source: str) -> int:
+        with self.lock:
+            solution_id = self.next_solution_id
+            self.next_solution_id += 1
+            self.solutions.insert(0, {
+                'id': solution_id,
+                'user': user,
+                'problem_id': problem_id,
+                'language': language,
+                'submitted': time.monotonic(),
+                'compiles': _compiles(source),
+                'length': len(source.encode('utf-8')),
+            })
+        return solution_id
+
+
+def _compiles(source: str) -> bool:
+    try:
+        compile(source, '<submission>', 'exec')
+    except (SyntaxError, ValueError):
+        return False
+    return True
+
+
+def _result_cell(solution: dict) -> tuple:
+    """(결과, 메모리, 시간) 칸의 HTML. 제출 후 지난 시간에 따라 결과가 바뀜"""
+    elapsed = time.monotonic() - solution['submitted']
+    if elapsed < WAIT_SECONDS:
+        return '<span class="result-text result-wait">기다리는 중</span>', '', ''
+    if elapsed < JUDGE_SECONDS:
+        percent = int((elapsed - WAIT_SECONDS) / (JUDGE_SECONDS - WAIT_SECONDS) * 100)
+        return f'<span class="result-text result-judging">채점 중 ({percent}%)</span>', '', ''
+    if not solution['compiles']:
+        return '<span class="result-text result-ce">컴파일 에러</span>', '', ''
+    return ('<span class="result-text result-ac">맞았습니다!!</span>',
+            '31120<span> KB</span>', '44<span> ms</span>')
+
+
+class MockHandler(BaseHTTPRequestHandler):
+    """MockJudge를 사용하는 요청 처리기"""
+
+    judge = None
+
+    def log_message(self, format, *args):
+        # 요청마다 로그를 찍지 않음
+        pass
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        session = self._session()
+
+        if url.path == '/':
+            self._page(session, '<h1>Baekjoon Online Judge (mock)</h1>')
+        elif url.path == '/login':
+            self._login_page(session)
+        elif url.path.startswith('/submit/'):
+            self._submit_page(session, url.path.rsplit('/', 1)[-1])
+        elif url.path == '/status':
+            self._status_page(session, parse_qs(url.query))
+        else:
+            self._send(404, '<h1>404</h1>')
+
+    def do_POST(self):
+        url = urlparse(self.path)
+        session = self._session()
+        length = int(self.headers.get('Content-Length', 0))
+        form = {key: values[0] for key, values in
+                parse_qs(self.rfile.read(length).decode('utf-8'), keep_blank_values=True).items()}
+
+        if url.path == '/signin':
+            self._signin(session, form)
+        elif url.path.startswith('/submit/'):
+            self._submit(session, url.path.rsplit('/', 1)[-1], form)
+        else:
+            self._send(404, '<h1>404</h1>')
+
+    def _session(self) -> str:
+        """요청의 세션 토큰. 없거나 모르는 토큰이면 새로 만들고 응답에 쿠키를 붙입니다."""
+        cookie = SimpleCookie(self.headers.get('Cookie', ''))
+        token = cookie[SESSION_COOKIE].value if SESSION_COOKIE in cookie else None
+        self._new_cookie = None
+        self._persistent = False
+        if token not in self.judge.sessions:
+            token = self.judge.new_session()
+            self._new_cookie = token
+        return token
+
+    def _login_page(self, session: str, error: str = ''):
+        alert = f'<div class="alert alert-danger">{escape(error)}</div>' if error else ''
+        self._page(session, f'''{alert}
+<form action="/signin" method="post">
+  <input type="hidden" name="next" value="/">
+  <input type="text" name="login_user_id">
+  <input type="password" name="login_password">
+  <input type="checkbox" name="auto_login" value="1">
+  <button type="submit" id="submit_button">로그인</button>
+</form>''')
+
+    def _signin(self, session: str, form: dict):
+        if form.get('login_user_id') != self.judge.username or \
+                form.get('login_password') != self.judge.password:
+            self._login_page(session, '아이디 또는 비밀번호가 올바르지 않습니다.')
+            return
+
+        self.judge.sessions[session]['user'] = self.judge.username
+        # 로그인 상태 유지를 선택하면 오래 유지되는 쿠키를 줌
+        self._new_cookie = session
+        self._persistent = form.get('auto_login') == '1'
+        self._redirect(form.get('next') or '/')
+
+    def _submit_page(self, session: str, problem_id: str):
+        state = self.judge.sessions[session]
+        if state['user'] is None:
+            self._redirect(f'/login?next=/submit/{problem_id}')
+            return
+
+        options = ''.join(f'<option value="{value}">{name}</option>' for value, name in LANGUAGES.items())
+        self._page(session, f'''
+<form action="/submit/{escape(problem_id)}" method="post">
+  <input type="hidden" name="problem_id" value="{escape(problem_id)}">
+  <input type="hidden" name="csrf_key" value="{state['csrf']}">
+  <select name="language">{options}</select>
+  <input type="radio" name="code_open" value="open" checked>
+  <input type="radio" name="code_open" value="close">
+  <textarea id="source" name="source"></textarea>
+  <button type="submit" id="submit_button">제출</button>
+</form>''')
+
+    def _submit(self, session: str, problem_id: str, form: dict):
+        state = self.judge.sessions[session]
+        if state['user'] is None:
+            self._redirect('/login')
+            return
+        if form.get('csrf_key') != state['csrf']:
+            self._send(403, '<div class="alert alert-danger">잘못된 요청입니다. (csrf_key)</div>')
+            return
+        if form.get('language') not in LANGUAGES or not form.get('source'):
+            self._send(400, '<div class="alert alert-danger">언어와 소스 코드를 확인하세요.</div>')
+            return
+
+        self.judge.add_solution(state['user'], int(problem_id), LANGUAGES[form['language']], form['source'])
+        self._redirect(f'/status?problem_id={problem_id}&user_id={state["user"]}')
+
+    def _status_page(self, session: str, query: dict):
+        rows = []
+        for solution in self.judge.solutions:
+            if 'problem_id' in query and str(solution['problem_id']) != query['problem_id'][0]:
+                continue
+            if 'user_id' in query and solution['user'] != query['user_id'][0]:
+                continue
+            result, memory, elapsed = _result_cell(solution)
+            rows.append(f'''<tr id="solution-{solution['id']}">
+  <td>{solution['id']}</td><td>{escape(solution['user'])}</td><td>{solution['problem_id']}</td>
+  <td class="result">{result}</td><td class="memory">{memory}</td><td class="time">{elapsed}</td>
+  <td>{solution['language']}</td><td>{solution['length']} B</td>
+</tr>''')
+        self._page(session, f'<table id="status-table"><tbody>{"".join(rows)}</tbody></table>')
+
+    def _page(self, session: str, body: str):
+        user = self.judge.sessions[session]['user']
+        menu = f'<a href="/user/{escape(user)}">{escape(user)}</a>' if user else '<a href="/login">로그인</a>'
+        self._send(200, f'<html><body><nav>{menu}</nav>{body}</body></html>')
+
+    def _redirect(self, location: str):
+        self.send_response(302)
+        self.send_header('Location', location)
+        self._send_cookie()
+        self.send_header('Content-Length', '0')
+        self.end_headers()
+
+    def _send(self, code: int, html: str):
+        data = html.encode('utf-8')
+        self.send_response(code)
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.send_header('Content-Length', str(len(data)))
+        self._send_cookie()
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _send_cookie(self):
+        if self._new_cookie:
+            cookie = f'{SESSION_COOKIE}={self._new_cookie}; Path=/; HttpOnly'
+            if self._persistent:
+                cookie += '; Max-Age=2592000'
+            self.send_header('Set-Cookie', cookie)
+
+
+def create_server(host: str, port: int, username: str, password: str) -> ThreadingHTTPServer:
+    """모의 서버를 만듭니다. (serve_forever()로 시작)"""
+    handler = type('Handler', (MockHandler,), {'judge': MockJudge(username, password)})
+    return ThreadingHTTPServer((host, port), handler)
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(
+        description='로그인/제출/채점 현황을 흉내 내는 로컬 백준 모의 서버를 실행합니다.',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+사용 예시:
+  python boj_mock_server.py --port 8765 --username test --password test
+  python boj_submit.py 1000 --backend http --base-url http://127.0.0.1:8765 --username test --password test
+        """
+    )
+    parser.add_argument('--host', type=str, default='127.0.0.1', help='주소 (기본값: 127.0.0.1)')
+    parser.add_argument('--port', type=int, default=8765, help='포트 (기본값: 8765)')
+    parser.add_argument('--username', type=str, default='test', help='로그인 아이디 (기본값: test)')
+    parser.add_argument('--password', type=str, default='test', help='로그인 비밀번호 (기본값: test)')
+
+    args = parser.parse_args(argv)
+
+    server = create_server(args.host, args.port, args.username, args.password)
+    print(f"[*] 모의 서버 실행 중: http://{args.host}:{args.port} (아이디 {args.username})")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+"""
+문제 페이지 파싱 벤치마크 스크립트
+저장된 문제 페이지로 전체 트리 파싱과 필요한 요소만 파싱하는 방식의 페이지당 비용을 비교하고,
+모든 방식의 추출 결과가 같은지 확인합니다.
+
+문제 페이지:
+    - 인자로 준 HTML 파일 (디렉토리를 주면 그 안의 *.html)
+    - 인자가 없으면 tools/fixtures/problem_*.html (저장소에 포함된 문제 페이지)
+    - --cache를 주면 응답 캐시(.boj_cache/http)에 저장된 문제 페이지
+"""
+import re
+import sys
+import time
+import argparse
+import importlib.util
+import statistics
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+from boj_cache import HTTPCache
+from boj_crawler import BOJCrawler, PARSER_BACKENDS, parse_problem_page
+from boj_runner import pad
+
+FIXTURES_DIR = Path(__file__).resolve().parent / "fixtures"
+
+
+def load_pages(paths: List[str], from_cache: bool = False) -> List[Tuple[str, str]]:
+    """벤치마크할 (이름, HTML) 리스트를 만듭니다."""
+    pages = []
+
+    if from_cache:
+        pattern = re.compile(re.escape(BOJCrawler.PROBLEM_URL) + r'(\d+)$')
+        for url, body in HTTPCache().entries():
+            match = pattern.match(url)
+            if match:
+                pages.append((match.group(1), body))
+        return sorted(pages, key=lambda page: int(page[0]))
+
+    for path in map(Path, paths or [FIXTURES_DIR]):
+        files = sorted(path.glob('*.html')) if path.is_dir() else [path]
+        for file_path in files:
+            pages.append((file_path.stem, file_path.read_text(encoding='utf-8')))
+
+    return pages
+
+
+def time_parse(html: str, parser: str, targeted: bool, repeat: int) -> float:
+    """한 페이지를 repeat번 파싱한 시간의 중앙값 (초)"""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        parse_problem_page(html, parser=parser, targeted=targeted)
+        times.append(time.perf_counter() - start)
+    return statistics.median(times)
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(
+        description='문제 페이지 파싱 방식별 비용을 비교합니다.',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+사용 예시:
+  python boj_parse_bench.py                   # tools/fixtures/의 문제 페이지로 비교
+  python boj_parse_bench.py --cache           # 응답 캐시에 저장된 문제 페이지로 비교
+  python boj_parse_bench.py pages/ -r 50      # pages/*.html로 50회씩 반복해 비교
+        """
+    )
+    parser.add_argument('paths', nargs='*', help='문제 페이지 HTML 파일 또는 디렉토리')
+    parser.add_argument('--cache', action='store_true', help='응답 캐시(.boj_cache/http)의 문제 페이지를 사용')
+    parser.add_argument('-r', '--repeat', type=int, default=20, help='페이지당 반복 횟수 (기본값: 20)')
+
+    args = parser.parse_args(argv)
+
+    if args.cache and args.paths:
+        parser.error('--cache와 HTML 파일은 함께 지정할 수 없습니다.')
+
+    pages = load_pages(args.paths, from_cache=args.cache)
+    if not pages:
+        print("[X] 벤치마크할 문제 페이지가 없습니다. "
+              "boj_setup.py로 문제를 한 번 세팅하거나 HTML 파일을 지정하세요.")
+        sys.exit(1)
+
+    backends = [name for name in PARSER_BACKENDS
+                if name == 'html.parser' or importlib.util.find_spec(name) is not None]
+    skipped = [name for name in PARSER_BACKENDS if name not in backends]
+    if skipped:
+        print(f"[!] 설치되지 않은 파서는 건너뜁니다: {', '.join(skipped)}")
+
+    # 기존 방식 (html.parser로 전체 트리) 대비 비교
+    methods = [('html.parser', False)] + [(name, True) for name in backends]
+    labels = [f"{'선택' if targeted else '전체'}({name})" for name, targeted in methods]
+
+    print(f"[*] 문제 페이지 {len(pages)}개, 페이지당 {args.repeat}회 반복 (중앙값, ms)\n")
+    print(pad('페이지', 16) + ''.join(pad(label, 22, right=True) for label in labels))
+    print("-" * (16 + 22 * len(labels)))
+
+    totals = [0.0] * len(methods)
+    mismatches = []
+    for name, html in pages:
+        baseline = parse_problem_page(html, parser='html.parser', targeted=False)
+        if baseline is None:
+            print(f"[X] {name}: 문제 제목(#problem_title)이 없어 문제 페이지로 파싱할 수 없습니다.")
+            sys.exit(1)
+        times = []
+        for i, (backend, targeted) in enumerate(methods):
+            if parse_problem_page(html, parser=backend, targeted=targeted) != baseline:
+                mismatches.append((name, labels[i]))
+            times.append(time_parse(html, backend, targeted, args.repeat))
+            totals[i] += times[-1]
+        print(format_row(name, times))
+
+    print("-" * (16 + 22 * len(labels)))
+    averages = [total / len(pages) for total in totals]
+    print(format_row('평균', averages))
+
+    print()
+    if mismatches:
+        for name, label in mismatches:
+            print(f"[X] {name}: {label} 결과가 전체 트리 파싱과 다릅니다.")
+        sys.exit(1)
+
+    print("[O] 모든 페이지에서 필요한 요소만 파싱한 결과(PROBLEM_STRAINER)가 전체 트리 파싱과 같습니다.")
+
+
+def format_row(name: str, times: List[float]) -> str:
+    """첫 번째 열(기존 방식) 대비 배속을 붙여 한 줄로 만듭니다. (예: '0.78 (1.3x)')"""
+    cells = [f"{times[0] * 1000:.2f}"]
+    cells += [f"{t * 1000:.2f} ({times[0] / t:.1f}x)" for t in times[1:]]
+    return pad(name, 16) + ''.join(pad(cell, 22, right=True) for cell in cells)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,16 @@
+"""
+저장소 경로 모듈
+여러 도구가 함께 쓰는 디렉토리 경로를 한곳에 둡니다.
+
+경로만 필요한 모듈(실행기, 검증 도구 등)이 번들러나 requests를 쓰는 모듈을 import 하지 않도록
+다른 도구 모듈은 import 하지 않습니다.
+"""
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+
+# 응답 캐시, 인덱스, 프로파일 결과 등을 저장하는 디렉토리
+CACHE_DIR = ROOT_DIR / ".boj_cache"
+
+# 풀이 라이브러리(boj_lib 패키지)가 있는 디렉토리
+LIB_DIR = ROOT_DIR / "lib"
@@ -0,0 +1,319 @@
+"""
+프로파일러 모듈
+테스트 케이스 하나를 실행하는 자식 프로세스 안에서 solution.py를 프로파일링합니다.
+
+- 시간 (cProfile, 결정적 프로파일러): 누적 시간/자체 시간 상위 함수와
+  템플릿 함수(read_input, solve, write_output)별 시간을 보여줍니다.
+  결과는 .prof 파일로 저장하므로 `python -m pstats <파일>`이나 snakeviz 등으로 다시 볼 수 있습니다.
+- 메모리 (tracemalloc): Python 객체에 할당된 메모리의 최댓값과, 최대일 때 메모리를 많이 차지한 줄을 보여줍니다.
+"""
+import os
+import sys
+import json
+import pstats
+import cProfile
+import linecache
+import threading
+import tracemalloc
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from boj_paths import CACHE_DIR, LIB_DIR
+from boj_runner import RunResult, SpawnRunner, pad
+
+PROFILE_DIR = CACHE_DIR / "profiles"
+
+# 프로파일링은 실행이 몇 배 느려지므로 문제의 시간 제한 대신 넉넉한 시간 초과만 사용
+PROFILE_TIMEOUT = 60
+
+# 생성된 solution.py 템플릿의 단계 (함수 이름, 표시 이름)
+PHASES = (('read_input', '입력 (read_input)'), ('solve', '풀이 (solve)'), ('write_output', '출력 (write_output)'))
+
+# 메모리 제한의 이 비율을 넘으면 경고
+MEMORY_WARNING_RATIO = 0.8
+
+# 메모리 스냅샷: 할당량이 마지막 스냅샷보다 이 배수 이상 늘었는지 SAMPLE_INTERVAL초마다 확인
+SNAPSHOT_GROWTH = 1.1
+SAMPLE_INTERVAL = 0.01
+
+# 결과에서 뺄 프로파일러 자체의 호출 (solution.py를 실행하는 exec, 프로파일러 종료)
+_HIDDEN = {'<built-in method builtins.exec>', "<method 'disable' of '_lsprof.Profiler' objects>"}
+
+
+def profile_path(problem_dir: Path, case: str) -> Path:
+    """케이스의 .prof 파일 기본 경로 (.boj_cache/profiles/<문제 디렉토리>_<케이스>.prof)"""
+    return PROFILE_DIR / f"{Path(problem_dir).name}_{case}.prof"
+
+
+def profile_case(solution_path: Path, input_path: Path, prof_path: Path,
+                 stdout_path: Optional[Path] = None, cwd: Optional[Path] = None) -> RunResult:
+    """
+    solution.py를 cProfile로 감싸서 새 인터프리터에서 실행하고 결과를 prof_path에 저장합니다.
+
+    포크 서버와 달리 매번 새 인터프리터를 띄우지만, 측정 대상은 solution.py 실행 부분뿐입니다.
+    """
+    prof_path = Path(prof_path)
+    prof_path.parent.mkdir(parents=True, exist_ok=True)
+    if prof_path.exists():
+        prof_path.unlink()
+
+    runner = SpawnRunner(Path(__file__).resolve(), cwd=cwd)
+    return runner.run(input_path, timeout=PROFILE_TIMEOUT, stdout_path=stdout_path,
+                      args=('--child', prof_path.resolve(), Path(solution_path).resolve()))
+
+
+def load_rows(prof_path: Path) -> List[Dict]:
+    """
+    .prof 파일의 함수별 통계
+
+    Returns:
+        {'file', 'line', 'name', 'calls', 'self', 'cumulative'} 딕셔너리 리스트 (시간은 초)
+    """
+    stats = pstats.Stats(str(prof_path))
+    rows = []
+    for (filename, line, name), (_, calls, self_time, cumulative, _) in stats.stats.items():
+        if filename == '~' and name in _HIDDEN:
+            continue
+        rows.append({'file': filename, 'line': line, 'name': name, 'calls': calls,
+                     'self': self_time, 'cumulative': cumulative})
+    return rows
+
+
+def phase_times(rows: List[Dict], solution_path: Path) -> Optional[List[tuple]]:
+    """
+    템플릿 단계별 누적 시간
+
+    solution.py에 read_input/solve/write_output이 없으면 None을 반환합니다.
+
+    Returns:
+        (표시 이름, 초) 튜플 리스트. 마지막은 solution.py 전체에서 세 단계를 뺀 나머지 (import, 최상위 코드)
+    """
+    solution = os.path.abspath(solution_path)
+    own = {row['name']: row for row in rows if row['file'] == solution}
+    if '<module>' not in own or not any(name in own for name, _ in PHASES):
+        return None
+
+    phases = [(label, own[name]['cumulative'] if name in own else 0.0) for name, label in PHASES]
+    rest = own['<module>']['cumulative'] - sum(seconds for _, seconds in phases)
+    return phases + [('그 외 (import, 최상위 코드)', max(rest, 0.0))]
+
+
+def format_function(row: Dict, base_dir: Path) -> str:
+    """함수 표시 이름 (solution.py 디렉토리 안이면 상대 경로, 표준 라이브러리는 파일 이름만)"""
+    if row['file'] == '~':
+        # 내장 함수 ('<built-in method builtins.sorted>' 등)
+        return row['name']
+    path = Path(row['file'])
+    try:
+        location = str(path.relative_to(base_dir))
+    except ValueError:
+        location = path.name
+    return f"{location}:{row['line']}({row['name']})"
+
+
+def print_report(prof_path: Path, solution_path: Path, top: int = 15):
+    """누적 시간/자체 시간 상위 함수와 템플릿 단계별 시간을 출력합니다."""
+    rows = load_rows(prof_path)
+    base_dir = Path(solution_path).resolve().parent
+
+    phases = phase_times(rows, Path(solution_path).resolve())
+    if phases:
+        total = sum(seconds for _, seconds in phases) or 1e-9
+        print("[단계별 시간]")
+        for label, seconds in phases:
+            print(pad(label, 30) + pad(f"{seconds * 1000:.1f} ms", 12, right=True)
+                  + pad(f"{seconds / total * 100:.1f}%", 8, right=True))
+        print()
+
+    for key, title in (('cumulative', '누적 시간'), ('self', '자체 시간')):
+        print(f"[{title} 상위 {top}개]")
+        print(pad('누적', 10, right=True) + pad('자체', 10, right=True)
+              + pad('호출 수', 10, right=True) + "  함수")
+        for row in sorted(rows, key=lambda r: r[key], reverse=True)[:top]:
+            print(pad(f"{row['cumulative'] * 1000:.1f}", 10, right=True)
+                  + pad(f"{row['self'] * 1000:.1f}", 10, right=True)
+                  + pad(f"{row['calls']:,}", 10, right=True)
+                  + "  " + format_function(row, base_dir))
+        print()
+
+    print("(시간 단위: ms, 프로파일러 때문에 실제 실행보다 느리게 측정됨)")
+
+
+def memory_profile_case(solution_path: Path, input_path: Path, report_path: Path,
+                        stdout_path: Optional[Path] = None, cwd: Optional[Path] = None,
+                        top: int = 10) -> Tuple[RunResult, Optional[Dict]]:
+    """
+    solution.py를 tracemalloc을 켠 새 인터프리터에서 실행합니다.
+
+    Returns:
+        (실행 결과, 메모리 보고서 또는 None) 튜플. 보고서는
+        {'peak': 최대 할당량, 'snapshot': 스냅샷 시점의 할당량,
+         'lines': [{'file', 'line', 'size', 'count'}, ...]} (크기는 바이트)
+    """
+    report_path = Path(report_path)
+    if report_path.exists():
+        report_path.unlink()
+
+    runner = SpawnRunner(Path(__file__).resolve(), cwd=cwd)
+    result = runner.run(input_path, timeout=PROFILE_TIMEOUT, stdout_path=stdout_path,
+                        args=('--child-memory', report_path.resolve(), Path(solution_path).resolve(), top))
+    if not report_path.exists():
+        return result, None
+    return result, json.loads(report_path.read_text(encoding='utf-8'))
+
+
+def format_bytes(size: int) -> str:
+    """바이트 수를 KB/MB 단위 문자열로"""
+    if size < 1024 * 1024:
+        return f"{size / 1024:.1f} KB"
+    return f"{size / 1024 / 1024:.1f} MB"
+
+
+def print_memory_report(report: Dict, solution_path: Path, limit_mb: Optional[float] = None) -> bool:
+    """
+    최대 할당량과 할당이 많은 줄을 출력하고, 메모리 제한에 가까우면 경고합니다.
+
+    Returns:
+        최대 할당량이 메모리 제한 이하인지 여부 (제한이 없으면 True)
+    """
+    base_dir = Path(solution_path).resolve().parent
+    peak_mb = report['peak'] / 1024 / 1024
+    line = f"최대 할당량: {format_bytes(report['peak'])}"
+    if limit_mb:
+        line += f" (메모리 제한 {limit_mb:g}MB의 {peak_mb / limit_mb * 100:.0f}%)"
+    print(line)
+
+    if report['lines']:
+        print(f"최대일 때 할당이 많은 줄 (스냅샷 {format_bytes(report['snapshot'])} 기준)")
+        for stat in report['lines']:
+            location = format_function({'file': stat['file'], 'line': stat['line'], 'name': ''}, base_dir)
+            code = linecache.getline(stat['file'], stat['line']).strip()
+            print(pad(format_bytes(stat['size']), 12, right=True)
+                  + pad(f"{stat['count']:,}개", 14, right=True)
+                  + f"  {location[:-2]}  {code}")
+
+    if not limit_mb:
+        return True
+    if peak_mb > limit_mb:
+        print("[X] 최대 할당량이 메모리 제한을 넘었습니다.")
+        return False
+    if peak_mb >= limit_mb * MEMORY_WARNING_RATIO:
+        print(f"[!] 최대 할당량이 메모리 제한의 {MEMORY_WARNING_RATIO * 100:.0f}%를 넘었습니다. "
+              f"(인터프리터 자체 메모리는 포함되지 않음)")
+    return True
+
+
+def _prepare_child(solution_path: str, args: List[str]) -> tuple:
+    """solution.py를 직접 실행한 것처럼 설정하고 (코드, 전역 이름 공간)을 반환합니다."""
+    sys.argv = [solution_path, *args]
+    # 직접 실행할 때처럼 solution.py의 디렉토리를 import 경로 맨 앞에 둠 (tools/ 대신)
+    sys.path[0] = os.path.dirname(solution_path)
+
+    with open(solution_path, 'rb') as f:
+        code = compile(f.read(), solution_path, 'exec')
+    return code, {'__name__': '__main__', '__file__': solution_path, '__builtins__': __builtins__}
+
+
+class _PeakSampler:
+    """
+    할당량이 늘 때마다 tracemalloc 스냅샷을 찍어서 최대일 때와 가까운 스냅샷을 남기는 샘플러
+
+    스냅샷 자체도 추적되는 메모리를 쓰므로, 스냅샷을 찍은 뒤 최댓값을 초기화하고
+    이후 최댓값에서 살아 있는 스냅샷의 크기를 빼서 풀이가 쓴 최대 할당량을 계산합니다.
+    """
+
+    def __init__(self):
+        self.snapshot = None
+        self.snapshot_size = 0
+        self.peak = 0
+        self._overhead = 0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+        self.sample()
+
+    def _run(self):
+        while not self._stop.wait(SAMPLE_INTERVAL):
+            self.sample()
+
+    def sample(self):
+        current, peak = tracemalloc.get_traced_memory()
+        self.peak = max(self.peak, peak - self._overhead)
+        if current - self._overhead <= self.snapshot_size * SNAPSHOT_GROWTH:
+            return
+
+        self.snapshot = None
+        before = tracemalloc.get_traced_memory()[0]
+        snapshot = tracemalloc.take_snapshot()
+        self._overhead = tracemalloc.get_traced_memory()[0] - before
+        tracemalloc.reset_peak()
+        self.snapshot = snapshot
+        self.snapshot_size = before
+
+
+def _run_child(prof_path: str, solution_path: str, args: List[str]):
+    """
+    자식 프로세스 본체: solution.py를 직접 실행한 것처럼 설정하고 cProfile로 실행합니다.
+
+    runpy 대신 직접 compile/exec 해서 통계에 solution.py 실행 부분만 남깁니다.
+    예외나 sys.exit()로 끝나도 그때까지의 통계를 저장하고, 원래 종료 방식을 그대로 따릅니다.
+    """
+    code, namespace = _prepare_child(solution_path, args)
+
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        exec(code, namespace)
+    finally:
+        profiler.disable()
+        profiler.dump_stats(prof_path)
+        sys.stdout.flush()
+
+
+def _run_memory_child(report_path: str, solution_path: str, top: int, args: List[str]):
+    """
+    자식 프로세스 본체: tracemalloc을 켜고 solution.py를 실행한 뒤 메모리 보고서를 JSON으로 저장합니다.
+
+    할당이 많은 줄은 풀이 디렉토리와 lib/ 안의 줄만 보여줍니다. (최대 할당량은 모든 할당 기준)
+
+    예외나 sys.exit()로 끝나도 그때까지의 보고서를 저장합니다.
+    """
+    code, namespace = _prepare_child(solution_path, args)
+
+    tracemalloc.start()
+    sampler = _PeakSampler()
+    sampler.start()
+    try:
+        exec(code, namespace)
+    finally:
+        sampler.stop()
+        tracemalloc.stop()
+
+        lines = []
+        if sampler.snapshot is not None:
+            # 풀이 디렉토리와 lib/(boj_lib)의 줄만 남김 (import 과정, 표준 라이브러리, 프로파일러 자체의 할당은 제외)
+            snapshot = sampler.snapshot.filter_traces([
+                tracemalloc.Filter(True, os.path.join(os.path.dirname(solution_path), '*')),
+                tracemalloc.Filter(True, os.path.join(str(LIB_DIR), '*')),
+            ])
+            for stat in snapshot.statistics('lineno')[:top]:
+                frame = stat.traceback[0]
+                lines.append({'file': frame.filename, 'line': frame.lineno,
+                              'size': stat.size, 'count': stat.count})
+
+        with open(report_path, 'w', encoding='utf-8') as f:
+            json.dump({'peak': sampler.peak, 'snapshot': sampler.snapshot_size, 'lines': lines}, f)
+        sys.stdout.flush()
+
+
+if __name__ == "__main__":
+    if len(sys.argv) >= 4 and sys.argv[1] == '--child':
+        _run_child(sys.argv[2], sys.argv[3], sys.argv[4:])
+    elif len(sys.argv) >= 5 and sys.argv[1] == '--child-memory':
+        _run_memory_child(sys.argv[2], sys.argv[3], int(sys.argv[4]), sys.argv[5:])
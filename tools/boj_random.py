@@ -3,10 +3,55 @@
 solved.ac API를 사용하여 랜덤 문제를 가져와서 자동으로 세팅합니다.
 """
 import sys
+import json
 import argparse
 import random
-from boj_crawler import BOJCrawler
-from boj_setup import BOJSetup
+import threading
+from pathlib import Path
+from typing import List, Optional, Set
+from boj_paths import CACHE_DIR
+from boj_registry import ProblemRegistry
+
+
+class CandidatePool:
+    """
+    티어/태그 조건별 랜덤 후보 문제 풀
+
+    solved.ac 랜덤 검색 한 번에 50문제가 오므로, 남은 후보를 디스크에 저장해 두고
+    다음 선택에 재사용합니다. 후보가 모자랄 때만 API를 다시 호출합니다.
+    """
+
+    def __init__(self, path: Optional[Path] = None):
+        self.path = Path(path) if path else CACHE_DIR / "random_pool.json"
+        self._lock = threading.Lock()
+        self._pools = {}
+        if self.path.exists():
+            try:
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    self._pools = json.load(f)
+            except (OSError, ValueError):
+                self._pools = {}
+
+    def candidates(self, key: str) -> List[int]:
+        return list(self._pools.get(key, []))
+
+    def add(self, key: str, problem_ids: List[int]):
+        with self._lock:
+            pool = self._pools.setdefault(key, [])
+            known = set(pool)
+            pool.extend(pid for pid in problem_ids if pid not in known)
+
+    def remove(self, key: str, problem_ids: Set[int]):
+        with self._lock:
+            self._pools[key] = [pid for pid in self._pools.get(key, []) if pid not in problem_ids]
+
+    def save(self):
+        with self._lock:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_suffix('.tmp')
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(self._pools, f)
+            tmp_path.replace(self.path)
 
 
 class BOJRandom:
@@ -21,10 +66,18 @@ class BOJRandom:
         'ruby': list(range(26, 31)),      # Ruby V ~ I
     }
 
-    def __init__(self):
+    # 후보가 이 개수보다 적게 남으면 API로 한 페이지를 더 채움
+    MIN_POOL = 10
+
+    def __init__(self, base_dir: str = "problems", pool: Optional[CandidatePool] = None):
+        # requests/bs4를 불러오는 모듈은 실제로 문제를 고를 때만 import (--help를 빠르게)
+        from boj_crawler import BOJCrawler
+
+        self.base_dir = Path(base_dir)
         self.crawler = BOJCrawler()
+        self.pool = pool or CandidatePool()
 
-    def get_random_problem(self, tier: str = None, tag: str = None) -> int:
+    def get_random_problem(self, tier: str = None, tag: str = None) -> Optional[int]:
         """
         랜덤 문제를 가져옵니다.
 
@@ -33,31 +86,72 @@ class BOJRandom:
             tag: 알고리즘 태그 (예: dp, greedy, graph 등)
 
         Returns:
-            문제 번호
+            문제 번호 또는 None
         """
-        # solved.ac API 사용
-        problem_id = self.crawler.get_problem_from_solvedac(tier=tier, tag=tag)
+        problem_ids = self.get_random_problems(1, tier=tier, tag=tag)
+        return problem_ids[0] if problem_ids else None
 
-        if problem_id:
-            return problem_id
+    def get_random_problems(self, count: int, tier: str = None, tag: str = None) -> List[int]:
+        """
+        이미 세팅된 문제를 제외하고 랜덤 문제를 count개 고릅니다.
 
-        # API 실패 시 대체 방법: 간단한 랜덤 생성
-        print("⚠️  solved.ac API 사용 실패, 랜덤 문제 번호 생성...")
-        return random.randint(1000, 20000)
+        후보 풀에서 먼저 고르고, 모자라면 solved.ac에서 채웁니다.
+        API가 실패하면 풀에 남은 후보만 사용합니다.
+
+        Returns:
+            문제 번호 리스트 (후보가 모자라면 count개보다 적을 수 있음)
+        """
+        key = self.crawler.build_query(tier=tier, tag=tag).strip()
+        existing = self._existing_problem_ids()
+
+        def available() -> List[int]:
+            return [pid for pid in self.pool.candidates(key) if pid not in existing]
+
+        # 한 페이지에 새 후보가 없으면 (조건에 맞는 문제가 거의 다 세팅된 경우) 더 요청하지 않음
+        attempts = 0
+        while len(available()) < max(count, self.MIN_POOL) and attempts < max(3, count // 25 + 1):
+            attempts += 1
+            fetched = self.crawler.search_random_problems(tier=tier, tag=tag)
+            if not fetched:
+                if not available():
+                    print("⚠️  solved.ac API 사용 실패, 후보 풀도 비어 있습니다.")
+                break
+            before = len(available())
+            self.pool.add(key, fetched)
+            if len(available()) == before:
+                break
+
+        candidates = available()
+        random.shuffle(candidates)
+        picked = candidates[:count]
+
+        # 고른 문제와 이미 세팅된 문제는 풀에서 제거
+        self.pool.remove(key, set(picked) | existing)
+        self.pool.save()
+
+        return picked
+
+    def _existing_problem_ids(self) -> Set[int]:
+        """문제 디렉토리에 이미 세팅된 문제 번호들 (문제 디렉토리가 바뀌지 않았으면 레지스트리 인덱스를 그대로 사용)"""
+        return set(ProblemRegistry(self.base_dir).ids())
 
     def setup_random_problem(self, tier: str = None, tag: str = None,
-                            base_dir: str = "problems") -> bool:
+                            base_dir: str = None, count: int = 1) -> bool:
         """
         랜덤 문제를 가져와서 세팅합니다.
 
         Args:
             tier: 난이도 티어
             tag: 알고리즘 태그
-            base_dir: 문제를 저장할 디렉토리
+            base_dir: 문제를 저장할 디렉토리 (기본값: 생성 시 지정한 디렉토리)
+            count: 세팅할 문제 수
 
         Returns:
             성공 여부
         """
+        if base_dir:
+            self.base_dir = Path(base_dir)
+
         print("[*] 랜덤 문제를 선택하는 중...")
 
         if tier:
@@ -66,20 +160,29 @@ class BOJRandom:
             print(f"   태그: {tag}")
 
         # 랜덤 문제 번호 가져오기
-        problem_id = self.get_random_problem(tier=tier, tag=tag)
+        problem_ids = self.get_random_problems(count, tier=tier, tag=tag)
 
-        if not problem_id:
+        if not problem_ids:
             print("[X] 랜덤 문제를 가져오는데 실패했습니다.")
             return False
 
-        print(f"\n[+] 선택된 문제: {problem_id}번\n")
+        if len(problem_ids) < count:
+            print(f"[!] 조건에 맞는 새 문제가 {len(problem_ids)}개뿐입니다.")
+
+        print(f"\n[+] 선택된 문제: {', '.join(f'{pid}번' for pid in problem_ids)}\n")
 
         # 문제 세팅
-        setup = BOJSetup(base_dir)
-        return setup.setup_problem(problem_id)
+        from boj_setup import BOJSetup
+
+        if len(problem_ids) == 1:
+            setup = BOJSetup(str(self.base_dir))
+            return setup.setup_problem(problem_ids[0])
+
+        setup = BOJSetup(str(self.base_dir), jobs=min(8, len(problem_ids)))
+        return all(setup.setup_problems(problem_ids).values())
 
 
-def main():
+def main(argv: Optional[List[str]] = None):
     parser = argparse.ArgumentParser(
         description='백준 랜덤 문제를 가져와서 세팅합니다.',
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -89,6 +192,7 @@ def main():
   python boj_random.py --tier gold        # 골드 난이도 랜덤
   python boj_random.py --tier silver --tag dp    # 실버 + DP 태그
   python boj_random.py --tag greedy       # 그리디 태그 랜덤
+  python boj_random.py --tier gold --count 5     # 골드 문제 5개를 한 번에 세팅
 
 티어 목록:
   bronze, silver, gold, platinum, diamond, ruby
@@ -112,6 +216,13 @@ def main():
         help='알고리즘 태그 (예: dp, greedy, graph)'
     )
 
+    parser.add_argument(
+        '--count',
+        type=int,
+        default=1,
+        help='세팅할 문제 수 (기본값: 1)'
+    )
+
     parser.add_argument(
         '--dir',
         type=str,
@@ -119,14 +230,14 @@ def main():
         help='문제를 저장할 디렉토리 (기본값: problems)'
     )
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     # 랜덤 문제 세팅
-    random_picker = BOJRandom()
+    random_picker = BOJRandom(args.dir)
     success = random_picker.setup_random_problem(
         tier=args.tier,
         tag=args.tag,
-        base_dir=args.dir
+        count=max(1, args.count)
     )
 
     sys.exit(0 if success else 1)
@@ -0,0 +1,326 @@
+"""
+문제 레지스트리 모듈
+문제 번호 -> 문제 디렉토리, 시간/메모리 제한, 테스트 케이스 목록을 인덱스 파일에 저장해 두고,
+도구들이 매번 problems/ 디렉토리를 훑지 않고 바로 찾을 수 있게 합니다.
+
+인덱스 파일은 .boj_cache/registry_<문제 디렉토리 경로 해시>.json이며, 다음과 같이 필요한 부분만 갱신합니다.
+    - problems/의 수정 시각이 바뀌었을 때 (디렉토리 추가/삭제/이름 변경): 새로 생긴 디렉토리만 추가
+    - 문제 디렉토리, input/, output/, problem.json, README.md의 수정 시각이 바뀌었을 때: 그 문제만 다시 읽음
+"""
+import os
+import re
+import json
+import hashlib
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Union
+
+from boj_limits import LIMITS_FILE, load_limits
+from boj_paths import CACHE_DIR
+
+# 인덱스 형식이 바뀌면 올려서 기존 인덱스를 다시 만들게 함
+REGISTRY_VERSION = 1
+
+# 다른 풀이들을 두는 디렉토리 (문제 디렉토리 안)
+VARIANTS_DIR = "solutions"
+
+_DIR_NAME = re.compile(r'(\d+)_')
+_LEGACY_INPUT = re.compile(r'input(\d+)\.txt$')
+
+
+def parse_problem_id(dir_name: str) -> Optional[int]:
+    """'1000_A_B' 형식의 디렉토리 이름에서 문제 번호를 꺼냅니다."""
+    match = _DIR_NAME.match(dir_name)
+    return int(match.group(1)) if match else None
+
+
+def find_test_cases(problem_dir: Path) -> List[Tuple[Path, Path]]:
+    """
+    문제 디렉토리의 테스트 케이스를 번호 순서로 찾습니다.
+
+    input/N.txt, output/N.txt 형식을 사용하고, 없으면 이전 형식(inputN.txt, outputN.txt)을 찾습니다.
+    출력 파일이 없는 케이스도 포함하므로, 사용하는 쪽에서 출력 파일이 있는지 확인해야 합니다.
+
+    Returns:
+        (입력 파일, 출력 파일) 튜플 리스트
+    """
+    problem_dir = Path(problem_dir)
+
+    input_dir = problem_dir / "input"
+    if input_dir.is_dir():
+        numbered = [p for p in input_dir.glob("*.txt") if p.stem.isdigit()]
+        return [(p, problem_dir / "output" / p.name)
+                for p in sorted(numbered, key=lambda p: int(p.stem))]
+
+    legacy = []
+    for path in problem_dir.glob("input*.txt"):
+        match = _LEGACY_INPUT.match(path.name)
+        if match:
+            legacy.append((int(match.group(1)), path))
+    return [(path, problem_dir / f"output{num}.txt") for num, path in sorted(legacy)]
+
+
+def find_variants(problem_dir: Path) -> List[Tuple[str, Path]]:
+    """
+    문제 디렉토리의 풀이 변형들을 찾습니다.
+
+    solution.py는 제출하는 풀이이고, solutions/*.py는 같은 문제의 다른 풀이들입니다.
+    (예: solutions/naive.py, solutions/pattern_hash.py, 이름이 _로 시작하는 파일은 제외)
+
+    Returns:
+        (이름, 파일 경로) 튜플 리스트 (solution.py가 있으면 'solution'이 맨 앞, 나머지는 이름 순서)
+    """
+    problem_dir = Path(problem_dir)
+    variants = []
+
+    solution = problem_dir / "solution.py"
+    if solution.exists():
+        variants.append(('solution', solution))
+
+    for path in sorted((problem_dir / VARIANTS_DIR).glob("*.py")):
+        if not path.name.startswith('_'):
+            name = path.stem if path.stem != 'solution' else f"{VARIANTS_DIR}/{path.stem}"
+            variants.append((name, path))
+
+    return variants
+
+
+def resolve_problem_dir(problem_id: str, base_dir: Union[str, Path] = "problems") -> Optional[Path]:
+    """
+    도구 인자로 받은 문제 번호 또는 문제 디렉토리 경로를 문제 디렉토리로 바꿉니다.
+
+    Returns:
+        문제 디렉토리 또는 None (찾지 못한 경우)
+    """
+    path = Path(problem_id)
+    if path.is_dir():
+        return path
+    return ProblemRegistry(base_dir).find(problem_id)
+
+
+def case_number(input_file: Path) -> str:
+    """테스트 케이스 번호 ('input/3.txt'와 'input3.txt' 모두 '3')"""
+    match = _LEGACY_INPUT.match(input_file.name)
+    return match.group(1) if match else input_file.stem
+
+
+class ProblemRegistry:
+    """문제 번호로 문제 디렉토리와 제한, 테스트 케이스를 찾는 인덱스"""
+
+    # 같은 프로세스에서 여러 스레드가 인덱스를 갱신할 수 있음 (일괄 세팅)
+    _lock = threading.Lock()
+
+    def __init__(self, base_dir: Union[str, Path] = "problems"):
+        self.base_dir = Path(base_dir)
+        # 인덱스 파일을 problems/ 안에 두면 쓸 때마다 problems/의 수정 시각이 바뀌므로 캐시 디렉토리에 둠
+        key = hashlib.sha256(str(self.base_dir.resolve()).encode()).hexdigest()[:16]
+        self.path = CACHE_DIR / f"registry_{key}.json"
+        self._entries = {}
+        self._base_mtime = None
+        self._dirty = False
+        self._load()
+
+    def find(self, problem_id: Union[int, str]) -> Optional[Path]:
+        """문제 번호로 문제 디렉토리를 찾습니다. 없으면 None"""
+        entry = self.get(problem_id)
+        return entry['dir'] if entry else None
+
+    def get(self, problem_id: Union[int, str]) -> Optional[Dict]:
+        """
+        문제 정보를 반환합니다.
+
+        Returns:
+            {'id', 'dir', 'limits', 'cases', 'conflicts'} 딕셔너리 또는 None
+            (cases는 (입력 파일, 출력 파일) 튜플 리스트, conflicts는 같은 번호의 다른 디렉토리 이름들)
+        """
+        try:
+            problem_id = int(problem_id)
+        except (TypeError, ValueError):
+            return None
+
+        self._sync()
+
+        raw = self._entries.get(problem_id)
+        if raw is not None:
+            raw = self._refresh(problem_id, raw)
+        self._save()
+
+        return self._expand(raw) if raw else None
+
+    def describe(self, problem_dir: Path) -> Dict:
+        """
+        문제 디렉토리의 정보를 반환합니다.
+
+        레지스트리가 관리하는 디렉토리면 인덱스를 사용하고, 아니면 (직접 경로를 준 경우 등) 바로 읽습니다.
+        """
+        problem_dir = Path(problem_dir)
+        problem_id = parse_problem_id(problem_dir.name)
+
+        if problem_id is not None and problem_dir.resolve().parent == self.base_dir.resolve():
+            entry = self.get(problem_id)
+            if entry and entry['dir'].name == problem_dir.name:
+                return entry
+
+        return self._expand(self._scan_problem(problem_dir), problem_dir)
+
+    def register(self, problem_dir: Path) -> Dict:
+        """새로 만든 문제 디렉토리를 인덱스에 추가하거나 다시 읽습니다."""
+        problem_dir = Path(problem_dir)
+        problem_id = parse_problem_id(problem_dir.name)
+        if problem_id is None:
+            raise ValueError(f"문제 디렉토리 이름은 '번호_제목' 형식이어야 합니다: {problem_dir.name}")
+
+        with self._lock:
+            self._load()
+            self._entries[problem_id] = self._scan_problem(problem_dir)
+            self._dirty = True
+            self._save()
+
+        return self._expand(self._entries[problem_id])
+
+    def ids(self) -> List[int]:
+        """등록된 문제 번호 리스트"""
+        self._sync()
+        self._save()
+        return sorted(self._entries)
+
+    def _sync(self):
+        """problems/ 디렉토리에 추가/삭제된 문제를 반영합니다."""
+        try:
+            base_mtime = self.base_dir.stat().st_mtime_ns
+        except OSError:
+            self._entries = {}
+            return
+
+        if base_mtime == self._base_mtime:
+            return
+
+        found = {}
+        with os.scandir(self.base_dir) as it:
+            for entry in it:
+                problem_id = parse_problem_id(entry.name)
+                if problem_id is not None and entry.is_dir():
+                    found.setdefault(problem_id, []).append(entry.name)
+
+        entries = {}
+        for problem_id, names in found.items():
+            names.sort()
+            raw = self._entries.get(problem_id)
+            if raw is None or raw['dir'] not in names:
+                raw = self._scan_problem(self.base_dir / names[0])
+            raw['conflicts'] = [name for name in names if name != raw['dir']]
+            entries[problem_id] = raw
+
+        self._entries = entries
+        self._base_mtime = base_mtime
+        self._dirty = True
+
+    def _refresh(self, problem_id: int, raw: Dict) -> Optional[Dict]:
+        """문제 디렉토리가 바뀌었으면 다시 읽습니다."""
+        problem_dir = self.base_dir / raw['dir']
+        stamp = self._stamp(problem_dir)
+
+        if stamp is None:
+            del self._entries[problem_id]
+            self._dirty = True
+            return None
+
+        if stamp != raw['stamp']:
+            conflicts = raw.get('conflicts', [])
+            raw = self._scan_problem(problem_dir, stamp)
+            raw['conflicts'] = conflicts
+            self._entries[problem_id] = raw
+            self._dirty = True
+
+        return raw
+
+    def _scan_problem(self, problem_dir: Path, stamp: Optional[List[int]] = None) -> Dict:
+        """문제 디렉토리에서 제한과 테스트 케이스를 읽어 인덱스 항목을 만듭니다."""
+        cases = [
+            [str(input_file.relative_to(problem_dir)), str(output_file.relative_to(problem_dir))]
+            for input_file, output_file in find_test_cases(problem_dir)
+        ]
+        return {
+            'id': parse_problem_id(problem_dir.name),
+            'dir': problem_dir.name,
+            'stamp': stamp or self._stamp(problem_dir),
+            'limits': load_limits(problem_dir),
+            'cases': cases,
+            'conflicts': [],
+        }
+
+    def _expand(self, raw: Dict, problem_dir: Optional[Path] = None) -> Dict:
+        """인덱스 항목의 상대 경로를 실제 경로로 바꿉니다."""
+        problem_dir = problem_dir or self.base_dir / raw['dir']
+
+        return {
+            'id': raw['id'],
+            'dir': problem_dir,
+            'limits': raw['limits'],
+            'cases': [(problem_dir / input_name, problem_dir / output_name)
+                      for input_name, output_name in raw['cases']],
+            'conflicts': raw.get('conflicts', []),
+        }
+
+    @staticmethod
+    def _stamp(problem_dir: Path) -> Optional[List[int]]:
+        """
+        문제 정보가 바뀌었는지 확인할 수정 시각 목록. 문제 디렉토리가 없으면 None
+
+        디렉토리 수정 시각은 파일 추가/삭제에만 바뀌므로, 내용으로 제한을 읽는 파일들은 따로 확인합니다.
+        """
+        stamp = []
+        for path in (problem_dir, problem_dir / "input", problem_dir / "output",
+                     problem_dir / LIMITS_FILE, problem_dir / "README.md"):
+            try:
+                stamp.append(path.stat().st_mtime_ns)
+            except OSError:
+                if path == problem_dir:
+                    return None
+                stamp.append(0)
+        return stamp
+
+    def _load(self):
+        """인덱스 파일을 읽습니다. 없거나 손상되었으면 빈 인덱스에서 시작합니다."""
+        self._entries = {}
+        self._base_mtime = None
+        if not self.path.exists():
+            return
+
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+
+        if data.get('version') != REGISTRY_VERSION:
+            return
+
+        self._base_mtime = data.get('base_mtime')
+        self._entries = {int(problem_id): raw for problem_id, raw in data['problems'].items()}
+
+    def _save(self):
+        """바뀐 내용이 있으면 인덱스 파일을 씁니다."""
+        if not self._dirty:
+            return
+
+        data = {
+            'version': REGISTRY_VERSION,
+            'base_dir': str(self.base_dir.resolve()),
+            'base_mtime': self._base_mtime,
+            'problems': {str(problem_id): raw for problem_id, raw in sorted(self._entries.items())},
+        }
+
+        tmp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False)
+            tmp_path.replace(self.path)
+        except OSError:
+            # 쓸 수 없는 환경에서는 인덱스 없이 동작 (다음 실행에서 다시 훑음)
+            if tmp_path.exists():
+                tmp_path.unlink()
+            return
+
+        self._dirty = False
@@ -0,0 +1,747 @@
+"""
+solution.py 실행기 모듈
+테스트 케이스마다 solution.py를 실행하는 두 가지 방식을 제공합니다.
+
+- spawn: 케이스마다 새 인터프리터를 띄웁니다. (모든 OS에서 동작)
+- fork: 인터프리터와 solution.py의 import를 한 번만 로딩해 둔 포크 서버에서
+        케이스마다 자식 프로세스를 fork 합니다. 인터프리터 시작 비용이 빠지므로
+        측정 시간에는 풀이와 입출력 시간만 남습니다. (fork를 지원하는 OS 전용)
+
+두 방식 모두 lib/를 import 경로에 추가하므로 풀이에서 boj_lib을 그대로 import 할 수 있습니다.
+python 인자로 다른 인터프리터(python3.12, pypy3 등)를 지정할 수 있습니다. (기본값: 지금 실행 중인 인터프리터)
+"""
+import os
+import ast
+import sys
+import json
+import math
+import time
+import queue
+import runpy
+import shutil
+import signal
+import tempfile
+import threading
+import traceback
+import subprocess
+import unicodedata
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from boj_paths import LIB_DIR
+
+try:
+    import resource
+except ImportError:
+    # Windows에는 resource 모듈이 없어서 제한을 걸 수 없음
+    resource = None
+
+
+RUNNER_MODES = ('auto', 'fork', 'spawn')
+
+# 인터프리터를 따로 지정하지 않았을 때 비교할 인터프리터 (백준의 Python 3, PyPy3)
+DEFAULT_INTERPRETERS = ('python3', 'pypy3')
+
+# 인터프리터 구현 -> 백준 언어 이름
+IMPLEMENTATION_LANGUAGES = {
+    'CPython': 'Python 3',
+    'PyPy': 'PyPy3',
+}
+
+_PROBE_CODE = "import platform; print(platform.python_implementation(), platform.python_version())"
+
+
+class RunResult:
+    """
+    solution.py 한 번 실행한 결과
+
+    wall_time, cpu_time은 초 단위, max_rss는 KB 단위, output_size는 바이트 단위입니다.
+    자원 사용량을 측정할 수 없는 OS에서는 cpu_time, max_rss가 None 입니다.
+    limit_exceeded는 제한을 넘은 경우 'TLE', 'MLE', 'OLE' 중 하나, 아니면 None 입니다.
+    출력을 파일로 받은 경우(stdout_path) stdout은 빈 문자열입니다.
+    """
+
+    def __init__(self, stdout: str = "", stderr: str = "", returncode: int = 0,
+                 timed_out: bool = False, wall_time: float = 0.0,
+                 cpu_time: Optional[float] = None, max_rss: Optional[int] = None,
+                 output_size: int = 0, stdout_path: Optional[Path] = None):
+        self.stdout = stdout
+        self.stdout_path = stdout_path
+        self.output_size = output_size
+        self.stderr = stderr
+        self.returncode = returncode
+        self.timed_out = timed_out
+        self.wall_time = wall_time
+        self.cpu_time = cpu_time
+        self.max_rss = max_rss
+        self.limit_exceeded = None
+
+    @property
+    def verdict(self) -> Optional[str]:
+        """출력 비교 전에 정해지는 결과 (출력 초과, 시간 초과, 메모리 초과, 런타임 에러)"""
+        if self.limit_exceeded == 'OLE':
+            return "출력 초과"
+        if self.limit_exceeded == 'TLE':
+            return "시간 초과"
+        if self.limit_exceeded == 'MLE':
+            return "메모리 초과"
+        if self.returncode != 0:
+            return "런타임 에러"
+        return None
+
+
+class SpawnRunner:
+    """케이스마다 새 인터프리터를 띄워서 실행하는 실행기"""
+
+    name = 'spawn'
+
+    def __init__(self, solution_path: Path, cwd: Optional[Path] = None,
+                 limits: Optional[Dict] = None, python: Optional[str] = None):
+        self.solution_path = Path(solution_path)
+        self.cwd = cwd
+        self.limits = limits
+        self.python = python or sys.executable
+        # 실행 중인 자식 프로세스들 (cancel()에서 종료)
+        self._procs = set()
+        self._cancelled = False
+        self._lock = threading.Lock()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def run(self, input_path: Path, timeout: float, args: tuple = (),
+            stdout_path: Optional[Path] = None, output_limit: Optional[int] = None,
+            input_data: Optional[bytes] = None) -> RunResult:
+        """
+        입력 파일을 표준 입력으로 solution.py를 실행합니다. args는 명령행 인자로 전달됩니다.
+
+        stdout_path를 주면 출력을 메모리로 읽지 않고 그 파일에 남겨 둡니다. (큰 출력을 비교할 때)
+        output_limit(바이트)를 넘게 출력하면 더 쓰지 못하게 막고 출력 초과로 판정합니다.
+        input_data(이미 메모리에 읽어 둔 입력 파일 내용)를 주면 입력 파일을 다시 읽지 않고 그 내용을 입력으로 씁니다.
+        """
+        rlimits = (self.limits or output_limit) and resource
+        with _input_source(input_path, input_data) as source, \
+                open(source, 'rb') as stdin, \
+                (open(stdout_path, 'w+b') if stdout_path else tempfile.TemporaryFile()) as stdout, \
+                tempfile.TemporaryFile() as stderr:
+            start = time.perf_counter()
+            proc = subprocess.Popen(
+                [self.python, str(self.solution_path), *map(str, args)],
+                stdin=stdin,
+                stdout=stdout,
+                stderr=stderr,
+                cwd=self.cwd,
+                env=_child_env(),
+                preexec_fn=(lambda: _apply_rlimits(self.limits, output_limit)) if rlimits else None
+            )
+            with self._lock:
+                self._procs.add(proc)
+                if self._cancelled:
+                    proc.kill()
+            try:
+                timed_out, usage = _wait_with_usage(proc, timeout)
+            finally:
+                with self._lock:
+                    self._procs.discard(proc)
+            wall_time = time.perf_counter() - start
+
+            output_size = stdout.seek(0, os.SEEK_END)
+            stdout.seek(0)
+            stderr.seek(0)
+            result = RunResult(
+                stdout="" if stdout_path else _decode(stdout.read()),
+                stderr=_decode(stderr.read()),
+                returncode=proc.returncode,
+                timed_out=timed_out,
+                wall_time=wall_time,
+                output_size=output_size,
+                stdout_path=stdout_path
+            )
+
+        _apply_usage(result, usage)
+        _check_limits(result, self.limits, output_limit)
+        return result
+
+    def cancel(self):
+        """실행 중인 케이스를 모두 종료합니다. 이후에 시작하는 케이스도 바로 종료됩니다."""
+        with self._lock:
+            self._cancelled = True
+            for proc in self._procs:
+                proc.kill()
+
+    def close(self):
+        pass
+
+
+class ForkServerRunner:
+    """
+    미리 로딩된 포크 서버에서 케이스마다 자식을 fork 해서 실행하는 실행기
+
+    포크 서버 하나는 한 번에 한 케이스만 처리하므로, 동시에 workers개의 케이스를
+    실행할 수 있도록 필요할 때마다 서버를 최대 workers개까지 띄웁니다.
+    """
+
+    name = 'fork'
+
+    def __init__(self, solution_path: Path, cwd: Optional[Path] = None, workers: int = 1,
+                 limits: Optional[Dict] = None, python: Optional[str] = None):
+        if not hasattr(os, 'fork'):
+            raise RuntimeError("이 OS는 fork를 지원하지 않습니다.")
+
+        self.solution_path = Path(solution_path).resolve()
+        self.cwd = cwd
+        self.workers = max(1, workers)
+        self.limits = limits
+        self.python = python or sys.executable
+        self._idle = queue.Queue()
+        self._servers = []
+        # 서버 -> 그 서버에서 실행 중인 자식의 pid (cancel()에서 종료)
+        self._running = {}
+        self._cancelled = False
+        self._lock = threading.RLock()
+
+        # 첫 서버는 바로 띄워서 solution.py를 로딩할 수 있는지 확인
+        self._idle.put(self._start_server())
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def _start_server(self) -> subprocess.Popen:
+        """포크 서버를 띄우고 준비 완료 신호를 기다립니다."""
+        server = subprocess.Popen(
+            [self.python, str(Path(__file__).resolve()), '--serve', str(self.solution_path)],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            cwd=self.cwd
+        )
+        self._servers.append(server)
+
+        reply = _read_reply(server)
+        if not reply or 'error' in reply:
+            self._stop_server(server)
+            error = reply.get('error') if reply else "포크 서버가 응답하지 않습니다."
+            raise RuntimeError(f"포크 서버 시작 실패: {error}")
+
+        return server
+
+    def _acquire(self) -> subprocess.Popen:
+        """쉬고 있는 서버를 가져오거나, 여유가 있으면 새로 띄웁니다."""
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+
+        with self._lock:
+            if len(self._servers) < self.workers:
+                return self._start_server()
+
+        return self._idle.get()
+
+    def run(self, input_path: Path, timeout: float, args: tuple = (),
+            stdout_path: Optional[Path] = None, output_limit: Optional[int] = None,
+            input_data: Optional[bytes] = None) -> RunResult:
+        """
+        포크 서버에 케이스 하나를 맡기고 결과를 기다립니다. args는 명령행 인자로 전달됩니다.
+
+        stdout_path, output_limit, input_data는 SpawnRunner.run()과 같습니다.
+        """
+        server = self._acquire()
+
+        with tempfile.TemporaryDirectory(prefix='boj_run_') as tmp_dir, \
+                _input_source(input_path, input_data) as source:
+            output_path = Path(stdout_path) if stdout_path else Path(tmp_dir) / 'stdout'
+            stderr_path = Path(tmp_dir) / 'stderr'
+            request = {
+                'input': str(source),
+                'stdout': str(output_path.resolve()),
+                'stderr': str(stderr_path),
+                'timeout': timeout,
+                'limits': self.limits,
+                'output_limit': output_limit,
+                'args': [str(arg) for arg in args],
+            }
+
+            try:
+                server.stdin.write(json.dumps(request).encode() + b'\n')
+                server.stdin.flush()
+                # 서버는 fork 직후 자식의 pid를, 자식이 끝나면 실행 결과를 보냄
+                reply = _read_reply(server)
+                if reply and 'pid' in reply:
+                    self._track(server, reply['pid'])
+                    try:
+                        reply = _read_reply(server)
+                    finally:
+                        self._track(server, None)
+            except OSError:
+                reply = None
+
+            if not reply:
+                self._stop_server(server)
+                raise RuntimeError("포크 서버가 비정상 종료되었습니다.")
+
+            self._idle.put(server)
+
+            exists = output_path.exists()
+            result = RunResult(
+                stdout=_decode(output_path.read_bytes()) if exists and not stdout_path else "",
+                stderr=_decode(stderr_path.read_bytes()) if stderr_path.exists() else "",
+                returncode=reply['returncode'],
+                timed_out=reply['returncode'] == -signal.SIGALRM,
+                wall_time=reply['wall_time'],
+                cpu_time=reply['cpu_time'],
+                max_rss=reply['max_rss'],
+                output_size=output_path.stat().st_size if exists else 0,
+                stdout_path=stdout_path
+            )
+
+        _check_limits(result, self.limits, output_limit)
+        return result
+
+    def _track(self, server: subprocess.Popen, pid: Optional[int]):
+        """서버에서 실행 중인 자식을 기록합니다. (pid가 None이면 끝난 것) 이미 취소된 경우 바로 종료"""
+        with self._lock:
+            if pid is None:
+                self._running.pop(server, None)
+                return
+            self._running[server] = pid
+            if self._cancelled:
+                _kill_pid(pid)
+
+    def cancel(self):
+        """실행 중인 케이스를 모두 종료합니다. 이후에 시작하는 케이스도 바로 종료됩니다."""
+        with self._lock:
+            self._cancelled = True
+            for pid in self._running.values():
+                _kill_pid(pid)
+
+    def _stop_server(self, server: subprocess.Popen):
+        """포크 서버를 종료합니다."""
+        with self._lock:
+            if server in self._servers:
+                self._servers.remove(server)
+        try:
+            server.stdin.close()
+            server.wait(timeout=1)
+        except (OSError, subprocess.TimeoutExpired):
+            server.kill()
+            server.wait()
+
+    def close(self):
+        for server in list(self._servers):
+            self._stop_server(server)
+
+
+def create_runner(solution_path: Path, mode: str = 'auto', cwd: Optional[Path] = None,
+                  workers: int = 1, limits: Optional[Dict] = None, python: Optional[str] = None):
+    """
+    실행 방식에 맞는 실행기를 생성합니다.
+
+    fork 실행기를 만들 수 없는 경우(fork 미지원 OS, solution.py 로딩 실패 등)에는
+    spawn 실행기로 대체합니다.
+
+    Args:
+        solution_path: solution.py 경로
+        mode: 'auto', 'fork', 'spawn' 중 하나
+        cwd: 실행 디렉토리
+        workers: 동시에 실행할 케이스 수
+        limits: {'time': 초, 'memory': MB} 형식의 제한 (None이면 제한 없음)
+        python: 실행할 인터프리터 (None이면 지금 실행 중인 인터프리터)
+
+    Returns:
+        SpawnRunner 또는 ForkServerRunner
+    """
+    if mode in ('auto', 'fork') and hasattr(os, 'fork'):
+        try:
+            return ForkServerRunner(solution_path, cwd=cwd, workers=workers, limits=limits, python=python)
+        except RuntimeError as e:
+            print(f"[!] {e}")
+            print("[!] spawn 방식으로 실행합니다.")
+    elif mode == 'fork':
+        print("[!] 이 OS는 fork를 지원하지 않아 spawn 방식으로 실행합니다.")
+
+    return SpawnRunner(solution_path, cwd=cwd, limits=limits, python=python)
+
+
+def find_interpreters(names: List[str]) -> Tuple[List[Dict], List[Tuple[str, str]]]:
+    """
+    PATH에서 인터프리터들을 찾고, 실제로 실행되는지 확인합니다.
+
+    pyenv shim처럼 PATH에는 있지만 실행되지 않는 인터프리터도 없는 것으로 처리합니다.
+
+    Args:
+        names: 인터프리터 이름 또는 경로 리스트 (예: ['python3.11', 'pypy3'])
+
+    Returns:
+        (찾은 인터프리터 리스트, (이름, 이유) 리스트) 튜플.
+        인터프리터는 {'name', 'path', 'implementation', 'version', 'language'} 딕셔너리
+        (language는 백준 언어 이름, 알 수 없는 구현이면 None)
+    """
+    found = []
+    missing = []
+    for name in names:
+        path = shutil.which(name)
+        if not path:
+            missing.append((name, "PATH에 없음"))
+            continue
+
+        try:
+            probe = subprocess.run([path, '-c', _PROBE_CODE], capture_output=True, timeout=30)
+        except (OSError, subprocess.TimeoutExpired) as e:
+            missing.append((name, f"실행 실패 ({e})"))
+            continue
+        if probe.returncode != 0 or len(probe.stdout.split()) != 2:
+            reason = _decode(probe.stderr).strip().splitlines()
+            missing.append((name, f"실행 실패 ({reason[0] if reason else f'종료 코드 {probe.returncode}'})"))
+            continue
+
+        implementation, version = _decode(probe.stdout).split()
+        found.append({
+            'name': name,
+            'path': path,
+            'implementation': implementation,
+            'version': version,
+            'language': IMPLEMENTATION_LANGUAGES.get(implementation),
+        })
+    return found, missing
+
+
+def limits_timeout(limits: Optional[Dict], default: float) -> float:
+    """
+    제한에 맞는 실제 대기 시간(wall)을 계산합니다.
+
+    CPU 시간 제한은 rlimit으로 걸리므로, 입력 대기 등으로 멈춘 경우만 잡으면 됩니다.
+    """
+    if not limits:
+        return default
+    return limits['time'] * 2 + 1
+
+
+def solution_imports(solution_path: Path) -> Optional[str]:
+    """
+    포크 서버가 미리 로딩하는 solution.py의 최상위 import 문들
+
+    풀이를 고친 뒤 이 값이 그대로면 실행 중인 포크 서버를 계속 써도 됩니다.
+    (자식은 매번 solution.py를 새로 읽어서 실행하므로 본문 변경은 바로 반영됨)
+
+    Returns:
+        import 문들을 이어 붙인 문자열 또는 None (파일을 읽을 수 없거나 문법 오류인 경우)
+    """
+    try:
+        with open(solution_path, 'rb') as f:
+            tree = ast.parse(f.read(), filename=str(solution_path))
+    except (OSError, SyntaxError, ValueError):
+        return None
+
+    return '\n'.join(ast.dump(node) for node in _top_level_imports(tree))
+
+
+def print_usage_table(rows: list):
+    """
+    케이스별 실행 시간, CPU 시간, 최대 메모리 사용량을 표로 출력합니다.
+
+    가장 오래 걸린 케이스에는 표시를 붙입니다.
+
+    Args:
+        rows: (케이스 이름, 결과 문자열, RunResult 또는 None) 튜플 리스트
+    """
+    measured = [result for _, _, result in rows if result]
+    slowest = max(measured, key=lambda r: r.cpu_time or r.wall_time, default=None)
+
+    print(pad('케이스', 8) + pad('결과', 12)
+          + pad('실행 시간', 12, right=True) + pad('CPU 시간', 12, right=True)
+          + pad('메모리', 12, right=True))
+    print("-" * 56)
+    for name, verdict, result in rows:
+        wall = cpu = rss = "-"
+        mark = ""
+        if result:
+            wall = f"{result.wall_time * 1000:.1f} ms"
+            if result.cpu_time is not None:
+                cpu = f"{result.cpu_time * 1000:.1f} ms"
+            if result.max_rss is not None:
+                rss = f"{result.max_rss / 1024:.1f} MB"
+            if len(measured) > 1 and result is slowest:
+                mark = "  <- 최대"
+
+        print(pad(str(name), 8) + pad(verdict, 12)
+              + pad(wall, 12, right=True) + pad(cpu, 12, right=True)
+              + pad(rss, 12, right=True) + mark)
+
+
+def pad(text: str, width: int, right: bool = False) -> str:
+    """한글 폭(2칸)을 고려해서 문자열을 정렬합니다."""
+    size = sum(2 if unicodedata.east_asian_width(ch) in 'WF' else 1 for ch in text)
+    fill = ' ' * max(0, width - size)
+    return fill + text if right else text + fill
+
+
+@contextmanager
+def _input_source(input_path: Path, input_data: Optional[bytes]) -> Iterator[Path]:
+    """
+    자식 프로세스가 표준 입력으로 열 파일의 절대 경로
+
+    input_data가 있으면 메모리 파일(memfd)에 써서 /proc/<pid>/fd/<fd> 경로를 돌려주므로,
+    포크 서버도 디스크의 입력 파일을 다시 읽지 않습니다. (memfd가 없는 OS에서는 입력 파일 경로)
+    """
+    if input_data is None or not hasattr(os, 'memfd_create'):
+        yield Path(input_path).resolve()
+        return
+
+    fd = os.memfd_create('boj_input')
+    try:
+        with open(fd, 'wb', closefd=False) as f:
+            f.write(input_data)
+        yield Path(f"/proc/{os.getpid()}/fd/{fd}")
+    finally:
+        os.close(fd)
+
+
+def _wait_with_usage(proc: subprocess.Popen, timeout: float) -> tuple:
+    """
+    자식 프로세스가 끝날 때까지 기다리고 자원 사용량을 가져옵니다.
+
+    Returns:
+        (시간 초과 여부, resource.struct_rusage 또는 None) 튜플
+    """
+    if not hasattr(os, 'wait4'):
+        try:
+            proc.wait(timeout=timeout)
+            return False, None
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.wait()
+            return True, None
+
+    expired = threading.Event()
+
+    def kill():
+        expired.set()
+        proc.kill()
+
+    timer = threading.Timer(timeout, kill)
+    timer.start()
+    try:
+        _, status, usage = os.wait4(proc.pid, 0)
+    finally:
+        timer.cancel()
+
+    proc.returncode = os.waitstatus_to_exitcode(status)
+    return expired.is_set(), usage
+
+
+def _child_env() -> Dict[str, str]:
+    """lib/를 PYTHONPATH 앞에 추가한 환경 변수 (spawn 실행기의 자식용)"""
+    env = dict(os.environ)
+    paths = [str(LIB_DIR)] + ([env['PYTHONPATH']] if env.get('PYTHONPATH') else [])
+    env['PYTHONPATH'] = os.pathsep.join(paths)
+    return env
+
+
+def _apply_usage(result: RunResult, usage):
+    """wait4가 돌려준 자원 사용량을 실행 결과에 기록합니다."""
+    if usage is None:
+        return
+    result.cpu_time = usage.ru_utime + usage.ru_stime
+    result.max_rss = _maxrss_kb(usage.ru_maxrss)
+
+
+def _apply_rlimits(limits: Optional[Dict], output_limit: Optional[int] = None):
+    """
+    현재 프로세스에 CPU 시간 제한(RLIMIT_CPU), 주소 공간 제한(RLIMIT_AS),
+    파일 크기 제한(RLIMIT_FSIZE)을 겁니다.
+
+    파일 크기 제한을 넘으면 쓰기가 실패하므로(Python은 SIGXFSZ를 무시함) 자식은 곧 오류로 끝나고,
+    출력 파일 크기가 output_limit을 넘었는지로 출력 초과를 판정합니다.
+
+    spawn 실행기의 preexec_fn, fork 실행기의 자식에서 호출됩니다.
+    """
+    rlimits = []
+    if limits:
+        cpu = math.ceil(limits['time'])
+        memory = int(limits['memory'] * 1024 * 1024)
+        rlimits += [(resource.RLIMIT_CPU, cpu, cpu + 1), (resource.RLIMIT_AS, memory, memory)]
+    if output_limit:
+        # 기준보다 1바이트 더 쓸 수 있게 해서 기준을 넘었는지 알 수 있게 함
+        rlimits.append((resource.RLIMIT_FSIZE, output_limit + 1, output_limit + 1))
+
+    for name, soft, hard in rlimits:
+        _, current_hard = resource.getrlimit(name)
+        if current_hard != resource.RLIM_INFINITY:
+            soft = min(soft, current_hard)
+            hard = min(hard, current_hard)
+        try:
+            resource.setrlimit(name, (soft, hard))
+        except (ValueError, OSError):
+            # macOS 등 RLIMIT_AS를 지원하지 않는 OS
+            pass
+
+
+def _check_limits(result: RunResult, limits: Optional[Dict], output_limit: Optional[int] = None):
+    """실행 결과가 출력/시간/메모리 제한을 넘었는지 판정합니다."""
+    if output_limit and result.output_size > output_limit:
+        result.limit_exceeded = 'OLE'
+        return
+
+    if not limits:
+        if result.timed_out:
+            result.limit_exceeded = 'TLE'
+        return
+
+    killed_by = -result.returncode if result.returncode < 0 else None
+
+    if (result.timed_out
+            or killed_by == getattr(signal, 'SIGXCPU', None)
+            or (result.cpu_time is not None and result.cpu_time > limits['time'])):
+        result.limit_exceeded = 'TLE'
+    elif ('MemoryError' in result.stderr
+          or (result.max_rss is not None and result.max_rss > limits['memory'] * 1024)):
+        result.limit_exceeded = 'MLE'
+
+
+def _maxrss_kb(maxrss: int) -> int:
+    """ru_maxrss를 KB 단위로 맞춥니다. (macOS는 바이트 단위)"""
+    if sys.platform == 'darwin':
+        return maxrss // 1024
+    return maxrss
+
+
+def _decode(data: Optional[bytes]) -> str:
+    """프로세스 출력을 문자열로 변환합니다."""
+    if not data:
+        return ""
+    return data.decode('utf-8', errors='replace')
+
+
+def _kill_pid(pid: int):
+    """포크 서버의 자식을 종료합니다. (이미 끝난 경우 무시)"""
+    try:
+        os.kill(pid, signal.SIGKILL)
+    except OSError:
+        pass
+
+
+def _read_reply(server: subprocess.Popen) -> Optional[dict]:
+    """포크 서버의 응답 한 줄을 읽습니다."""
+    line = server.stdout.readline()
+    if not line:
+        return None
+    return json.loads(line)
+
+
+def _serve(solution_path: str):
+    """
+    포크 서버 본체
+
+    solution.py의 최상위 import 문만 미리 실행해 두고,
+    표준 입력으로 들어오는 요청마다 자식을 fork 해서 solution.py를 실행합니다.
+    """
+    # 요청/응답 채널을 따로 빼 두고, 로딩 중의 입출력이 채널을 건드리지 않게 막음
+    control = os.fdopen(os.dup(0), 'rb')
+    reply = os.fdopen(os.dup(1), 'w')
+    devnull = os.open(os.devnull, os.O_RDONLY)
+    os.dup2(devnull, 0)
+    os.dup2(2, 1)
+
+    def send(data: dict):
+        reply.write(json.dumps(data) + '\n')
+        reply.flush()
+
+    sys.argv = [solution_path]
+    sys.path[:0] = [os.path.dirname(solution_path), str(LIB_DIR)]
+
+    try:
+        _preload_imports(solution_path)
+    except SyntaxError as e:
+        send({'error': f"{e.msg} (line {e.lineno})"})
+        return
+
+    send({'ready': True})
+
+    for line in control:
+        request = json.loads(line)
+
+        start = time.perf_counter()
+        pid = os.fork()
+        if pid == 0:
+            _run_child(solution_path, request)
+
+        send({'pid': pid})
+        _, status, usage = os.wait4(pid, 0)
+        send({
+            'returncode': os.waitstatus_to_exitcode(status),
+            'wall_time': time.perf_counter() - start,
+            'cpu_time': usage.ru_utime + usage.ru_stime,
+            'max_rss': _maxrss_kb(usage.ru_maxrss),
+        })
+
+
+def _top_level_imports(tree: ast.Module) -> list:
+    return [node for node in tree.body if isinstance(node, (ast.Import, ast.ImportFrom))]
+
+
+def _preload_imports(solution_path: str):
+    """
+    solution.py의 최상위 import 문만 실행해서 모듈을 미리 로딩합니다.
+
+    __main__ 가드가 없는 풀이도 있으므로 본문은 실행하지 않습니다.
+    """
+    with open(solution_path, 'rb') as f:
+        tree = ast.parse(f.read(), filename=solution_path)
+
+    for node in _top_level_imports(tree):
+        module = ast.Module(body=[node], type_ignores=[])
+        try:
+            exec(compile(module, solution_path, 'exec'), {'__name__': '__boj_warm__'})
+        except Exception:
+            # 로딩에 실패한 import는 자식에서 다시 시도되어 원래 오류가 그대로 보임
+            pass
+
+
+def _run_child(solution_path: str, request: dict):
+    """fork 된 자식에서 케이스 하나를 실행하고 종료합니다."""
+    code = 1
+    try:
+        in_fd = os.open(request['input'], os.O_RDONLY)
+        out_fd = os.open(request['stdout'], os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        err_fd = os.open(request['stderr'], os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        os.dup2(in_fd, 0)
+        os.dup2(out_fd, 1)
+        os.dup2(err_fd, 2)
+
+        sys.stdin = open(0, 'r', encoding='utf-8', closefd=False)
+        sys.stdout = open(1, 'w', encoding='utf-8', closefd=False)
+        sys.stderr = open(2, 'w', encoding='utf-8', closefd=False)
+        sys.argv = [solution_path, *request['args']]
+
+        # 시간 초과 시 SIGALRM 기본 동작으로 자식이 종료됨
+        signal.setitimer(signal.ITIMER_REAL, request['timeout'])
+        if (request['limits'] or request['output_limit']) and resource:
+            _apply_rlimits(request['limits'], request['output_limit'])
+
+        try:
+            runpy.run_path(solution_path, run_name='__main__')
+            code = 0
+        except SystemExit as e:
+            if e.code is None or isinstance(e.code, int):
+                code = e.code or 0
+            else:
+                print(e.code, file=sys.stderr)
+        except BaseException:
+            traceback.print_exc()
+
+        sys.stdout.flush()
+        sys.stderr.flush()
+    finally:
+        os._exit(code)
+
+
+if __name__ == "__main__":
+    if len(sys.argv) == 3 and sys.argv[1] == '--serve':
+        _serve(sys.argv[2])
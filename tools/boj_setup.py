@@ -4,17 +4,35 @@
 """
 import os
 import sys
+import time
 import argparse
+import importlib.util
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from boj_crawler import BOJCrawler
+from typing import Dict, List, Optional
+from boj_cache import HTTPCache, DEFAULT_TTL
+from boj_crawler import BOJCrawler, PARSER_BACKENDS
+from boj_limits import save_limits
+from boj_registry import ProblemRegistry
+from boj_template import WRITE_OUTPUT, infer_input_format, render_read_input
 
 
 class BOJSetup:
     """백준 문제 세팅 클래스"""
 
-    def __init__(self, base_dir: str = "problems"):
+    def __init__(self, base_dir: str = "problems", jobs: int = 1, cache: HTTPCache = None,
+                 parser: str = 'html.parser'):
         self.base_dir = Path(base_dir)
-        self.crawler = BOJCrawler()
+        self.jobs = max(1, jobs)
+        # 여러 스레드가 하나의 크롤러(커넥션 풀, 응답 캐시)를 공유
+        self.crawler = BOJCrawler(pool_size=self.jobs, cache=cache or HTTPCache(), parser=parser)
+        self.registry = ProblemRegistry(self.base_dir)
+        self.verbose = True
+
+    def _print(self, message: str):
+        """진행 상황을 출력합니다. (일괄 세팅 중에는 출력하지 않음)"""
+        if self.verbose:
+            print(message)
 
     def setup_problem(self, problem_id: int) -> bool:
         """
@@ -26,36 +44,98 @@ class BOJSetup:
         Returns:
             성공 여부
         """
-        print(f"문제 {problem_id}를 가져오는 중...")
+        return self._setup_problem(problem_id) is not None
+
+    def setup_problems(self, problem_ids: List[int]) -> Dict[int, bool]:
+        """
+        여러 문제를 동시에 세팅합니다.
+
+        최대 jobs개의 문제를 동시에 가져오며, 끝나는 순서대로 문제별 결과를 출력합니다.
+
+        Args:
+            problem_ids: 백준 문제 번호 리스트
+
+        Returns:
+            {문제 번호: 성공 여부} 딕셔너리
+        """
+        print(f"[*] {len(problem_ids)}개의 문제를 {self.jobs}개씩 동시에 세팅합니다...\n")
+
+        # 문제별 solved.ac 요청 대신, 없는 메타데이터를 100문제씩 묶어서 미리 조회
+        self.crawler.prefetch_meta(problem_ids)
+
+        self.verbose = False
+        results = {}
+        start = time.perf_counter()
+
+        with ThreadPoolExecutor(max_workers=self.jobs) as executor:
+            futures = {executor.submit(self._setup_problem, pid): pid for pid in problem_ids}
+
+            for future in as_completed(futures):
+                problem_id = futures[future]
+                try:
+                    problem_dir = future.result()
+                except Exception as e:
+                    print(f"[X] {problem_id}: 오류 발생 - {e}")
+                    results[problem_id] = False
+                    continue
+
+                if problem_dir:
+                    print(f"[O] {problem_id}: {problem_dir}")
+                else:
+                    print(f"[X] {problem_id}: 문제를 가져오는데 실패했습니다.")
+                results[problem_id] = problem_dir is not None
+
+        self.verbose = True
+        elapsed = time.perf_counter() - start
+        succeeded = sum(results.values())
+
+        print("\n" + "=" * 50)
+        print(f"[*] 성공 {succeeded}개, 실패 {len(results) - succeeded}개 ({elapsed:.1f}초)")
+
+        failed = sorted(pid for pid, ok in results.items() if not ok)
+        if failed:
+            print(f"[X] 실패한 문제: {' '.join(map(str, failed))}")
+
+        return results
+
+    def _setup_problem(self, problem_id: int):
+        """문제를 세팅하고 문제 디렉토리를 반환합니다. 실패 시 None을 반환합니다."""
+        self._print(f"문제 {problem_id}를 가져오는 중...")
 
         # 문제 크롤링
         problem = self.crawler.get_problem(problem_id)
         if not problem:
-            print("문제를 가져오는데 실패했습니다.")
-            return False
+            self._print("문제를 가져오는데 실패했습니다.")
+            return None
 
         # 문제 디렉토리 생성 (번호_영문 형식)
         problem_dir = self.base_dir / f"{problem_id}_{problem['title_en']}"
         problem_dir.mkdir(parents=True, exist_ok=True)
 
-        print(f"문제 디렉토리 생성: {problem_dir}")
+        self._print(f"문제 디렉토리 생성: {problem_dir}")
 
         # README.md 생성 (문제 정보)
         self._create_readme_file(problem_dir, problem)
 
+        # problem.json 생성 (테스트 도구가 읽는 시간/메모리 제한)
+        save_limits(problem_dir, problem)
+
         # solution.py 생성 (간단한 템플릿)
         self._create_solution_file(problem_dir, problem)
 
         # 예제 입출력 파일 생성
         self._create_example_files(problem_dir, problem['examples'])
 
-        print(f"\n문제 세팅 완료!")
-        print(f"경로: {problem_dir}")
-        print(f"문제 정보: {problem_dir / 'README.md'}")
-        print(f"풀이 파일: {problem_dir / 'solution.py'}")
-        print(f"예제 개수: {len(problem['examples'])}")
+        # 다른 도구들이 problems/를 훑지 않고 찾을 수 있도록 레지스트리에 등록
+        self.registry.register(problem_dir)
 
-        return True
+        self._print(f"\n문제 세팅 완료!")
+        self._print(f"경로: {problem_dir}")
+        self._print(f"문제 정보: {problem_dir / 'README.md'}")
+        self._print(f"풀이 파일: {problem_dir / 'solution.py'}")
+        self._print(f"예제 개수: {len(problem['examples'])}")
+
+        return problem_dir
 
     def _create_readme_file(self, problem_dir: Path, problem: dict):
         """README.md 파일 생성 (문제 정보)"""
@@ -63,7 +143,7 @@ class BOJSetup:
 
         readme_content = f'''# {problem['id']}. {problem['title']}
 
-**난이도**: TBD
+**난이도**: {problem.get('tier', 'TBD')}
 **URL**: {problem['url']}
 
 ## 문제
@@ -106,14 +186,15 @@ class BOJSetup:
         with open(readme_path, 'w', encoding='utf-8') as f:
             f.write(readme_content)
 
-        print(f"생성: {readme_path.name}")
+        self._print(f"생성: {readme_path.name}")
 
     def _create_solution_file(self, problem_dir: Path, problem: dict):
         """solution.py 파일 생성 (예제 입력 분석하여 템플릿 자동 생성)"""
         solution_path = problem_dir / "solution.py"
 
-        # 예제 입력 분석하여 입력/출력 처리 함수 생성
-        read_input_func, input_handler = self._analyze_input_pattern(problem['examples'])
+        # 예제 입력 분석하여 입력 처리 함수 생성
+        read_input_func, input_names = self._analyze_input_pattern(problem['examples'])
+        unpack = f"    {input_names} = input_data\n" if input_names != 'input_data' else ""
 
         solution_content = f'''"""
 BOJ {problem['id']} - {problem['title']}
@@ -122,14 +203,10 @@ BOJ {problem['id']} - {problem['title']}
 import sys
 
 {read_input_func}
-
-def write_output(output_data):
-    """출력 데이터를 출력"""
-    print(output_data)
-
+{WRITE_OUTPUT}
 
 def solve(input_data):
-    # 여기에 풀이 로직만 작성
+{unpack}    # 여기에 풀이 로직만 작성
     output_data = []
 
     # 풀이 로직 작성
@@ -138,7 +215,7 @@ def solve(input_data):
 
 
 if __name__ == "__main__":
-{input_handler}
+    input_data = read_input()
     output_data = solve(input_data)
     write_output(output_data)
 '''
@@ -146,53 +223,20 @@ if __name__ == "__main__":
         with open(solution_path, 'w', encoding='utf-8') as f:
             f.write(solution_content)
 
-        print(f"생성: {solution_path.name}")
+        self._print(f"생성: {solution_path.name}")
 
     def _analyze_input_pattern(self, examples: list) -> tuple:
         """
         예제 입력을 분석하여 입력 처리 로직을 생성합니다.
 
+        첫 번째 예제만 보지 않고 모든 예제에 공통된 구조(값 개수, 첫 줄의 N과 다음 N줄 등)를 추론하며,
+        생성된 read_input()은 입력 전체를 sys.stdin.buffer에서 한 번에 읽습니다. (boj_template 참고)
+
         Returns:
-            (read_input 함수 코드, if __name__ 블록 코드) 튜플
+            (read_input 함수 코드, solve()에서 input_data를 풀어 쓸 변수 이름 문자열) 튜플
         """
-        if not examples:
-            # 한 줄 입력
-            read_input_func = '''
-def read_input():
-    """입력을 읽어서 반환"""
-    return sys.stdin.readline().rstrip()
-'''
-            input_handler = "    input_data = read_input()"
-            return read_input_func, input_handler
-
-        # 첫 번째 예제의 입력으로 패턴 분석
-        first_input = examples[0]['input'].strip()
-        lines = first_input.split('\n')
-
-        # 한 줄 입력
-        if len(lines) == 1:
-            read_input_func = '''
-def read_input():
-    """입력을 읽어서 반환"""
-    return sys.stdin.readline().rstrip()
-'''
-            input_handler = "    input_data = read_input()"
-            return read_input_func, input_handler
-
-        # 여러 줄 입력
-        read_input_func = '''
-def read_input():
-    """입력을 읽어서 반환"""
-    input_data = []
-    while True:
-        line = sys.stdin.readline()
-        if not line:
-            break
-        input_data.append(line.rstrip())
-    return input_data
-'''
-        input_handler = "    input_data = read_input()"
-        return read_input_func, input_handler
+        fmt = infer_input_format([example['input'] for example in examples])
+        return render_read_input(fmt)
 
     def _create_example_files(self, problem_dir: Path, examples: list):
         """예제 입출력 파일 생성"""
@@ -208,25 +252,90 @@ def read_input():
             clean_input = example['input'].replace('\r', '')
             with open(input_path, 'w', encoding='utf-8', newline='\n') as f:
                 f.write(clean_input)
-            print(f"생성: input/{input_path.name}")
+            self._print(f"생성: input/{input_path.name}")
 
             # 출력 파일 - \r 제거
             output_path = output_dir / f"{i}.txt"
             clean_output = example['output'].replace('\r', '')
             with open(output_path, 'w', encoding='utf-8', newline='\n') as f:
                 f.write(clean_output)
-            print(f"생성: output/{output_path.name}")
-
-
-def main():
-    parser = argparse.ArgumentParser(description='백준 문제를 로컬에 세팅합니다.')
-    parser.add_argument('problem_id', type=int, help='백준 문제 번호')
+            self._print(f"생성: output/{output_path.name}")
+
+
+def read_problem_ids(path: str) -> List[int]:
+    """
+    파일에서 문제 번호 목록을 읽습니다.
+
+    공백/줄바꿈으로 구분된 번호를 읽으며, '#' 뒤는 주석으로 무시합니다.
+
+    Raises:
+        OSError: 파일을 읽을 수 없는 경우
+        ValueError: 숫자가 아닌 값이 있는 경우 (몇 번째 줄의 어떤 값인지 포함)
+    """
+    problem_ids = []
+    with open(path, 'r', encoding='utf-8') as f:
+        for line_number, line in enumerate(f, 1):
+            for token in line.split('#', 1)[0].split():
+                try:
+                    problem_ids.append(int(token))
+                except ValueError:
+                    raise ValueError(f"{line_number}번째 줄의 '{token}'은(는) 문제 번호가 아닙니다.") from None
+    return problem_ids
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(
+        description='백준 문제를 로컬에 세팅합니다.',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+사용 예시:
+  python boj_setup.py 1000                      # 문제 하나 세팅
+  python boj_setup.py 1000 1001 1002            # 여러 문제를 동시에 세팅
+  python boj_setup.py --from-file ids.txt -j 16 # 파일의 문제 번호들을 16개씩 동시에 세팅
+        """
+    )
+    parser.add_argument('problem_ids', type=int, nargs='*', help='백준 문제 번호 (여러 개 가능)')
+    parser.add_argument('--from-file', type=str, help='문제 번호 목록 파일 (공백/줄바꿈 구분, # 주석)')
     parser.add_argument('--dir', type=str, default='problems', help='문제를 저장할 디렉토리')
-
-    args = parser.parse_args()
-
-    setup = BOJSetup(args.dir)
-    success = setup.setup_problem(args.problem_id)
+    parser.add_argument('-j', '--jobs', type=int, default=8,
+                        help='여러 문제를 세팅할 때 동시에 가져올 문제 수 (기본값: 8)')
+    parser.add_argument('--offline', action='store_true',
+                        help='네트워크 요청 없이 캐시(.boj_cache)에 있는 문제만 세팅')
+    parser.add_argument('--cache-ttl', type=float, default=DEFAULT_TTL / 3600,
+                        help='캐시를 재검증 없이 사용할 시간 (시간 단위, 기본값: 168)')
+    parser.add_argument('--parser', type=str, choices=PARSER_BACKENDS, default='html.parser',
+                        help='문제 페이지 파서 (기본값: html.parser, lxml은 설치되어 있어야 함)')
+
+    args = parser.parse_args(argv)
+
+    if args.parser == 'lxml' and importlib.util.find_spec('lxml') is None:
+        parser.error('lxml이 설치되어 있지 않습니다. (pip install lxml)')
+
+    problem_ids = list(args.problem_ids)
+    if args.from_file:
+        try:
+            problem_ids += read_problem_ids(args.from_file)
+        except OSError as e:
+            parser.error(f"--from-file {args.from_file}: 파일을 읽을 수 없습니다. ({e.strerror})")
+        except UnicodeDecodeError:
+            parser.error(f"--from-file {args.from_file}: UTF-8 텍스트 파일이 아닙니다.")
+        except ValueError as e:
+            parser.error(f"--from-file {args.from_file}: {e}")
+
+    # 중복 제거 (순서 유지)
+    problem_ids = list(dict.fromkeys(problem_ids))
+
+    if not problem_ids:
+        parser.error('문제 번호 또는 --from-file을 지정해야 합니다.')
+
+    cache = HTTPCache(ttl=args.cache_ttl * 3600, offline=args.offline)
+
+    if len(problem_ids) == 1:
+        setup = BOJSetup(args.dir, cache=cache, parser=args.parser)
+        success = setup.setup_problem(problem_ids[0])
+    else:
+        setup = BOJSetup(args.dir, jobs=args.jobs, cache=cache, parser=args.parser)
+        success = all(setup.setup_problems(problem_ids).values())
 
     sys.exit(0 if success else 1)
 
@@ -0,0 +1,167 @@
+"""
+백준 채점 현황 모듈
+채점 현황(status) 페이지에서 제출 번호로 결과 행을 찾아 파싱하고,
+최종 결과가 나올 때까지 간격을 늘려 가며 다시 확인합니다.
+
+파싱은 HTML 문자열만 받으므로 브라우저 없이 저장된 페이지나 로컬 서버로 확인할 수 있습니다.
+"""
+import re
+import sys
+import time
+import argparse
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+from urllib.parse import urlparse
+
+
+# 채점이 끝나지 않은 상태 (result-text의 클래스, 텍스트)
+PENDING_CLASSES = frozenset({'result-wait', 'result-rejudge-wait', 'result-compile', 'result-judging'})
+PENDING_TEXTS = ('기다리는 중', '재채점을 기다리는 중', '채점 준비 중', '채점 중')
+
+_SOLUTION_ROW = re.compile(r'solution-(\d+)$')
+_NUMBER = re.compile(r'\d+')
+
+
+def parse_status_row(html: str, solution_id: int) -> Optional[Dict]:
+    """
+    채점 현황 페이지에서 제출 번호에 해당하는 행을 파싱합니다.
+
+    Args:
+        html: 채점 현황 페이지 HTML
+        solution_id: 제출 번호
+
+    Returns:
+        {'solution_id', 'result', 'final', 'memory'(KB), 'time'(ms)} 딕셔너리 또는 None (행이 없는 경우)
+        memory/time은 채점이 끝나지 않았거나 표시되지 않으면 None
+    """
+    # bs4는 파싱할 때만 import (boj_submit --help 등의 시작 시간 단축)
+    from bs4 import BeautifulSoup, SoupStrainer
+
+    soup = BeautifulSoup(html, 'html.parser', parse_only=SoupStrainer('tr', id=f"solution-{solution_id}"))
+    row = soup.find('tr')
+    if row is None:
+        return None
+
+    result_cell = row.select_one('td.result')
+    result_text = result_cell.select_one('.result-text') if result_cell else None
+    text = (result_text or result_cell).get_text(' ', strip=True) if result_cell else ""
+    classes = set(result_text.get('class', [])) if result_text else set()
+
+    final = bool(text) and not (classes & PENDING_CLASSES) and not text.startswith(PENDING_TEXTS)
+
+    return {
+        'solution_id': solution_id,
+        'result': text,
+        'final': final,
+        'memory': _cell_number(row, 'td.memory') if final else None,
+        'time': _cell_number(row, 'td.time') if final else None,
+    }
+
+
+def latest_solution_id(html: str) -> Optional[int]:
+    """채점 현황 페이지의 맨 위(가장 최근) 제출 번호를 반환합니다. 없으면 None"""
+    from bs4 import BeautifulSoup, SoupStrainer
+
+    soup = BeautifulSoup(html, 'html.parser',
+                         parse_only=SoupStrainer('tr', id=_SOLUTION_ROW))
+    row = soup.find('tr')
+    return int(_SOLUTION_ROW.match(row['id']).group(1)) if row else None
+
+
+def _cell_number(row, selector: str) -> Optional[int]:
+    cell = row.select_one(selector)
+    match = _NUMBER.search(cell.get_text()) if cell else None
+    return int(match.group()) if match else None
+
+
+def wait_for_result(fetch: Callable[[], str], solution_id: int, timeout: float = 120,
+                    interval: float = 0.5, backoff: float = 1.5, max_interval: float = 5,
+                    on_update: Optional[Callable[[Dict], None]] = None) -> Optional[Dict]:
+    """
+    최종 결과가 나올 때까지 채점 현황을 다시 확인합니다.
+
+    처음에는 interval초 뒤에 다시 확인하고, 확인할 때마다 간격을 backoff배씩 늘립니다 (최대 max_interval초).
+    최종 결과가 나오면 바로 반환하고, timeout을 넘겨서 기다리지 않습니다.
+
+    Args:
+        fetch: 채점 현황 페이지 HTML을 가져오는 함수
+        solution_id: 제출 번호
+        timeout: 최대 대기 시간 (초)
+        interval: 첫 확인 간격 (초)
+        backoff: 확인 간격 증가 배수
+        max_interval: 최대 확인 간격 (초)
+        on_update: 결과 텍스트가 바뀔 때마다 호출할 함수 (예: '채점 중 (45%)' 출력)
+
+    Returns:
+        parse_status_row()의 마지막 결과 (시간 초과 시 final이 False) 또는 None (행을 찾지 못한 경우)
+    """
+    deadline = time.monotonic() + timeout
+    status = None
+    last_text = None
+
+    while True:
+        status = parse_status_row(fetch(), solution_id) or status
+        if status and status['result'] != last_text:
+            last_text = status['result']
+            if on_update:
+                on_update(status)
+        if status and status['final']:
+            return status
+
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return status
+        time.sleep(min(interval, remaining))
+        interval = min(interval * backoff, max_interval)
+
+
+def format_status(status: Dict) -> str:
+    """'맞았습니다!! (메모리 31120 KB, 시간 44 ms)' 형식"""
+    details = []
+    if status.get('memory') is not None:
+        details.append(f"메모리 {status['memory']} KB")
+    if status.get('time') is not None:
+        details.append(f"시간 {status['time']} ms")
+    return f"{status['result']} ({', '.join(details)})" if details else status['result']
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(
+        description='채점 현황 페이지에서 제출 결과를 확인합니다.',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+사용 예시:
+  python boj_status.py 71234567 --page status.html                    # 저장한 페이지를 한 번 파싱
+  python boj_status.py 71234567 --page http://127.0.0.1:8765/status   # 최종 결과가 나올 때까지 확인
+        """
+    )
+    parser.add_argument('solution_id', type=int, help='제출 번호')
+    parser.add_argument('--page', type=str, required=True, help='채점 현황 페이지 URL 또는 HTML 파일')
+    parser.add_argument('--timeout', type=float, default=120, help='최대 대기 시간 (초, 기본값: 120)')
+
+    args = parser.parse_args(argv)
+
+    if urlparse(args.page).scheme in ('http', 'https'):
+        import requests
+        session = requests.Session()
+
+        def fetch() -> str:
+            response = session.get(args.page, timeout=10)
+            response.raise_for_status()
+            return response.text
+
+        status = wait_for_result(fetch, args.solution_id, timeout=args.timeout,
+                                 on_update=lambda s: print(f"  {s['result']}"))
+    else:
+        status = parse_status_row(Path(args.page).read_text(encoding='utf-8'), args.solution_id)
+
+    if status is None:
+        print(f"[X] 제출 {args.solution_id}을 찾을 수 없습니다.")
+        sys.exit(1)
+
+    print(f"[{'O' if status['final'] else '!'}] 제출 {args.solution_id}: {format_status(status)}")
+    sys.exit(0 if status['final'] else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,216 @@
+"""
+백준 문제 스트레스 테스트 스크립트
+입력 생성기로 만든 랜덤 입력에 대해 풀이와 참조 풀이(완전 탐색)의 출력을 비교하고,
+처음 발견한 반례를 input/output 예제로 저장합니다.
+
+입력 생성기 규약:
+    python gen.py <seed> [n]
+    - seed: 난수 시드 (같은 시드면 같은 입력을 출력해야 함)
+    - n: 입력 크기 (선택, 생략 시 생성기가 알아서 작은 크기를 고름)
+    - 입력을 표준 출력으로 출력
+"""
+import os
+import sys
+import argparse
+import tempfile
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import ExitStack
+from pathlib import Path
+from typing import List, Optional
+
+from boj_compare import compare_text, format_mismatch
+from boj_registry import resolve_problem_dir
+from boj_runner import RUNNER_MODES, create_runner
+
+
+class BOJStress:
+    """풀이와 참조 풀이를 랜덤 입력으로 비교하는 클래스"""
+
+    def __init__(self, problem_dir: Path, solution: str = "solution.py",
+                 reference: str = "brute.py", generator: str = "gen.py",
+                 jobs: int = 1, runner_mode: str = 'auto', timeout: float = 10):
+        self.problem_dir = Path(problem_dir)
+        self.solution_path = self.problem_dir / solution
+        self.reference_path = self.problem_dir / reference
+        self.generator_path = self.problem_dir / generator
+        self.jobs = max(1, jobs)
+        self.runner_mode = runner_mode
+        self.timeout = timeout
+
+    def run(self, count: int, seed: int = 0, size: Optional[int] = None) -> bool:
+        """
+        스트레스 테스트를 실행합니다.
+
+        Args:
+            count: 실행할 랜덤 케이스 수
+            seed: 시작 시드 (seed, seed+1, ... 순서로 사용)
+            size: 생성기에 넘길 입력 크기 (None이면 생성기 기본값)
+
+        Returns:
+            반례 없이 모든 케이스가 일치했는지 여부
+        """
+        for path in (self.solution_path, self.reference_path, self.generator_path):
+            if not path.exists():
+                print(f"[X] 파일을 찾을 수 없습니다: {path}")
+                return False
+
+        print(f"[*] 풀이: {self.solution_path.name}, 참조: {self.reference_path.name}, "
+              f"생성기: {self.generator_path.name}")
+        print(f"[*] {count}개의 랜덤 케이스를 {self.jobs}개씩 병렬로 실행합니다...\n")
+
+        failure = None
+        done = 0
+        # 스택의 역순으로 정리되므로 실행기(포크 서버)는 스레드 풀이 모든 작업을 끝낸 뒤에 닫힘
+        with ExitStack() as stack:
+            runners = [stack.enter_context(create_runner(path, mode=self.runner_mode, cwd=self.problem_dir,
+                                                         workers=self.jobs))
+                       for path in (self.generator_path, self.reference_path, self.solution_path)]
+            tmp_dir = Path(stack.enter_context(tempfile.TemporaryDirectory(prefix='boj_stress_')))
+            executor = stack.enter_context(ThreadPoolExecutor(max_workers=self.jobs))
+
+            futures = [
+                executor.submit(self._run_case, *runners, tmp_dir, case_seed, size)
+                for case_seed in range(seed, seed + count)
+            ]
+
+            for future in as_completed(futures):
+                if future.cancelled():
+                    continue
+                case = future.result()
+                done += 1
+
+                if case['status'] != 'ok':
+                    # 병렬 실행이라 먼저 끝난 반례가 아니라 시드가 가장 작은 반례를 남김
+                    if failure is None or case['seed'] < failure['seed']:
+                        failure = case
+                    for f in futures:
+                        f.cancel()
+
+                if done % 100 == 0 and failure is None:
+                    print(f"  {done}/{count} 케이스 일치")
+
+        print()
+        if failure is None:
+            print("=" * 50)
+            print(f"[O] {count}개의 랜덤 케이스에서 모두 참조 풀이와 일치했습니다!")
+            return True
+
+        self._report(failure)
+        if failure['status'] == 'mismatch':
+            self._save_counterexample(failure)
+        return False
+
+    def _run_case(self, generator, reference, solution, tmp_dir: Path,
+                  seed: int, size: Optional[int]) -> dict:
+        """시드 하나로 입력을 만들고 두 풀이를 실행해 비교합니다."""
+        case = {'seed': seed, 'status': 'ok', 'input': '', 'expected': '', 'mismatch': None, 'detail': ''}
+
+        args = (seed,) if size is None else (seed, size)
+        generated = generator.run(os.devnull, timeout=self.timeout, args=args)
+        if generated.returncode != 0:
+            case['status'] = 'error'
+            case['detail'] = f"생성기 오류\n{generated.stderr}"
+            return case
+
+        input_path = tmp_dir / f"{seed}.txt"
+        input_path.write_text(generated.stdout, encoding='utf-8')
+        case['input'] = generated.stdout
+
+        expected = reference.run(input_path, timeout=self.timeout)
+        if expected.returncode != 0 or expected.timed_out:
+            case['status'] = 'error'
+            case['detail'] = f"참조 풀이 오류\n{expected.stderr}"
+            return case
+
+        actual = solution.run(input_path, timeout=self.timeout)
+        case['expected'] = expected.stdout.strip()
+
+        if actual.timed_out:
+            case['status'] = 'mismatch'
+            case['detail'] = "시간 초과"
+        elif actual.returncode != 0:
+            case['status'] = 'mismatch'
+            case['detail'] = f"런타임 에러\n{actual.stderr}"
+        else:
+            # 채점과 같은 기준으로 비교 (줄 끝 공백, 끝의 빈 줄 무시)
+            case['mismatch'] = compare_text(actual.stdout, expected.stdout)
+            if case['mismatch']:
+                case['status'] = 'mismatch'
+                case['detail'] = "출력이 다릅니다"
+
+        input_path.unlink()
+        return case
+
+    def _report(self, case: dict):
+        """반례 정보를 출력합니다."""
+        print("=" * 50)
+        print(f"[X] 시드 {case['seed']}에서 실패: {case['detail']}")
+        print(f"\n[입력]")
+        print(case['input'].rstrip())
+        if case['mismatch']:
+            print(f"\n[출력 비교]")
+            print(format_mismatch(case['mismatch']))
+
+    def _save_counterexample(self, case: dict):
+        """반례를 다음 번호의 input/output 예제로 저장합니다."""
+        input_dir = self.problem_dir / "input"
+        output_dir = self.problem_dir / "output"
+        input_dir.mkdir(exist_ok=True)
+        output_dir.mkdir(exist_ok=True)
+
+        numbers = [int(p.stem) for p in input_dir.glob("*.txt") if p.stem.isdigit()]
+        num = max(numbers, default=0) + 1
+
+        with open(input_dir / f"{num}.txt", 'w', encoding='utf-8', newline='\n') as f:
+            f.write(case['input'])
+        with open(output_dir / f"{num}.txt", 'w', encoding='utf-8', newline='\n') as f:
+            f.write(case['expected'])
+
+        print(f"\n[+] 반례를 예제 {num}번으로 저장했습니다: input/{num}.txt, output/{num}.txt")
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(
+        description='랜덤 입력으로 풀이와 참조 풀이(완전 탐색)의 출력을 비교합니다.',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+사용 예시:
+  python boj_stress.py 1411                      # gen.py + brute.py로 1000개 비교
+  python boj_stress.py 1411 -n 5000 -j 8         # 8개씩 병렬로 5000개 비교
+  python boj_stress.py 1411 --solution fast.py   # 다른 풀이 파일을 검사
+
+입력 생성기(gen.py)는 `python gen.py <seed> [n]` 형식으로 실행되며,
+입력을 표준 출력으로 출력해야 합니다.
+        """
+    )
+    parser.add_argument('problem_id', type=str, help='백준 문제 번호 또는 문제 디렉토리 경로')
+    parser.add_argument('--dir', type=str, default='problems', help='문제가 저장된 기본 디렉토리')
+    parser.add_argument('--solution', type=str, default='solution.py', help='검사할 풀이 파일 (기본값: solution.py)')
+    parser.add_argument('--ref', type=str, default='brute.py', help='참조 풀이 파일 (기본값: brute.py)')
+    parser.add_argument('--gen', type=str, default='gen.py', help='입력 생성기 파일 (기본값: gen.py)')
+    parser.add_argument('-n', '--count', type=int, default=1000, help='랜덤 케이스 수 (기본값: 1000)')
+    parser.add_argument('--seed', type=int, default=0, help='시작 시드 (기본값: 0)')
+    parser.add_argument('--size', type=int, help='생성기에 넘길 입력 크기')
+    parser.add_argument('-j', '--jobs', type=int, default=os.cpu_count() or 1,
+                        help='동시에 실행할 케이스 수 (기본값: CPU 코어 수)')
+    parser.add_argument('--runner', type=str, choices=RUNNER_MODES, default='auto',
+                        help='실행 방식 (기본값: auto)')
+
+    args = parser.parse_args(argv)
+
+    problem_dir = resolve_problem_dir(args.problem_id, args.dir)
+    if not problem_dir:
+        print(f"[X] 문제 디렉토리를 찾을 수 없습니다: {args.problem_id}")
+        sys.exit(1)
+
+    print(f"[*] 문제 디렉토리: {problem_dir}")
+
+    stress = BOJStress(problem_dir, solution=args.solution, reference=args.ref,
+                       generator=args.gen, jobs=args.jobs, runner_mode=args.runner)
+    success = stress.run(args.count, seed=args.seed, size=args.size)
+
+    sys.exit(0 if success else 1)
+
+
+if __name__ == "__main__":
+    main()
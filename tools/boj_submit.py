@@ -1,44 +1,365 @@
 """
 백준 자동 제출 스크립트
-selenium을 사용하여 백준에 로그인하고 코드를 제출합니다.
+백준에 로그인하고 코드를 제출합니다. 두 가지 방식을 제공합니다.
+
+- selenium: Chrome을 띄워서 로그인/제출 폼을 직접 조작합니다.
+- http: 브라우저 없이 requests 세션으로 로그인/제출 폼을 전송합니다. (CI 등 작은 컨테이너용)
+
+로그인 쿠키는 .boj_cache/cookies/에 저장해 두고, 유효한 동안에는 로그인 과정을 건너뜁니다.
+풀이가 boj_lib을 import 하면 사용한 정의만 합친 단일 파일을 제출합니다. (boj_bundle.py)
+--language auto는 예제를 python3/pypy3로 실행해 보고 더 빠른 언어(Python 3, PyPy3)로 제출합니다.
 """
 import os
 import sys
+import json
 import time
 import argparse
+from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import Optional
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urljoin, urlparse
+
+from boj_bundle import BUNDLE_BEGIN, BundleError, bundle_file
+from boj_paths import CACHE_DIR
+from boj_registry import ProblemRegistry, parse_problem_id, resolve_problem_dir
+from boj_status import format_status, latest_solution_id, wait_for_result
+
+
+BASE_URL = "https://www.acmicpc.net"
+COOKIE_DIR = CACHE_DIR / "cookies"
+SUBMIT_BACKENDS = ('selenium', 'http')
+SUBMIT_LANGUAGES = ('Python 3', 'PyPy3', 'auto')
+
+# requests/bs4와 selenium은 불러오는 데 오래 걸리므로 실제로 쓸 때만 load_http(), load_selenium()으로 import
+requests = HTTPAdapter = BeautifulSoup = None
+webdriver = By = WebDriverWait = EC = Options = None
+
+
+def load_http():
+    """http 방식 제출과 폼 파싱에 쓰는 requests, bs4를 불러옵니다."""
+    global requests, HTTPAdapter, BeautifulSoup
+    if requests is None:
+        import requests
+        from requests.adapters import HTTPAdapter
+        from bs4 import BeautifulSoup
+
+
+def load_selenium() -> bool:
+    """
+    selenium 모듈들을 불러옵니다.
+
+    Returns:
+        불러왔는지 여부 (http 방식만 쓰는 환경에서는 selenium이 없어도 됨)
+    """
+    global webdriver, By, WebDriverWait, EC, Options
+    if webdriver is not None:
+        return True
+    try:
+        from selenium import webdriver
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.support.ui import WebDriverWait
+        from selenium.webdriver.support import expected_conditions as EC
+        from selenium.webdriver.chrome.options import Options
+    except ImportError:
+        webdriver = None
+        return False
+    return True
+
+
+def _cookie_path(username: str, base_url: str) -> Path:
+    # 테스트용 서버와 실제 백준의 쿠키가 섞이지 않도록 호스트별로 저장
+    host = urlparse(base_url).netloc.replace(':', '_')
+    return COOKIE_DIR / host / f"{username}.json"
+
+
+def load_cookies(username: str, base_url: str = BASE_URL) -> Optional[List[dict]]:
+    """저장된 로그인 쿠키를 읽습니다. 없으면 None"""
+    path = _cookie_path(username, base_url)
+    if not path.exists():
+        return None
+
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            cookies = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    # 만료된 쿠키는 버림
+    now = time.time()
+    return [cookie for cookie in cookies if cookie.get('expiry', now + 1) > now] or None
+
+
+def save_cookies(username: str, cookies: List[dict], base_url: str = BASE_URL):
+    """
+    로그인 쿠키를 저장합니다. (본인만 읽을 수 있도록 권한 600)
+
+    쿠키는 selenium의 get_cookies() 형식({'name', 'value', 'domain', 'path', 'expiry'})으로 저장합니다.
+    """
+    path = _cookie_path(username, base_url)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, 'w', encoding='utf-8') as f:
+        json.dump(cookies, f)
+
+
+def clear_cookies(username: str, base_url: str = BASE_URL):
+    """저장된 로그인 쿠키를 지웁니다. (만료되었거나 로그인에 실패한 경우)"""
+    path = _cookie_path(username, base_url)
+    if path.exists():
+        path.unlink()
 
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
 
+def parse_form(html: str, field: str) -> Optional[Dict]:
+    """
+    페이지에서 field라는 이름의 입력 칸이 있는 폼을 찾아 브라우저가 전송할 값들을 모읍니다.
 
-class BOJSubmitter:
-    """백준 자동 제출 클래스"""
+    hidden 입력(CSRF 토큰 등), 체크된 체크박스/라디오, select의 선택된 옵션이 기본값으로 들어갑니다.
 
-    BASE_URL = "https://www.acmicpc.net"
-    LOGIN_URL = f"{BASE_URL}/login"
+    Args:
+        html: 페이지 HTML
+        field: 폼을 찾을 입력 칸 이름 (예: 'login_password', 'source')
 
-    def __init__(self, username: str, password: str, headless: bool = False):
+    Returns:
+        {'action': 전송 URL, 'fields': {이름: 값}, 'options': {select 이름: [(값, 텍스트)]}} 또는 None
+    """
+    load_http()
+    soup = BeautifulSoup(html, 'html.parser')
+    form = next((form for form in soup.find_all('form') if form.find(attrs={'name': field})), None)
+    if form is None:
+        return None
+
+    fields = {}
+    options = {}
+    for element in form.find_all(['input', 'textarea', 'select']):
+        name = element.get('name')
+        if not name:
+            continue
+
+        if element.name == 'textarea':
+            fields[name] = element.get_text()
+        elif element.name == 'select':
+            choices = [(option.get('value', option.get_text(strip=True)), option.get_text(strip=True))
+                       for option in element.find_all('option')]
+            options[name] = choices
+            selected = element.find('option', selected=True)
+            if selected is not None:
+                fields[name] = selected.get('value', selected.get_text(strip=True))
+            elif choices:
+                fields[name] = choices[0][0]
+        else:
+            input_type = (element.get('type') or 'text').lower()
+            if input_type in ('submit', 'button', 'image', 'file', 'reset'):
+                continue
+            if input_type in ('checkbox', 'radio') and not element.has_attr('checked'):
+                continue
+            fields[name] = element.get('value', 'on' if input_type == 'checkbox' else '')
+
+    return {'action': form.get('action') or '', 'fields': fields, 'options': options}
+
+
+def read_code(code_path: Path) -> str:
+    """
+    제출할 코드를 읽습니다. boj_lib import는 사용한 정의로 바꿔서 하나의 파일로 합칩니다.
+
+    Raises:
+        BundleError, SyntaxError: 합칠 수 없는 경우 (boj_bundle.bundle_file() 참고)
+    """
+    return bundle_file(code_path)
+
+
+def choose_language(problem_dir: Path, default: str = "Python 3") -> Tuple[str, str]:
+    """
+    예제를 python3/pypy3로 실행해서 모든 예제를 통과한 것 중 더 빠른 언어를 고릅니다.
+
+    Returns:
+        (언어, 고른 이유) 튜플. 고를 수 없으면 default를 반환합니다.
+    """
+    # 로컬 실행은 --language auto일 때만 필요하므로 여기서 import
+    from boj_runner import DEFAULT_INTERPRETERS, find_interpreters
+    from verify import interpreter_matrix, recommend_interpreter
+
+    problem = ProblemRegistry(problem_dir.parent).describe(problem_dir)
+    if not problem['cases']:
+        return default, "예제가 없음"
+
+    interpreters, _ = find_interpreters(list(DEFAULT_INTERPRETERS))
+    if not interpreters:
+        return default, "실행할 수 있는 인터프리터가 없음"
+
+    matrix = interpreter_matrix(problem, interpreters)
+    recommended = recommend_interpreter(interpreters, matrix)
+    if not recommended:
+        return default, "모든 예제를 통과한 인터프리터가 없음"
+
+    times = []
+    for interpreter in interpreters:
+        results = matrix[interpreter['name']]
+        if all(case['passed'] for case in results):
+            total = sum(case['result'].wall_time for case in results)
+            times.append(f"{interpreter['name']} {total * 1000:.1f} ms")
+    return recommended['language'], f"예제 실행 시간 합계: {', '.join(times)}"
+
+
+def find_language(options: List[Tuple[str, str]], language: str) -> Optional[str]:
+    """언어 select의 옵션 중 이름이 language인 옵션의 값 (정확히 같은 이름을 우선)"""
+    for value, text in options:
+        if text == language:
+            return value
+    for value, text in options:
+        if language in text:
+            return value
+    return None
+
+
+class BaseSubmitter(ABC):
+    """
+    제출 방식에 상관없는 공통 부분 (여러 문제 제출, 채점 결과 출력)
+
+    제출 방식마다 login()과 submit()을 구현합니다. (BOJSubmitter: selenium, HTTPSubmitter: requests)
+    """
+
+    name = None
+
+    def __init__(self, username: str, password: Optional[str], base_url: str = BASE_URL,
+                 timeout: float = 10):
+        """
+        Args:
+            username: 백준 아이디
+            password: 백준 비밀번호 (저장된 쿠키가 유효하면 없어도 됨)
+            base_url: 백준 주소 (테스트용 서버를 쓸 때 변경)
+            timeout: 페이지를 기다리는 최대 시간 (초)
+        """
         self.username = username
         self.password = password
-        self.driver = None
-        self.headless = headless
+        self.base_url = base_url.rstrip('/')
+        self.timeout = timeout
+        # 문제 번호 -> 마지막 채점 결과 (boj_status.parse_status_row 형식)
+        self.statuses = {}
+
+    @property
+    def login_url(self) -> str:
+        return f"{self.base_url}/login"
 
     def __enter__(self):
-        self._init_driver()
+        self.open()
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def open(self):
+        pass
+
+    def close(self):
+        pass
+
+    @abstractmethod
+    def login(self) -> bool:
+        """백준에 로그인합니다. 성공하면 True"""
+
+    @abstractmethod
+    def submit(self, problem_id: int, code_path: Path, language: str = "Python 3") -> bool:
+        """코드 파일 하나를 제출합니다. 제출에 성공하면 True"""
+
+    def submit_all(self, submissions: List[Tuple[int, Path]], language: str = "Python 3",
+                   languages: Optional[Dict[int, str]] = None) -> Dict[int, bool]:
+        """
+        여러 문제를 로그인한 세션 하나로 차례대로 제출합니다.
+
+        Args:
+            submissions: (문제 번호, 코드 파일 경로) 리스트
+            language: 언어 (기본값: Python 3)
+            languages: 문제별로 다른 언어를 쓸 때 {문제 번호: 언어} (없는 문제는 language 사용)
+
+        Returns:
+            {문제 번호: 제출 성공 여부} 딕셔너리
+        """
+        results = {}
+        for i, (problem_id, code_path) in enumerate(submissions, 1):
+            print(f"\n[{i}/{len(submissions)}] ", end="")
+            results[problem_id] = self.submit(problem_id, code_path, (languages or {}).get(problem_id, language))
+
+        if len(submissions) > 1:
+            succeeded = sum(results.values())
+            print("\n" + "=" * 50)
+            for problem_id in results:
+                status = self.statuses.get(problem_id)
+                print(f"  {problem_id}: {format_status(status) if status else '결과 확인 실패'}")
+            print(f"📊 제출 성공 {succeeded}개, 실패 {len(results) - succeeded}개")
+            failed = [str(pid) for pid, ok in results.items() if not ok]
+            if failed:
+                print(f"❌ 실패한 문제: {' '.join(failed)}")
+
+        return results
+
+    def _wait_for_verdict(self, problem_id: int, page: str, fetch, timeout: float = 120):
+        """
+        방금 제출한 코드의 채점 결과를 최종 결과가 나올 때까지 확인합니다.
+
+        제출 직후의 채점 현황 페이지(page)에서 맨 위 제출 번호를 찾고, 그 행만 간격을 늘려 가며
+        fetch()로 다시 확인합니다.
+        """
+        try:
+            solution_id = latest_solution_id(page)
+            if solution_id is None:
+                print("⚠️  채점 현황에서 제출 번호를 찾을 수 없습니다. 백준 사이트에서 직접 확인하세요.")
+                return
+
+            print(f"\n제출 번호 {solution_id}의 채점 결과를 확인하는 중...")
+
+            # 첫 확인은 이미 받은 페이지를 사용
+            loaded = [page]
+
+            def fetch_page() -> str:
+                return loaded.pop() if loaded else fetch()
+
+            status = wait_for_result(fetch_page, solution_id, timeout=timeout,
+                                     on_update=lambda s: print(f"  {s['result']}"))
+            if status is None:
+                print("⚠️  채점 현황에서 제출을 찾을 수 없습니다.")
+                return
+
+            self.statuses[problem_id] = status
+            if status['final']:
+                print(f"\n📊 채점 결과: {format_status(status)}")
+            else:
+                print(f"\n⚠️  {timeout:g}초 안에 채점이 끝나지 않았습니다. (현재: {status['result']})")
+
+        except Exception as e:
+            print(f"⚠️  결과 확인 중 오류: {e}")
+
+
+class BOJSubmitter(BaseSubmitter):
+    """백준 자동 제출 클래스 (selenium)"""
+
+    name = 'selenium'
+
+    def __init__(self, username: str, password: Optional[str], headless: bool = False,
+                 timeout: float = 10, base_url: str = BASE_URL):
+        """
+        Args:
+            username: 백준 아이디
+            password: 백준 비밀번호 (저장된 쿠키가 유효하면 없어도 됨)
+            headless: 헤드리스 모드로 실행할지 여부
+            timeout: 페이지 요소를 기다리는 최대 시간 (초)
+            base_url: 백준 주소 (테스트용 서버를 쓸 때 변경)
+        """
+        super().__init__(username, password, base_url=base_url, timeout=timeout)
+        self.driver = None
+        self.headless = headless
+
+    def open(self):
+        self._init_driver()
+
+    def close(self):
         if self.driver:
             self.driver.quit()
 
     def _init_driver(self):
         """Chrome WebDriver 초기화"""
+        if not load_selenium():
+            raise RuntimeError("selenium이 설치되어 있지 않습니다. (pip install selenium 또는 --backend http)")
+
         options = Options()
         if self.headless:
             options.add_argument('--headless')
@@ -46,43 +367,91 @@ class BOJSubmitter:
         options.add_argument('--no-sandbox')
         options.add_argument('--disable-dev-shm-usage')
 
+        # 고정된 대기 대신 필요한 요소가 나타날 때까지만 기다림 (WebDriverWait)
         self.driver = webdriver.Chrome(options=options)
-        self.driver.implicitly_wait(10)
+
+    def _wait(self) -> 'WebDriverWait':
+        return WebDriverWait(self.driver, self.timeout)
 
     def login(self) -> bool:
-        """백준에 로그인합니다."""
+        """
+        백준에 로그인합니다.
+
+        저장된 쿠키가 유효하면 로그인 폼을 거치지 않고, 로그인에 성공하면 쿠키를 저장합니다.
+        """
         try:
+            if self._restore_session():
+                print("✅ 저장된 로그인 세션 사용")
+                return True
+
+            if not self.password:
+                print("❌ 저장된 로그인 세션이 없거나 만료되었습니다. 비밀번호가 필요합니다.")
+                return False
+
             print("로그인 중...")
-            self.driver.get(self.LOGIN_URL)
+            self.driver.get(self.login_url)
 
             # 로그인 폼 찾기
-            username_input = self.driver.find_element(By.NAME, "login_user_id")
+            username_input = self._wait().until(
+                EC.presence_of_element_located((By.NAME, "login_user_id")))
             password_input = self.driver.find_element(By.NAME, "login_password")
 
             # 로그인 정보 입력
             username_input.send_keys(self.username)
             password_input.send_keys(self.password)
 
+            # 오래 유지되는 쿠키를 받도록 '로그인 상태 유지' 선택
+            for checkbox in self.driver.find_elements(By.NAME, "auto_login"):
+                if not checkbox.is_selected():
+                    checkbox.click()
+
             # 로그인 버튼 클릭
             login_button = self.driver.find_element(By.ID, "submit_button")
             login_button.click()
 
-            # 로그인 성공 확인
-            time.sleep(2)
+            # 로그인 페이지를 벗어나거나 (성공) 에러 메시지가 표시될 때까지 (실패) 대기
+            self._wait().until(lambda driver: '/login' not in driver.current_url or
+                               driver.find_elements(By.CLASS_NAME, "alert-danger"))
 
-            # 로그인 실패 시 에러 메시지가 표시됨
-            try:
-                error = self.driver.find_element(By.CLASS_NAME, "alert-danger")
-                print(f"❌ 로그인 실패: {error.text}")
+            errors = self.driver.find_elements(By.CLASS_NAME, "alert-danger")
+            if errors:
+                print(f"❌ 로그인 실패: {errors[0].text}")
                 return False
-            except:
-                print("✅ 로그인 성공")
-                return True
+
+            save_cookies(self.username, self.driver.get_cookies(), self.base_url)
+            print("✅ 로그인 성공")
+            return True
 
         except Exception as e:
             print(f"❌ 로그인 중 오류 발생: {e}")
             return False
 
+    def _restore_session(self) -> bool:
+        """저장된 쿠키로 로그인 상태를 복원합니다. 쿠키가 없거나 만료되었으면 False"""
+        cookies = load_cookies(self.username, self.base_url)
+        if not cookies:
+            return False
+
+        # 쿠키는 해당 도메인 페이지에 있을 때만 추가할 수 있음
+        self.driver.get(self.base_url)
+        for cookie in cookies:
+            try:
+                self.driver.add_cookie(cookie)
+            except Exception:
+                continue
+
+        self.driver.get(self.base_url)
+        if self._is_logged_in():
+            return True
+
+        self.driver.delete_all_cookies()
+        clear_cookies(self.username, self.base_url)
+        return False
+
+    def _is_logged_in(self) -> bool:
+        """현재 페이지 상단 메뉴에 내 정보 링크가 있는지 확인합니다."""
+        return bool(self.driver.find_elements(By.CSS_SELECTOR, f'a[href="/user/{self.username}"]'))
+
     def submit(self, problem_id: int, code_path: Path, language: str = "Python 3") -> bool:
         """
         코드를 제출합니다.
@@ -96,18 +465,18 @@ class BOJSubmitter:
             제출 성공 여부
         """
         try:
-            # 코드 읽기
-            with open(code_path, 'r', encoding='utf-8') as f:
-                code = f.read()
+            # 코드 읽기 (boj_lib 사용 부분은 합침)
+            code = read_code(code_path)
 
             print(f"문제 {problem_id}에 코드를 제출합니다...")
 
             # 제출 페이지로 이동
-            submit_url = f"{self.BASE_URL}/submit/{problem_id}"
+            submit_url = f"{self.base_url}/submit/{problem_id}"
             self.driver.get(submit_url)
 
             # 언어 선택
-            language_select = self.driver.find_element(By.NAME, "language")
+            language_select = self._wait().until(
+                EC.presence_of_element_located((By.NAME, "language")))
             for option in language_select.find_elements(By.TAG_NAME, "option"):
                 if language in option.text:
                     option.click()
@@ -121,13 +490,12 @@ class BOJSubmitter:
             submit_button = self.driver.find_element(By.ID, "submit_button")
             submit_button.click()
 
+            # 제출 후 채점 현황 페이지로 이동할 때까지 대기
+            self._wait().until(EC.url_contains("/status"))
             print("✅ 제출 완료")
 
-            # 결과 페이지 대기
-            time.sleep(2)
-
             # 결과 확인 (선택사항)
-            self._check_result()
+            self._check_result(problem_id)
 
             return True
 
@@ -135,85 +503,282 @@ class BOJSubmitter:
             print(f"❌ 제출 중 오류 발생: {e}")
             return False
 
-    def _check_result(self):
-        """제출 결과를 확인합니다."""
+    def _check_result(self, problem_id: int):
+        """채점 현황 페이지를 새로 고치며 채점 결과를 확인합니다."""
+        def fetch() -> str:
+            self.driver.refresh()
+            self._wait().until(EC.presence_of_element_located((By.ID, "status-table")))
+            return self.driver.page_source
+
+        self._wait_for_verdict(problem_id, self.driver.page_source, fetch)
+
+
+class HTTPSubmitter(BaseSubmitter):
+    """
+    브라우저 없이 제출하는 클래스 (requests)
+
+    로그인/제출 페이지의 폼을 파싱해서 CSRF 토큰 등 hidden 값을 그대로 담아 전송합니다.
+    """
+
+    name = 'http'
+
+    def __init__(self, username: str, password: Optional[str], timeout: float = 10,
+                 base_url: str = BASE_URL):
+        super().__init__(username, password, base_url=base_url, timeout=timeout)
+        self.session = None
+
+    def open(self):
+        load_http()
+        self.session = requests.Session()
+        self.session.headers.update({
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+        })
+        # 로그인/제출/채점 현황 요청이 커넥션 하나를 계속 재사용
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=2)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
+    def close(self):
+        if self.session:
+            self.session.close()
+
+    def _get(self, url: str) -> 'requests.Response':
+        response = self.session.get(url, timeout=self.timeout)
+        response.raise_for_status()
+        return response
+
+    def login(self) -> bool:
+        """
+        백준에 로그인합니다.
+
+        저장된 쿠키가 유효하면 로그인 폼을 거치지 않고, 로그인에 성공하면 쿠키를 저장합니다.
+        """
         try:
-            # 상태 페이지로 이동
-            status_url = f"{self.BASE_URL}/status?user_id={self.username}"
-            self.driver.get(status_url)
+            if self._restore_session():
+                print("✅ 저장된 로그인 세션 사용")
+                return True
+
+            if not self.password:
+                print("❌ 저장된 로그인 세션이 없거나 만료되었습니다. 비밀번호가 필요합니다.")
+                return False
 
-            print("\n제출 결과를 확인하는 중...")
-            print("(채점 중일 수 있습니다. 백준 사이트에서 직접 확인하세요)")
+            print("로그인 중...")
+            page = self._get(self.login_url)
+            form = parse_form(page.text, 'login_password')
+            if form is None:
+                print("❌ 로그인 폼을 찾을 수 없습니다.")
+                return False
 
-            # 최신 제출 결과 확인
-            time.sleep(3)
-            result_row = self.driver.find_element(By.CSS_SELECTOR, "#status-table tbody tr")
-            result = result_row.find_element(By.CSS_SELECTOR, "td.result")
+            fields = form['fields']
+            fields['login_user_id'] = self.username
+            fields['login_password'] = self.password
+            # 오래 유지되는 쿠키를 받도록 '로그인 상태 유지' 선택
+            fields['auto_login'] = '1'
+
+            response = self.session.post(urljoin(page.url, form['action']), data=fields,
+                                         timeout=self.timeout)
+            response.raise_for_status()
+
+            # 로그인 페이지에 그대로 있으면 실패 (에러 메시지가 표시됨)
+            soup = BeautifulSoup(response.text, 'html.parser')
+            error = soup.select_one('.alert-danger')
+            if error or urlparse(response.url).path.startswith('/login'):
+                message = error.get_text(' ', strip=True) if error else "로그인 페이지를 벗어나지 못했습니다."
+                print(f"❌ 로그인 실패: {message}")
+                return False
 
-            print(f"\n📊 최신 제출 결과: {result.text}")
+            save_cookies(self.username, self._export_cookies(), self.base_url)
+            print("✅ 로그인 성공")
+            return True
 
-        except Exception as e:
-            print(f"⚠️  결과 확인 중 오류: {e}")
+        except requests.RequestException as e:
+            print(f"❌ 로그인 중 오류 발생: {e}")
+            return False
 
+    def _restore_session(self) -> bool:
+        """저장된 쿠키로 로그인 상태를 복원합니다. 쿠키가 없거나 만료되었으면 False"""
+        cookies = load_cookies(self.username, self.base_url)
+        if not cookies:
+            return False
 
-def find_problem_dir(problem_id: str, base_dir: str = "problems") -> Optional[Path]:
-    """문제 번호로 문제 디렉토리를 찾습니다."""
-    base_path = Path(base_dir)
+        for cookie in cookies:
+            self.session.cookies.set(cookie['name'], cookie['value'],
+                                     domain=cookie.get('domain', ''), path=cookie.get('path', '/'))
 
-    if not base_path.exists():
-        return None
+        if self._is_logged_in(self._get(self.base_url).text):
+            return True
 
-    # 문제 번호로 시작하는 디렉토리 찾기
-    for dir_path in base_path.iterdir():
-        if dir_path.is_dir() and dir_path.name.startswith(f"{problem_id}_"):
-            return dir_path
+        self.session.cookies.clear()
+        clear_cookies(self.username, self.base_url)
+        return False
+
+    def _is_logged_in(self, html: str) -> bool:
+        """페이지 상단 메뉴에 내 정보 링크가 있는지 확인합니다."""
+        soup = BeautifulSoup(html, 'html.parser')
+        return soup.select_one(f'a[href="/user/{self.username}"]') is not None
+
+    def _export_cookies(self) -> List[dict]:
+        """세션 쿠키를 selenium get_cookies() 형식으로 바꿉니다. (두 방식이 같은 파일을 사용)"""
+        cookies = []
+        for cookie in self.session.cookies:
+            item = {'name': cookie.name, 'value': cookie.value,
+                    'domain': cookie.domain, 'path': cookie.path}
+            if cookie.expires:
+                item['expiry'] = cookie.expires
+            cookies.append(item)
+        return cookies
 
-    return None
+    def submit(self, problem_id: int, code_path: Path, language: str = "Python 3") -> bool:
+        """
+        코드를 제출합니다.
+
+        Args:
+            problem_id: 문제 번호
+            code_path: 코드 파일 경로
+            language: 언어 (기본값: Python 3)
+
+        Returns:
+            제출 성공 여부
+        """
+        try:
+            # 코드 읽기 (boj_lib 사용 부분은 합침)
+            code = read_code(code_path)
+
+            print(f"문제 {problem_id}에 코드를 제출합니다...")
+
+            page = self._get(f"{self.base_url}/submit/{problem_id}")
+            form = parse_form(page.text, 'source')
+            if form is None:
+                print("❌ 제출 폼을 찾을 수 없습니다. (로그인이 풀렸거나 제출할 수 없는 문제)")
+                return False
+
+            # 언어 선택
+            language_value = find_language(form['options'].get('language', []), language)
+            if language_value is None:
+                print(f"❌ 제출 폼에서 언어를 찾을 수 없습니다: {language}")
+                return False
+
+            fields = form['fields']
+            fields['language'] = language_value
+            fields['source'] = code
+
+            response = self.session.post(urljoin(page.url, form['action']), data=fields,
+                                         timeout=self.timeout)
+            response.raise_for_status()
+
+            # 제출에 성공하면 채점 현황 페이지로 이동함
+            if '/status' not in urlparse(response.url).path:
+                error = BeautifulSoup(response.text, 'html.parser').select_one('.alert-danger')
+                print(f"❌ 제출 실패: {error.get_text(' ', strip=True) if error else response.url}")
+                return False
+
+            print("✅ 제출 완료")
+
+            # 결과 확인 (선택사항)
+            self._wait_for_verdict(problem_id, response.text, lambda: self._get(response.url).text)
+
+            return True
+
+        except (requests.RequestException, BundleError, SyntaxError) as e:
+            print(f"❌ 제출 중 오류 발생: {e}")
+            return False
 
 
-def main():
-    parser = argparse.ArgumentParser(description='백준에 코드를 자동으로 제출합니다.')
-    parser.add_argument('problem_id', type=str, help='백준 문제 번호')
+def create_submitter(backend: str, username: str, password: Optional[str],
+                     headless: bool = False, base_url: str = BASE_URL) -> BaseSubmitter:
+    """제출 방식('selenium' 또는 'http')에 맞는 제출기를 생성합니다."""
+    if backend == 'http':
+        return HTTPSubmitter(username, password, base_url=base_url)
+    return BOJSubmitter(username, password, headless, base_url=base_url)
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(
+        description='백준에 코드를 자동으로 제출합니다.',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+사용 예시:
+  python boj_submit.py 1000 1411 16401                # 로그인 한 번으로 차례대로 제출
+  python boj_submit.py 1000 --backend http            # 브라우저 없이 제출
+  python boj_submit.py 1411 --language auto           # 예제를 python3/pypy3로 실행해서 빠른 언어로 제출
+  python boj_submit.py 1000 --backend http --base-url http://127.0.0.1:8765   # 테스트용 서버에 제출
+  python boj_bundle.py ../problems/16401_16401/solution.py                     # 제출될 코드 미리 보기
+        """
+    )
+    parser.add_argument('problem_ids', type=str, nargs='+', help='백준 문제 번호 (여러 개 가능)')
     parser.add_argument('--username', type=str, help='백준 아이디 (환경변수 BOJ_USERNAME 사용 가능)')
-    parser.add_argument('--password', type=str, help='백준 비밀번호 (환경변수 BOJ_PASSWORD 사용 가능)')
+    parser.add_argument('--password', type=str,
+                        help='백준 비밀번호 (환경변수 BOJ_PASSWORD 사용 가능, 저장된 로그인 쿠키가 유효하면 생략 가능)')
     parser.add_argument('--dir', type=str, default='problems', help='문제가 저장된 디렉토리')
-    parser.add_argument('--headless', action='store_true', help='헤드리스 모드로 실행')
+    parser.add_argument('--backend', type=str, choices=SUBMIT_BACKENDS, default='selenium',
+                        help='제출 방식: selenium(Chrome), http(브라우저 없이) (기본값: selenium)')
+    parser.add_argument('--base-url', type=str, default=BASE_URL,
+                        help=f'백준 주소 (기본값: {BASE_URL}, 테스트용 서버를 쓸 때 변경)')
+    parser.add_argument('--language', type=str, choices=SUBMIT_LANGUAGES, default='Python 3',
+                        help='제출 언어, auto는 예제를 python3/pypy3로 실행해서 더 빠른 언어 (기본값: Python 3)')
+    parser.add_argument('--headless', action='store_true', help='헤드리스 모드로 실행 (selenium)')
+    parser.add_argument('--logout', action='store_true', help='저장된 로그인 쿠키를 지우고 다시 로그인')
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     # 로그인 정보 가져오기
     username = args.username or os.getenv('BOJ_USERNAME')
     password = args.password or os.getenv('BOJ_PASSWORD')
 
-    if not username or not password:
+    if username and args.logout:
+        clear_cookies(username, args.base_url)
+
+    if not username or not (password or load_cookies(username, args.base_url)):
         print("❌ 백준 아이디와 비밀번호를 제공해야 합니다.")
         print("방법 1: --username과 --password 옵션 사용")
         print("방법 2: BOJ_USERNAME과 BOJ_PASSWORD 환경변수 설정")
         sys.exit(1)
 
-    # 문제 디렉토리 찾기
-    problem_dir = find_problem_dir(args.problem_id, args.dir)
-
-    if not problem_dir:
-        print(f"❌ 문제 디렉토리를 찾을 수 없습니다: {args.problem_id}")
+    if args.backend == 'selenium' and not load_selenium():
+        print("❌ selenium이 설치되어 있지 않습니다. pip install selenium 또는 --backend http를 사용하세요.")
         sys.exit(1)
 
-    solution_path = problem_dir / "solution.py"
+    # 문제 디렉토리 찾기 (모든 문제를 먼저 확인한 뒤 브라우저를 띄움)
+    submissions = []
+    languages = {}
+    for problem_arg in args.problem_ids:
+        problem_dir = resolve_problem_dir(problem_arg, args.dir)
+        problem_id = parse_problem_id(problem_dir.name) if problem_dir else None
 
-    if not solution_path.exists():
-        print(f"❌ solution.py 파일을 찾을 수 없습니다: {solution_path}")
-        sys.exit(1)
+        if not problem_dir or problem_id is None:
+            print(f"❌ 문제 디렉토리를 찾을 수 없습니다: {problem_arg}")
+            sys.exit(1)
+
+        solution_path = problem_dir / "solution.py"
+
+        if not solution_path.exists():
+            print(f"❌ solution.py 파일을 찾을 수 없습니다: {solution_path}")
+            sys.exit(1)
+
+        # 로그인 전에 합칠 수 있는지 먼저 확인
+        try:
+            code = read_code(solution_path)
+        except (BundleError, SyntaxError) as e:
+            print(f"❌ {problem_id}번 코드를 합칠 수 없습니다: {e}")
+            sys.exit(1)
+
+        print(f"📄 {problem_id}번 코드 파일: {solution_path}")
+        if BUNDLE_BEGIN in code:
+            print(f"📦 boj_lib 사용 부분을 합쳐서 제출합니다. ({len(code.encode('utf-8'))} bytes)")
+        if args.language == 'auto':
+            languages[problem_id], reason = choose_language(problem_dir)
+            print(f"⚡ 제출 언어: {languages[problem_id]} ({reason})")
+        submissions.append((problem_id, solution_path))
 
-    print(f"📂 문제 디렉토리: {problem_dir}")
-    print(f"📄 코드 파일: {solution_path}\n")
+    print()
 
     # 제출
-    with BOJSubmitter(username, password, args.headless) as submitter:
+    with create_submitter(args.backend, username, password, args.headless, args.base_url) as submitter:
         if not submitter.login():
             sys.exit(1)
 
-        success = submitter.submit(int(args.problem_id), solution_path)
-        sys.exit(0 if success else 1)
+        results = submitter.submit_all(submissions, args.language, languages)
+        sys.exit(0 if all(results.values()) else 1)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,265 @@
+"""
+solution.py 템플릿 생성 모듈
+예제 입력들의 구조(첫 줄의 개수 N과 그 뒤 N줄, 줄마다 같은 개수의 값 등)를 추론해서,
+입력 전체를 sys.stdin.buffer에서 한 번에 읽고 값의 타입대로 변환하는 read_input()을 만듭니다.
+
+출력도 print를 여러 번 부르지 않고 한 번에 이어 붙여서 씁니다.
+(Python에서 줄 단위 입출력은 입력이 큰 문제에서 시간 초과의 흔한 원인)
+"""
+import re
+from typing import Dict, List, Optional
+
+_INT = re.compile(r'[-+]?\d+$')
+_FLOAT = re.compile(r'[-+]?(\d+\.\d*|\.\d+|\d+)([eE][-+]?\d+)?$')
+
+# 첫 줄 값 개수에 따른 변수 이름
+HEADER_NAMES = {1: ['n'], 2: ['n', 'm'], 3: ['n', 'm', 'k']}
+VALUE_NAMES = {1: ['n'], 2: ['a', 'b'], 3: ['a', 'b', 'c']}
+
+WRITE_OUTPUT = '''
+def write_output(output_data):
+    """출력 데이터를 한 번에 출력 (리스트는 한 줄에 하나씩, 줄이 리스트면 공백으로 구분)"""
+    if isinstance(output_data, (str, int, float)):
+        sys.stdout.write(f"{output_data}\\n")
+        return
+    sys.stdout.write('\\n'.join(
+        str(row) if isinstance(row, (str, int, float)) else ' '.join(map(str, row))
+        for row in output_data) + '\\n')
+'''
+
+
+def token_type(token: str) -> str:
+    """값 하나의 타입 ('int', 'float', 'str')"""
+    if _INT.match(token):
+        # '0101' 같은 격자 줄은 숫자로 바꾸면 앞의 0이 사라지므로 문자열
+        return 'str' if len(token.lstrip('+-')) > 1 and token.lstrip('+-')[0] == '0' else 'int'
+    if _FLOAT.match(token):
+        return 'float'
+    return 'str'
+
+
+def _merge_types(a: str, b: str) -> str:
+    if a == b:
+        return a
+    if {a, b} == {'int', 'float'}:
+        return 'float'
+    return 'str'
+
+
+def _column_types(rows: List[List[str]]) -> Optional[List[str]]:
+    """모든 줄의 값 개수가 같으면 열별 타입, 아니면 None"""
+    if not rows or len({len(row) for row in rows}) != 1 or not rows[0]:
+        return None
+    types = [token_type(token) for token in rows[0]]
+    for row in rows[1:]:
+        types = [_merge_types(t, token_type(token)) for t, token in zip(types, row)]
+    return types
+
+
+def _uniform(types: List[str]) -> Optional[str]:
+    """모든 값의 타입이 같으면 그 타입 (int와 float가 섞이면 float)"""
+    merged = types[0]
+    for t in types[1:]:
+        merged = _merge_types(merged, t)
+    return None if merged == 'str' and len(set(types)) > 1 else merged
+
+
+def _count_positions(headers: List[List[str]], counts: List[int]) -> List[int]:
+    """모든 예제에서 첫 줄의 j번째 값이 counts와 같은 위치 j들"""
+    positions = []
+    for j in range(min(len(header) for header in headers)):
+        if all(_INT.match(header[j]) and int(header[j]) == count
+               for header, count in zip(headers, counts)):
+            positions.append(j)
+    return positions
+
+
+def infer_input_format(inputs: List[str]) -> Dict:
+    """
+    예제 입력들에 공통된 입력 구조를 추론합니다.
+
+    Returns:
+        {'kind': ..., ...} 딕셔너리. kind는 다음 중 하나
+        - 'values': 한 줄에 값 몇 개 ('types')
+        - 'array': 첫 줄 ('header')의 count번째 값 N, 다음 줄에 값 N개 ('type')
+        - 'counted': 첫 줄 ('header')의 count번째 값 N, 다음 N줄 ('columns': 줄마다 같은 개수의 값, None이면 줄 문자열)
+        - 'rows': 개수 없이 줄마다 같은 개수의 값이 끝까지 ('columns')
+        - 'tokens': 모든 값이 같은 숫자 타입 ('type')
+        - 'lines': 그 외 (줄 문자열 리스트)
+    """
+    examples = [[line.split() for line in text.replace('\r', '').strip('\n').split('\n')]
+                for text in inputs if text.strip()]
+    if not examples:
+        return {'kind': 'lines'}
+
+    # 한 줄에 같은 개수의 값
+    if all(len(lines) == 1 for lines in examples):
+        types = _column_types([lines[0] for lines in examples])
+        if types:
+            return {'kind': 'values', 'types': types}
+
+    headers = [lines[0] for lines in examples]
+    header_types = _column_types(headers)
+
+    if header_types:
+        # 첫 줄의 N, 다음 줄에 값 N개
+        if all(len(lines) == 2 for lines in examples):
+            positions = _count_positions(headers, [len(lines[1]) for lines in examples])
+            if positions:
+                item_type = _uniform([token_type(token) for lines in examples for token in lines[1]])
+                if item_type:
+                    return {'kind': 'array', 'header': header_types, 'count': positions[0],
+                            'type': item_type}
+
+        # 첫 줄의 N, 다음 N줄
+        positions = _count_positions(headers, [len(lines) - 1 for lines in examples])
+        if positions:
+            rows = [row for lines in examples for row in lines[1:]]
+            return {'kind': 'counted', 'header': header_types, 'count': positions[0],
+                    'columns': _column_types(rows)}
+
+    # 줄마다 같은 개수의 값
+    columns = _column_types([row for lines in examples for row in lines])
+    if columns and any(len(lines) > 1 for lines in examples):
+        return {'kind': 'rows', 'columns': columns}
+
+    tokens = [token_type(token) for lines in examples for row in lines for token in row]
+    if tokens and _uniform(tokens) in ('int', 'float'):
+        return {'kind': 'tokens', 'type': _uniform(tokens)}
+
+    return {'kind': 'lines'}
+
+
+def _convert(value_type: str, expr: str, decoded: bool = False) -> str:
+    """expr(bytes 값, decoded면 str 값)을 value_type으로 바꾸는 식"""
+    if value_type == 'int':
+        return f"int({expr})"
+    if value_type == 'float':
+        return f"float({expr})"
+    return expr if decoded else f"{expr}.decode()"
+
+
+def _convert_all(value_type: str, expr: str) -> str:
+    if value_type in ('int', 'float'):
+        return f"list(map({value_type}, {expr}))"
+    return f"[token.decode() for token in {expr}]"
+
+
+def _header_code(types: List[str], source: str = 'data', decoded: bool = False) -> tuple:
+    """
+    첫 줄 값들을 읽는 코드
+
+    Returns:
+        (코드 줄 리스트, 변수 이름 리스트) 튜플
+    """
+    names = HEADER_NAMES.get(len(types))
+    if names is None:
+        uniform = _uniform(types) or 'str'
+        if decoded and uniform == 'str':
+            return [f"header = {source}[:{len(types)}]"], ['header']
+        return [f"header = {_convert_all(uniform, f'{source}[:{len(types)}]')}"], ['header']
+
+    values = [_convert(t, f"{source}[{i}]", decoded) for i, t in enumerate(types)]
+    return [f"{', '.join(names)} = {', '.join(values)}"], names
+
+
+def _count_expr(names: List[str], position: int) -> str:
+    """첫 줄 변수들 중 개수 N을 가리키는 식"""
+    return f"header[{position}]" if names == ['header'] else names[position]
+
+
+def _rows_code(columns: List[str], start: int = 0, count: Optional[str] = None) -> List[str]:
+    """
+    data[start]부터 count줄 (None이면 끝까지), 줄마다 len(columns)개의 값을 읽는 코드 (결과는 rows)
+    """
+    k = len(columns)
+    uniform = _uniform(columns)
+    if count is None:
+        source = f"data[{start}:]" if start else "data"
+        end = "len(data)"
+    else:
+        end = f"{start} + {count}" if k == 1 else f"{start} + {count} * {k}"
+        source = f"data[{start}:{end}]"
+
+    if k == 1:
+        return [f"rows = {_convert_all(columns[0], source)}"]
+    if uniform:
+        return [f"values = {_convert_all(uniform, source)}",
+                f"rows = [values[i:i + {k}] for i in range(0, len(values), {k})]"]
+
+    row = ', '.join(_convert(t, f"data[i + {j}]" if j else "data[i]") for j, t in enumerate(columns))
+    return [f"rows = [({row}) for i in range({start}, {end}, {k})]"]
+
+
+def render_read_input(fmt: Dict) -> tuple:
+    """
+    추론한 입력 구조로 read_input() 코드를 만듭니다.
+
+    Returns:
+        (read_input 함수 코드, solve()에서 input_data를 풀어 쓸 변수 이름 문자열) 튜플
+    """
+    kind = fmt['kind']
+    read_tokens = "data = sys.stdin.buffer.read().split()"
+
+    if kind == 'values':
+        types = fmt['types']
+        names = VALUE_NAMES.get(len(types))
+        if len(types) == 1 and types[0] == 'str':
+            names = ['s']
+        if names:
+            values = ', '.join(_convert(t, f"data[{i}]") for i, t in enumerate(types))
+            body, doc = [read_tokens, f"return {values}"], "한 줄의 값"
+        else:
+            names = ['values']
+            body = [read_tokens, f"return {_convert_all(_uniform(types) or 'str', 'data')}"]
+            doc = "한 줄의 값 리스트"
+
+    elif kind == 'array':
+        header, names = _header_code(fmt['header'])
+        count = _count_expr(names, fmt['count'])
+        start = len(fmt['header'])
+        body = [read_tokens, *header,
+                f"array = {_convert_all(fmt['type'], f'data[{start}:{start} + {count}]')}",
+                f"return {', '.join(names)}, array"]
+        names = names + ['array']
+        doc = "첫 줄과 다음 줄의 값 N개"
+
+    elif kind == 'counted' and fmt['columns']:
+        header, names = _header_code(fmt['header'])
+        count = _count_expr(names, fmt['count'])
+        body = [read_tokens, *header, *_rows_code(fmt['columns'], len(fmt['header']), count),
+                f"return {', '.join(names)}, rows"]
+        names = names + ['rows']
+        doc = "첫 줄과 다음 N줄"
+
+    elif kind == 'counted':
+        # 줄마다 값 개수가 다르면 (문장 등) 줄 단위로 나눔
+        header, names = _header_code(fmt['header'], source='first', decoded=True)
+        count = _count_expr(names, fmt['count'])
+        body = ["lines = sys.stdin.buffer.read().decode().split('\\n')",
+                "first = lines[0].split()", *header,
+                f"rows = [line.rstrip() for line in lines[1:1 + {count}]]",
+                f"return {', '.join(names)}, rows"]
+        names = names + ['rows']
+        doc = "첫 줄과 다음 N줄 (줄 문자열)"
+
+    elif kind == 'rows':
+        body = [read_tokens, *_rows_code(fmt['columns']), "return rows"]
+        names, doc = ['rows'], "줄마다 같은 개수의 값"
+
+    elif kind == 'tokens':
+        body = [read_tokens, f"return {_convert_all(fmt['type'], 'data')}"]
+        names, doc = ['values'], "모든 값"
+
+    else:
+        body = ["return sys.stdin.buffer.read().decode().splitlines()"]
+        names, doc = ['lines'], "줄 문자열 리스트"
+
+    code = '\n'.join([
+        "",
+        "def read_input():",
+        f'    """입력 전체를 한 번에 읽어서 반환 ({doc})"""',
+        *[f"    {line}" for line in body],
+        "",
+    ])
+    return code, ', '.join(names)
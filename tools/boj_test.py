@@ -1,21 +1,66 @@
 """
 백준 문제 로컬 테스트 스크립트
 예제 입력으로 solution.py를 실행하고 출력을 비교합니다.
+--profile로 케이스 하나를 함수 단위로 프로파일링할 수 있습니다. (boj_profile.py)
+--interpreters로 여러 인터프리터(python3.x, pypy3)의 실행 시간을 비교할 수 있습니다. (verify.py와 같은 방식)
 """
 import os
 import sys
+import time
 import argparse
-import subprocess
+import tempfile
 from pathlib import Path
-from typing import List, Tuple
+from typing import List, Optional, Set
+
+from boj_compare import compare_output, format_mismatch, output_limit, preview
+from boj_limits import judge_limits
+from boj_registry import ProblemRegistry, case_number, resolve_problem_dir
+from boj_runner import (DEFAULT_INTERPRETERS, RUNNER_MODES, create_runner, limits_timeout, print_usage_table,
+                        solution_imports)
+from boj_watch import FileWatcher
+
+# 감시 모드에서 다시 테스트할 파일 (편집기 임시 파일 등은 무시)
+WATCHED_SUFFIXES = ('.py', '.txt', '.json', '.md')
 
 
 class BOJTester:
     """백준 문제 테스터"""
 
-    def __init__(self, problem_dir: Path):
+    def __init__(self, problem_dir: Path, runner_mode: str = 'auto',
+                 language: Optional[str] = 'Python 3', enforce_limits: bool = True,
+                 registry: Optional[ProblemRegistry] = None):
         self.problem_dir = Path(problem_dir)
         self.solution_path = self.problem_dir / "solution.py"
+        self.runner_mode = runner_mode
+        self.language = language
+        self.enforce_limits = enforce_limits
+        self.runner = None
+        self.results = []
+        self.registry = registry or ProblemRegistry(self.problem_dir.parent)
+
+        # 입력/예상 출력 파일 내용 (경로 -> ((수정 시각, 크기), 내용)), 감시 모드에서 바뀐 파일만 다시 읽음
+        self._file_cache = {}
+        self._load_problem()
+
+    def _load_problem(self):
+        """테스트 케이스와 시간/메모리 제한을 읽습니다. (레지스트리 인덱스에서 조회)"""
+        self.problem = self.registry.describe(self.problem_dir)
+        self.limits = self.problem['limits'] if self.enforce_limits else None
+        if self.limits:
+            self.limits = judge_limits(self.limits, self.language)
+        self.timeout = limits_timeout(self.limits, 10)
+
+    def _read_cached(self, path: Path) -> bytes:
+        """파일 내용을 읽습니다. 수정 시각과 크기가 그대로면 메모리에 있는 내용을 사용합니다."""
+        stat = path.stat()
+        key = (stat.st_mtime_ns, stat.st_size)
+        cached = self._file_cache.get(path)
+        if cached and cached[0] == key:
+            return cached[1]
+
+        data = path.read_bytes()
+        self._file_cache[path] = (key, data)
+        return data
 
     def run_tests(self) -> bool:
         """
@@ -24,26 +69,168 @@ class BOJTester:
         Returns:
             모든 테스트 통과 여부
         """
+        with create_runner(self.solution_path, mode=self.runner_mode,
+                           limits=self.limits) as self.runner:
+            return self._run_all()
+
+    def compare_interpreters(self, names: List[str]) -> bool:
+        """
+        모든 테스트 케이스를 인터프리터마다 실행해서 실행 시간 표와 제출 추천 언어를 출력합니다.
+
+        PATH에 없거나 실행되지 않는 인터프리터는 건너뜁니다.
+
+        Returns:
+            찾은 인터프리터 중 하나라도 모든 테스트를 통과했는지 여부
+        """
+        from verify import compare_interpreters
+
+        if not self.problem['cases']:
+            print(f"[X] 입력 파일이 없습니다: {self.problem_dir / 'input'}")
+            return False
+        return compare_interpreters(self.problem, names, runner_mode=self.runner_mode,
+                                    enforce_limits=self.enforce_limits, strict_limits=self.language is None)
+
+    def profile(self, case: str, top: int = 15, prof_path: Optional[Path] = None) -> bool:
+        """
+        테스트 케이스 하나를 cProfile로 실행하고 상위 함수와 단계별 시간을 출력합니다.
+
+        프로파일링은 실행을 느리게 하므로 시간/메모리 제한은 적용하지 않습니다.
+
+        Args:
+            case: 테스트 케이스 번호
+            top: 출력할 상위 함수 수
+            prof_path: .prof 파일 경로 (기본값: .boj_cache/profiles/<문제 디렉토리>_<케이스>.prof)
+
+        Returns:
+            실행과 출력 비교 모두 성공했는지 여부
+        """
+        # cProfile/pstats는 --profile에서만 필요하므로 여기서 import (시작 시간 단축)
+        from boj_profile import print_report, profile_case, profile_path
+
+        cases = {case_number(input_file): (input_file, output_file)
+                 for input_file, output_file in self.problem['cases']}
+        if case not in cases:
+            print(f"[X] 테스트 케이스 {case}을(를) 찾을 수 없습니다. (있는 케이스: {', '.join(cases) or '없음'})")
+            return False
+
+        input_file, output_file = cases[case]
+        prof_path = Path(prof_path) if prof_path else profile_path(self.problem_dir, case)
+        print(f"[*] 테스트 케이스 {case}을(를) cProfile로 실행합니다...\n")
+
+        with tempfile.TemporaryDirectory(prefix='boj_profile_') as tmp_dir:
+            stdout_path = Path(tmp_dir) / 'stdout'
+            result = profile_case(self.solution_path, input_file, prof_path, stdout_path=stdout_path)
+            mismatch = compare_output(stdout_path, output_file) if output_file.exists() else None
+
+        if result.timed_out or result.returncode != 0:
+            print(f"[X] {'시간 초과' if result.timed_out else '런타임 에러'} (종료 코드 {result.returncode})")
+            if result.stderr:
+                print(result.stderr.rstrip())
+            print()
+        elif mismatch:
+            print("[X] 출력이 예상 출력과 다릅니다.")
+            print(format_mismatch(mismatch) + "\n")
+        elif output_file.exists():
+            print("[O] 출력이 예상 출력과 같습니다.\n")
+
+        if not prof_path.exists():
+            print("[X] 프로파일 결과가 저장되지 않았습니다.")
+            return False
+
+        print_report(prof_path, self.solution_path, top=top)
+        print(f"\n[*] 프로파일 결과 저장: {prof_path}")
+        print(f"    (python -m pstats {prof_path} 로 자세히 볼 수 있습니다)")
+        return result.returncode == 0 and not result.timed_out and mismatch is None
+
+    def watch(self, debounce: float = 0.05, poll_interval: float = 0.2,
+              use_inotify: bool = True):
+        """
+        solution.py와 테스트 파일이 바뀔 때마다 테스트를 다시 실행합니다. (Ctrl+C로 종료)
+
+        실행기(포크 서버)는 계속 띄워 두고, solution.py의 import 문이 바뀐 경우에만 다시 띄웁니다.
+
+        Args:
+            debounce: 연달아 저장된 변경을 한 번으로 묶는 시간 (초)
+            poll_interval: inotify를 쓸 수 없을 때 수정 시각을 확인하는 간격 (초)
+            use_inotify: False면 항상 polling 방식 사용
+        """
+        directories = [self.problem_dir, self.problem_dir / "input", self.problem_dir / "output"]
+        watcher = FileWatcher(directories, poll_interval=poll_interval, use_inotify=use_inotify)
+        imports = solution_imports(self.solution_path)
+        self.runner = create_runner(self.solution_path, mode=self.runner_mode, limits=self.limits)
+
+        print(f"[*] 감시 방식: {watcher.backend}, 실행 방식: {self.runner.name}\n")
+
+        try:
+            while True:
+                start = time.perf_counter()
+                self._run_all()
+                elapsed = time.perf_counter() - start
+                print(f"\n[*] {elapsed * 1000:.0f} ms 걸림. 파일 변경을 기다리는 중... (Ctrl+C로 종료)")
+
+                changed = self._wait_for_changes(watcher, debounce)
+                names = ', '.join(sorted(str(p.relative_to(self.problem_dir)) for p in changed))
+                print(f"\n[*] 변경 감지: {names}\n")
+
+                limits = self.limits
+                if changed - {self.solution_path}:
+                    self._load_problem()
+
+                new_imports = solution_imports(self.solution_path)
+                restart = limits != self.limits or (
+                    self.solution_path in changed and
+                    (new_imports != imports or
+                     (self.runner.name == 'spawn' and self.runner_mode != 'spawn')))
+                if restart:
+                    # import가 바뀌었거나, 문법 오류로 spawn으로 대체된 뒤 고쳐진 경우 포크 서버를 다시 띄움
+                    self.runner.close()
+                    self.runner = create_runner(self.solution_path, mode=self.runner_mode,
+                                                limits=self.limits)
+                imports = new_imports
+
+        except KeyboardInterrupt:
+            print("\n[*] 감시를 종료합니다.")
+        finally:
+            self.runner.close()
+            watcher.close()
+
+    def _wait_for_changes(self, watcher: FileWatcher, debounce: float) -> Set[Path]:
+        """테스트 결과에 영향을 주는 파일이 바뀔 때까지 기다립니다."""
+        while True:
+            changed = {path for path in watcher.wait(debounce)
+                       if path.suffix in WATCHED_SUFFIXES and not path.name.startswith('.')}
+            if changed:
+                return changed
+
+    def _run_all(self) -> bool:
+        """현재 실행기로 모든 테스트 케이스를 실행하고 결과를 출력합니다."""
+        self.results = []
+
         if not self.solution_path.exists():
             print(f"[X] solution.py 파일을 찾을 수 없습니다: {self.solution_path}")
             return False
 
-        # 테스트 케이스 찾기
-        test_cases = self._find_test_cases()
+        # 테스트 케이스 (출력 파일이 없는 케이스는 제외)
+        test_cases = [(input_file, output_file) for input_file, output_file in self.problem['cases']
+                      if output_file.exists()]
 
         if not test_cases:
             print("[!] 테스트 케이스를 찾을 수 없습니다.")
             return False
 
+        if self.limits:
+            print(f"[*] 제한: 시간 {self.limits['time']:g}초, 메모리 {self.limits['memory']:g}MB")
         print(f"[*] {len(test_cases)}개의 테스트 케이스를 실행합니다...\n")
 
         all_passed = True
-        for i, (input_file, output_file) in enumerate(test_cases, 1):
-            passed = self._run_single_test(i, input_file, output_file)
+        for input_file, output_file in test_cases:
+            passed = self._run_single_test(case_number(input_file), input_file, output_file)
             if not passed:
                 all_passed = False
 
         print("\n" + "=" * 50)
+        print_usage_table(self.results)
+        print("=" * 50)
         if all_passed:
             print("[O] 모든 테스트를 통과했습니다!")
         else:
@@ -51,116 +238,133 @@ class BOJTester:
 
         return all_passed
 
-    def _find_test_cases(self) -> List[Tuple[Path, Path]]:
-        """테스트 케이스 파일들을 찾습니다."""
-        test_cases = []
-        i = 1
-        while True:
-            input_file = self.problem_dir / f"input{i}.txt"
-            output_file = self.problem_dir / f"output{i}.txt"
-
-            if not input_file.exists() or not output_file.exists():
-                break
-
-            test_cases.append((input_file, output_file))
-            i += 1
-
-        return test_cases
+    def _run_single_test(self, test_num: str, input_file: Path, output_file: Path) -> bool:
+        """
+        단일 테스트 케이스를 실행합니다.
 
-    def _run_single_test(self, test_num: int, input_file: Path, output_file: Path) -> bool:
-        """단일 테스트 케이스를 실행합니다."""
+        출력은 임시 파일로 받아서 예상 출력과 조각 단위로 비교하고 (boj_compare),
+        실패하면 처음 다른 위치와 입력 앞부분만 보여줍니다.
+        입력과 예상 출력은 메모리에 있는 내용을 사용하므로, 감시 모드에서는 바뀐 파일만 디스크에서 다시 읽습니다.
+        """
         print(f"테스트 케이스 {test_num}")
         print("-" * 50)
 
-        # 예상 출력 읽기
-        with open(output_file, 'r', encoding='utf-8') as f:
-            expected_output = f.read().strip()
-
-        # 입력 읽기
-        with open(input_file, 'r', encoding='utf-8') as f:
-            test_input = f.read()
-
         # solution.py 실행
         try:
-            result = subprocess.run(
-                [sys.executable, str(self.solution_path)],
-                input=test_input,
-                capture_output=True,
-                text=True,
-                timeout=10,
-                encoding='utf-8'
-            )
-
-            actual_output = result.stdout.strip()
-
-            # 출력 비교
-            if actual_output == expected_output:
+            test_input = self._read_cached(input_file)
+            expected_output = self._read_cached(output_file)
+
+            with tempfile.TemporaryDirectory(prefix='boj_test_') as tmp_dir:
+                stdout_path = Path(tmp_dir) / 'stdout'
+                expected_size = len(expected_output)
+                limit = output_limit(expected_size)
+                result = self.runner.run(input_file, timeout=self.timeout, stdout_path=stdout_path,
+                                         output_limit=limit, input_data=test_input)
+                if result.limit_exceeded:
+                    self.results.append((test_num, result.verdict, result))
+                    print(f"[X] {result.verdict} ({result.limit_exceeded})")
+                    if result.limit_exceeded == 'OLE':
+                        print(f"    출력이 {limit:,}바이트를 넘어서 중단했습니다. "
+                              f"(예상 출력 {expected_size:,}바이트)")
+                    return False
+
+                # 출력 비교
+                mismatch = compare_output(stdout_path, expected_output)
+
+            if mismatch is None:
+                self.results.append((test_num, "통과", result))
                 print("[O] 통과")
                 return True
-            else:
-                print("[X] 실패")
-                print(f"\n[입력]")
-                print(test_input.strip())
-                print(f"\n[예상 출력]")
-                print(expected_output)
-                print(f"\n[실제 출력]")
-                print(actual_output)
-
-                # stderr가 있으면 출력
-                if result.stderr:
-                    print(f"\n[에러]")
-                    print(result.stderr)
-
-                return False
-
-        except subprocess.TimeoutExpired:
-            print("[X] 시간 초과 (10초)")
+
+            self.results.append((test_num, result.verdict or "실패", result))
+            print("[X] 실패")
+            print(format_mismatch(mismatch))
+            print(f"\n[입력]")
+            print(preview(test_input))
+
+            # stderr가 있으면 출력
+            if result.stderr:
+                print(f"\n[에러]")
+                print(result.stderr)
+
             return False
+
         except Exception as e:
+            self.results.append((test_num, "오류", None))
             print(f"[X] 실행 중 오류 발생: {e}")
             return False
         finally:
             print()
 
 
-def find_problem_dir(problem_id: str, base_dir: str = "problems") -> Path:
-    """문제 번호로 문제 디렉토리를 찾습니다."""
-    base_path = Path(base_dir)
-
-    if not base_path.exists():
-        return None
-
-    # 문제 번호로 시작하는 디렉토리 찾기
-    for dir_path in base_path.iterdir():
-        if dir_path.is_dir() and dir_path.name.startswith(f"{problem_id}_"):
-            return dir_path
-
-    return None
-
-
-def main():
-    parser = argparse.ArgumentParser(description='백준 문제를 로컬에서 테스트합니다.')
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(
+        description='백준 문제를 로컬에서 테스트합니다.',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+사용 예시:
+  python boj_test.py 1411                 # 모든 예제 실행
+  python boj_test.py 1411 --watch         # 저장할 때마다 다시 테스트
+  python boj_test.py 1411 --profile 3     # 3번 케이스를 cProfile로 실행
+  python boj_test.py 1411 --interpreters python3.11,python3.12,pypy3   # 인터프리터별 실행 시간 비교
+        """
+    )
     parser.add_argument('problem_id', type=str, help='백준 문제 번호 또는 문제 디렉토리 경로')
     parser.add_argument('--dir', type=str, default='problems', help='문제가 저장된 기본 디렉토리')
-
-    args = parser.parse_args()
-
-    # 문제 디렉토리 찾기
-    if Path(args.problem_id).exists():
-        # 직접 경로가 주어진 경우
-        problem_dir = Path(args.problem_id)
-    else:
-        # 문제 번호가 주어진 경우
-        problem_dir = find_problem_dir(args.problem_id, args.dir)
-
-    if not problem_dir or not problem_dir.exists():
+    parser.add_argument('--runner', type=str, choices=RUNNER_MODES, default='auto',
+                        help='실행 방식: fork(미리 로딩된 인터프리터), spawn(케이스마다 새 인터프리터), '
+                             'auto(가능하면 fork) (기본값: auto)')
+    parser.add_argument('--strict-limits', action='store_true',
+                        help='Python 3 추가 시간/메모리 없이 문제의 원래 제한을 적용')
+    parser.add_argument('--no-limits', action='store_true',
+                        help='문제의 시간/메모리 제한을 적용하지 않음 (고정 10초 시간 초과만 사용)')
+    parser.add_argument('--watch', action='store_true',
+                        help='solution.py와 예제 파일이 바뀔 때마다 다시 테스트 (Ctrl+C로 종료)')
+    parser.add_argument('--debounce', type=float, default=50,
+                        help='--watch에서 연달아 저장된 변경을 묶는 시간 (ms, 기본값: 50)')
+    parser.add_argument('--poll', action='store_true',
+                        help='--watch에서 inotify 대신 수정 시각을 주기적으로 확인')
+    parser.add_argument('--profile', type=str, metavar='CASE',
+                        help='테스트 케이스 하나를 cProfile로 실행해서 상위 함수와 단계별 시간을 출력')
+    parser.add_argument('--top', type=int, default=15, help='--profile에서 출력할 상위 함수 수 (기본값: 15)')
+    parser.add_argument('--profile-out', type=str,
+                        help='--profile 결과(.prof) 저장 경로 (기본값: .boj_cache/profiles/<문제>_<케이스>.prof)')
+
+    parser.add_argument('--interpreters', type=str, nargs='?', const=','.join(DEFAULT_INTERPRETERS),
+                        help='쉼표로 구분한 인터프리터들로 모든 예제를 실행해서 실행 시간을 비교하고 '
+                             f'제출할 언어를 추천 (값을 생략하면 {",".join(DEFAULT_INTERPRETERS)})')
+
+    args = parser.parse_args(argv)
+    if args.interpreters and (args.watch or args.profile):
+        parser.error('--interpreters는 --watch, --profile과 함께 사용할 수 없습니다.')
+
+    # 문제 디렉토리 찾기 (직접 경로 또는 문제 번호)
+    problem_dir = resolve_problem_dir(args.problem_id, args.dir)
+
+    if not problem_dir:
         print(f"[X] 문제 디렉토리를 찾을 수 없습니다: {args.problem_id}")
         sys.exit(1)
 
     print(f"[*] 문제 디렉토리: {problem_dir}\n")
 
     # 테스트 실행
-    tester = BOJTester(problem_dir)
+    tester = BOJTester(problem_dir, runner_mode=args.runner,
+                       language=None if args.strict_limits else 'Python 3',
+                       enforce_limits=not args.no_limits)
+
+    if args.interpreters:
+        names = [name.strip() for name in args.interpreters.split(',') if name.strip()]
+        success = tester.compare_interpreters(names)
+        sys.exit(0 if success else 1)
+
+    if args.profile:
+        success = tester.profile(args.profile, top=args.top, prof_path=args.profile_out)
+        sys.exit(0 if success else 1)
+
+    if args.watch:
+        tester.watch(debounce=args.debounce / 1000, use_inotify=not args.poll)
+        sys.exit(0)
+
     success = tester.run_tests()
 
     sys.exit(0 if success else 1)
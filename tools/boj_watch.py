@@ -0,0 +1,169 @@
+"""
+파일 변경 감지 모듈
+리눅스에서는 inotify로 변경을 바로 받고, 그 외 환경에서는 수정 시각을 주기적으로 비교합니다.
+"""
+import os
+import time
+import errno
+import select
+import struct
+import ctypes
+import ctypes.util
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Set, Tuple
+
+
+# <sys/inotify.h>
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_NONBLOCK = os.O_NONBLOCK
+IN_CLOEXEC = getattr(os, 'O_CLOEXEC', 0)
+
+# 편집기는 파일을 덮어쓰거나 (CLOSE_WRITE) 임시 파일을 만든 뒤 이름을 바꿔서 (MOVED_TO) 저장함
+WATCH_MASK = IN_CLOSE_WRITE | IN_MOVED_TO | IN_MOVED_FROM | IN_CREATE | IN_DELETE
+
+_EVENT_HEADER = struct.Struct('iIII')
+
+
+class FileWatcher:
+    """디렉토리들(하위 디렉토리 제외) 안의 파일 변경을 감지하는 클래스"""
+
+    def __init__(self, directories: Iterable[Path], poll_interval: float = 0.2,
+                 use_inotify: bool = True):
+        """
+        Args:
+            directories: 감시할 디렉토리들
+            poll_interval: polling 방식일 때 수정 시각을 확인하는 간격 (초)
+            use_inotify: False면 inotify를 쓸 수 있어도 polling 방식 사용
+        """
+        self.directories = [Path(d) for d in directories if Path(d).is_dir()]
+        self.poll_interval = poll_interval
+        self._fd = None
+        self._watches = {}
+        self._snapshot = {}
+
+        if use_inotify:
+            self._start_inotify()
+        if self._fd is None:
+            self._snapshot = self._scan()
+
+    @property
+    def backend(self) -> str:
+        return 'inotify' if self._fd is not None else 'poll'
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def wait(self, debounce: float = 0.05) -> Set[Path]:
+        """
+        파일이 바뀔 때까지 기다립니다.
+
+        저장 한 번에 이벤트가 여러 개 오거나 여러 파일을 연달아 저장하는 경우를 묶기 위해,
+        첫 변경 이후 debounce초 동안 추가 변경이 없을 때까지 모아서 반환합니다.
+
+        Returns:
+            바뀐(생성/수정/삭제된) 파일 경로 집합
+        """
+        changed = self._poll(None)
+        while True:
+            more = self._poll(debounce)
+            if not more:
+                return changed
+            changed |= more
+
+    def close(self):
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+    def _poll(self, timeout: Optional[float]) -> Set[Path]:
+        """timeout초(None이면 무한히) 안에 생긴 변경을 반환합니다. 없으면 빈 집합"""
+        if self._fd is not None:
+            return self._read_inotify(timeout)
+
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            snapshot = self._scan()
+            changed = {path for path in snapshot.keys() | self._snapshot.keys()
+                       if snapshot.get(path) != self._snapshot.get(path)}
+            self._snapshot = snapshot
+            if changed:
+                return changed
+
+            if deadline is not None and time.monotonic() >= deadline:
+                return set()
+            wait = self.poll_interval if deadline is None else \
+                min(self.poll_interval, max(0.0, deadline - time.monotonic()))
+            time.sleep(wait)
+
+    def _scan(self) -> Dict[Path, Tuple[int, int]]:
+        """감시 중인 파일들의 (수정 시각, 크기)"""
+        snapshot = {}
+        for directory in self.directories:
+            try:
+                with os.scandir(directory) as it:
+                    for entry in it:
+                        if entry.is_file():
+                            st = entry.stat()
+                            snapshot[Path(entry.path)] = (st.st_mtime_ns, st.st_size)
+            except OSError:
+                continue
+        return snapshot
+
+    def _start_inotify(self):
+        """inotify를 쓸 수 있으면 감시를 등록합니다. (리눅스 전용, 실패하면 polling 방식)"""
+        library = ctypes.util.find_library('c')
+        if not library:
+            return
+
+        try:
+            libc = ctypes.CDLL(library, use_errno=True)
+            inotify_init1 = libc.inotify_init1
+            inotify_add_watch = libc.inotify_add_watch
+        except (OSError, AttributeError):
+            return
+
+        inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+        fd = inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if fd < 0:
+            return
+
+        for directory in self.directories:
+            wd = inotify_add_watch(fd, os.fsencode(directory), WATCH_MASK)
+            if wd < 0:
+                os.close(fd)
+                return
+            self._watches[wd] = directory
+
+        self._fd = fd
+
+    def _read_inotify(self, timeout: Optional[float]) -> Set[Path]:
+        readable, _, _ = select.select([self._fd], [], [], timeout)
+        if not readable:
+            return set()
+
+        changed = set()
+        while True:
+            try:
+                data = os.read(self._fd, 64 * 1024)
+            except OSError as e:
+                if e.errno in (errno.EAGAIN, errno.EWOULDBLOCK):
+                    break
+                raise
+
+            offset = 0
+            while offset < len(data):
+                wd, mask, cookie, length = _EVENT_HEADER.unpack_from(data, offset)
+                offset += _EVENT_HEADER.size
+                name = data[offset:offset + length].rstrip(b'\0')
+                offset += length
+                if wd in self._watches and name:
+                    changed.add(self._watches[wd] / os.fsdecode(name))
+
+        return changed
@@ -1,17 +1,433 @@
 """
 백준 문제 solution.py 검증 스크립트
 """
+import os
 import sys
-import subprocess
+import json
+import time
+import hashlib
+import argparse
+import tempfile
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
 
+from boj_compare import COMPARE_RULES, compare_output, format_mismatch, output_limit, preview
+from boj_limits import judge_limits
+from boj_meta import ProblemIndex, tier_name
+from boj_paths import CACHE_DIR
+from boj_registry import ProblemRegistry, case_number
+from boj_runner import (DEFAULT_INTERPRETERS, RUNNER_MODES, create_runner, find_interpreters,
+                        limits_timeout, pad, print_usage_table)
 
-def verify_solution(problem_dir: Path) -> bool:
+
+def _run_case(runner, input_file: Path, output_file: Path, timeout: float) -> dict:
+    """
+    단일 테스트 케이스를 실행하고 결과를 반환합니다.
+
+    출력은 하지 않으므로 여러 스레드에서 동시에 호출할 수 있습니다.
+    출력은 임시 파일로 받아서 예상 출력과 조각 단위로 비교하므로, 출력 전체를 메모리에 올리지 않습니다.
+
+    Returns:
+        테스트 결과 딕셔너리 (mismatch는 boj_compare.compare_output()의 결과)
+    """
+    case = {
+        'num': case_number(input_file),
+        'input_file': input_file,
+        'passed': False,
+        'mismatch': None,
+        'stderr': '',
+        'error': None,
+        'verdict': '오류',
+        'result': None,
+    }
+
+    if not output_file.exists():
+        case['error'] = f"출력 파일이 없습니다: {output_file.name}"
+        return case
+
+    try:
+        with tempfile.TemporaryDirectory(prefix='boj_verify_') as tmp_dir:
+            stdout_path = Path(tmp_dir) / 'stdout'
+            limit = output_limit(output_file.stat().st_size)
+            result = runner.run(input_file, timeout=timeout, stdout_path=stdout_path,
+                                output_limit=limit)
+            case['result'] = result
+            if result.limit_exceeded:
+                case['verdict'] = result.verdict
+                case['error'] = f"{result.verdict} ({result.limit_exceeded})"
+                if result.limit_exceeded == 'OLE':
+                    case['error'] += f" - 출력이 {limit:,}바이트를 넘었습니다."
+                return case
+
+            case['mismatch'] = compare_output(stdout_path, output_file)
+
+        case['stderr'] = result.stderr
+        case['passed'] = case['mismatch'] is None and not result.stderr
+        if case['passed']:
+            case['verdict'] = "통과"
+        else:
+            case['verdict'] = result.verdict or "실패"
+
+    except Exception as e:
+        case['error'] = f"오류 발생 - {e}"
+
+    return case
+
+
+def _print_case(case: dict):
+    """테스트 케이스 결과를 출력합니다."""
+    if case['error']:
+        print(f"[X] 테스트 케이스 {case['num']}: {case['error']}")
+        return
+
+    print(f"테스트 케이스 {case['num']}")
+    print("-" * 50)
+
+    if case['mismatch'] is None:
+        print("[O] 통과")
+    else:
+        print("[X] 실패")
+        print(format_mismatch(case['mismatch']))
+        print(f"\n[입력]")
+        print(preview(case['input_file']))
+
+    if case['stderr']:
+        print(f"\n[에러]")
+        print(case['stderr'])
+
+    print()
+
+
+class VerifyCache:
+    """
+    검증 결과 캐시
+
+    문제별로 solution.py와 입출력 파일 내용(과 검증 설정)의 해시를 저장해 두고,
+    해시가 같으면 지난번 통과 결과를 그대로 사용합니다.
+    파일 크기와 수정 시각이 그대로면 파일을 다시 읽지 않고 저장된 해시를 사용합니다.
+    """
+
+    def __init__(self, path: Optional[Path] = None):
+        self.path = Path(path) if path else CACHE_DIR / "verify.json"
+        self._entries = {}
+        if self.path.exists():
+            try:
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    self._entries = json.load(f)
+            except (OSError, ValueError):
+                self._entries = {}
+
+    def fingerprint(self, problem: Dict, settings: str) -> Tuple[str, List]:
+        """
+        문제의 현재 내용 해시를 계산합니다.
+
+        Args:
+            problem: ProblemRegistry가 반환한 문제 정보
+            settings: 검증 설정 (언어, 제한 적용 여부 등 결과에 영향을 주는 값)
+
+        Returns:
+            (해시, 파일별 [경로, 크기, 수정 시각] 리스트) 튜플
+        """
+        problem_dir = problem['dir']
+        files = [problem_dir / "solution.py"]
+        for input_file, output_file in problem['cases']:
+            files += [input_file, output_file]
+
+        stats = []
+        for path in files:
+            try:
+                st = path.stat()
+                stats.append([str(path.relative_to(problem_dir)), st.st_size, st.st_mtime_ns])
+            except OSError:
+                stats.append([str(path.relative_to(problem_dir)), -1, 0])
+
+        key = str(problem_dir.resolve())
+        cached = self._entries.get(key)
+        if cached and cached['stats'] == stats and cached['settings'] == settings:
+            return cached['hash'], stats
+
+        digest = hashlib.sha256(settings.encode())
+        for path in files:
+            digest.update(str(path.relative_to(problem_dir)).encode() + b'\0')
+            if path.exists():
+                digest.update(path.read_bytes())
+            digest.update(b'\0')
+        return digest.hexdigest(), stats
+
+    def passed(self, problem_dir: Path, digest: str) -> bool:
+        """같은 내용으로 통과한 기록이 있는지 확인합니다."""
+        cached = self._entries.get(str(problem_dir.resolve()))
+        return bool(cached and cached['hash'] == digest and cached['passed'])
+
+    def record(self, problem_dir: Path, digest: str, stats: List, settings: str, passed: bool):
+        self._entries[str(problem_dir.resolve())] = {
+            'hash': digest,
+            'stats': stats,
+            'settings': settings,
+            'passed': passed,
+        }
+
+    def save(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self._entries, f)
+        tmp_path.replace(self.path)
+
+
+def _run_cases(problem_dir: Path, cases: List[Tuple[Path, Path]], limits: Optional[Dict],
+               jobs: int = 1, fail_fast: bool = False, runner_mode: str = 'auto',
+               on_case: Optional[Callable[[dict], None]] = None,
+               python: Optional[str] = None) -> Tuple[List[dict], int]:
+    """
+    테스트 케이스들을 실행합니다.
+
+    케이스는 병렬로 실행하되 결과는 케이스 순서대로 on_case에 넘깁니다.
+    fail_fast면 어느 케이스든 처음 실패한 결과가 나오는 즉시 시작하지 않은 케이스를 취소하고,
+    다른 작업자에서 실행 중인 케이스는 실행기에서 종료합니다. (그때까지 끝난 케이스만 결과에 포함)
+    python을 주면 그 인터프리터로 실행합니다. (기본값: 지금 실행 중인 인터프리터)
+
+    Returns:
+        (케이스 결과 리스트, --fail-fast로 취소한 케이스 수) 튜플
+    """
+    timeout = limits_timeout(limits, 5)
+    results = []
+    # 케이스 번호 -> 끝났지만 앞 케이스가 아직 실행 중이라 넘기지 못한 결과
+    finished = {}
+
+    def report(case: dict):
+        results.append(case)
+        if on_case:
+            on_case(case)
+
+    runner = create_runner(problem_dir / "solution.py", mode=runner_mode, cwd=problem_dir,
+                           workers=jobs, limits=limits, python=python)
+    with runner, ThreadPoolExecutor(max_workers=max(1, jobs)) as executor:
+        futures = {
+            executor.submit(_run_case, runner, input_file, output_file, timeout): index
+            for index, (input_file, output_file) in enumerate(cases)
+        }
+
+        for future in as_completed(futures):
+            case = future.result()
+            finished[futures[future]] = case
+            if not case['passed'] and fail_fast:
+                for f in futures:
+                    f.cancel()
+                # 이미 실행 중인 케이스를 기다리지 않도록 종료 (스레드 풀이 닫힐 때 바로 돌아옴)
+                runner.cancel()
+                break
+            while len(results) in finished:
+                report(finished.pop(len(results)))
+
+    # --fail-fast로 멈춘 경우 멈추기 전에 끝난 케이스들 (실패한 케이스 포함)
+    for index in sorted(finished):
+        report(finished[index])
+    return results, len(cases) - len(results)
+
+
+def interpreter_matrix(problem: Dict, interpreters: List[Dict], jobs: int = 1,
+                       runner_mode: str = 'auto', enforce_limits: bool = True,
+                       strict_limits: bool = False) -> Dict[str, List[dict]]:
+    """
+    모든 테스트 케이스를 인터프리터마다 실행합니다.
+
+    제한은 인터프리터의 백준 언어(Python 3, PyPy3) 기준 추가 시간/메모리를 적용합니다.
+
+    Args:
+        problem: ProblemRegistry가 반환한 문제 정보
+        interpreters: boj_runner.find_interpreters()가 찾은 인터프리터 리스트
+        strict_limits: 추가 시간/메모리 없이 문제의 원래 제한을 적용할지 여부
+
+    Returns:
+        {인터프리터 이름: 케이스 결과 리스트}
+    """
+    matrix = {}
+    for interpreter in interpreters:
+        limits = problem['limits'] if enforce_limits else None
+        if limits:
+            limits = judge_limits(limits, None if strict_limits else interpreter['language'])
+        matrix[interpreter['name']], _ = _run_cases(problem['dir'], problem['cases'], limits, jobs=jobs,
+                                                    runner_mode=runner_mode, python=interpreter['path'])
+    return matrix
+
+
+def recommend_interpreter(interpreters: List[Dict], matrix: Dict[str, List[dict]]) -> Optional[Dict]:
+    """모든 케이스를 통과한 인터프리터 중 실행 시간 합계가 가장 짧은 것 (백준 언어를 알 수 있는 것만)"""
+    candidates = [interpreter for interpreter in interpreters
+                  if interpreter['language'] and all(case['passed'] for case in matrix[interpreter['name']])]
+    return min(candidates, key=lambda interpreter: _total_time(matrix[interpreter['name']]), default=None)
+
+
+def print_matrix(interpreters: List[Dict], matrix: Dict[str, List[dict]], recommended: Optional[Dict]):
+    """케이스 × 인터프리터 실행 시간 표를 출력합니다. (실패한 칸은 결과를 표시)"""
+    width = max([18] + [len(interpreter['name']) + 2 for interpreter in interpreters])
+    print(pad('케이스', 8) + ''.join(pad(interpreter['name'], width, right=True)
+                                    for interpreter in interpreters))
+    print(pad('', 8) + ''.join(pad(f"{interpreter['language'] or interpreter['implementation']} "
+                                     f"{interpreter['version']}", width, right=True)
+                                for interpreter in interpreters))
+    print("-" * (8 + width * len(interpreters)))
+
+    columns = [matrix[interpreter['name']] for interpreter in interpreters]
+    for row in zip(*columns):
+        cells = [f"{case['result'].wall_time * 1000:.1f} ms" if case['passed'] else case['verdict']
+                 for case in row]
+        print(pad(str(row[0]['num']), 8) + ''.join(pad(cell, width, right=True) for cell in cells))
+
+    print("-" * (8 + width * len(interpreters)))
+    totals = [f"{_total_time(column) * 1000:.1f} ms" if all(case['passed'] for case in column) else "실패"
+              for column in columns]
+    print(pad('합계', 8) + ''.join(pad(total, width, right=True) for total in totals))
+    if recommended:
+        marks = ["<- 추천" if interpreter is recommended else "" for interpreter in interpreters]
+        print(pad('', 8) + ''.join(pad(mark, width, right=True) for mark in marks))
+
+
+def _total_time(results: List[dict]) -> float:
+    return sum(case['result'].wall_time for case in results if case['result'])
+
+
+def verify_interpreters(problem_dir: Path, names: List[str], jobs: int = 1, runner_mode: str = 'auto',
+                        enforce_limits: bool = True, strict_limits: bool = False,
+                        registry: Optional[ProblemRegistry] = None) -> bool:
+    """
+    solution.py를 여러 인터프리터로 검증하고 실행 시간을 표로 비교합니다.
+
+    PATH에 없거나 실행되지 않는 인터프리터는 건너뜁니다.
+
+    Returns:
+        찾은 인터프리터 중 하나라도 모든 테스트를 통과했는지 여부
+    """
+    registry = registry or ProblemRegistry(problem_dir.parent)
+    problem = registry.describe(problem_dir)
+    if not (problem_dir / "solution.py").exists() or not problem['cases']:
+        print(f"[X] solution.py 또는 입력 파일이 없습니다: {problem_dir}")
+        return False
+
+    print(f"[*] 문제 디렉토리: {problem_dir.name}")
+    return compare_interpreters(problem, names, jobs=jobs, runner_mode=runner_mode,
+                                enforce_limits=enforce_limits, strict_limits=strict_limits)
+
+
+def compare_interpreters(problem: Dict, names: List[str], jobs: int = 1, runner_mode: str = 'auto',
+                         enforce_limits: bool = True, strict_limits: bool = False) -> bool:
+    """
+    인터프리터들을 찾아서 interpreter_matrix()로 실행하고, 표와 제출 추천 언어를 출력합니다.
+
+    PATH에 없거나 실행되지 않는 인터프리터는 알리고 건너뜁니다. (verify.py, boj_test.py의 --interpreters)
+
+    Args:
+        problem: ProblemRegistry가 반환한 문제 정보
+        names: 인터프리터 이름 리스트
+
+    Returns:
+        찾은 인터프리터 중 하나라도 모든 테스트를 통과했는지 여부
+    """
+    interpreters, missing = find_interpreters(names)
+    for name, reason in missing:
+        print(f"[!] {name}: {reason} - 건너뜁니다.")
+    if not interpreters:
+        print("[X] 실행할 수 있는 인터프리터가 없습니다.")
+        return False
+
+    print(f"[*] {len(problem['cases'])}개의 테스트 케이스를 인터프리터 {len(interpreters)}개로 실행합니다: "
+          f"{', '.join(interpreter['name'] for interpreter in interpreters)}\n")
+
+    matrix = interpreter_matrix(problem, interpreters, jobs=jobs, runner_mode=runner_mode,
+                                enforce_limits=enforce_limits, strict_limits=strict_limits)
+    recommended = recommend_interpreter(interpreters, matrix)
+
+    print("=" * 50)
+    print_matrix(interpreters, matrix, recommended)
+    print("=" * 50)
+
+    for interpreter in interpreters:
+        for case in matrix[interpreter['name']]:
+            if not case['passed']:
+                print(f"[X] {interpreter['name']}: 테스트 케이스 {case['num']} {case['error'] or case['verdict']}")
+    if recommended:
+        print(f"[O] 제출 추천: {recommended['language']} ({recommended['name']}, "
+              f"합계 {_total_time(matrix[recommended['name']]) * 1000:.1f} ms)")
+        return True
+    if any(all(case['passed'] for case in matrix[interpreter['name']]) for interpreter in interpreters):
+        print("[!] 모든 테스트를 통과한 인터프리터가 있지만 백준 언어를 알 수 없습니다.")
+        return True
+
+    print("[X] 모든 테스트를 통과한 인터프리터가 없습니다.")
+    return False
+
+
+def _memprofile_cases(problem_dir: Path, cases: List[Tuple[Path, Path]], limits: Optional[Dict],
+                      top: int) -> List[dict]:
+    """
+    테스트 케이스들을 tracemalloc을 켜고 하나씩 실행해서 출력과 메모리 사용량을 확인합니다.
+
+    Returns:
+        케이스 결과 리스트 ({'num', 'passed', 'peak'}, peak는 바이트 또는 None)
+    """
+    # tracemalloc/cProfile은 --memprofile에서만 필요하므로 여기서 import (시작 시간 단축)
+    from boj_profile import memory_profile_case, print_memory_report
+
+    solution_path = problem_dir / "solution.py"
+    limit_mb = limits['memory'] if limits else None
+    results = []
+    for input_file, output_file in cases:
+        case = {'num': case_number(input_file), 'passed': False, 'peak': None}
+        results.append(case)
+        print(f"테스트 케이스 {case['num']}")
+        print("-" * 50)
+
+        with tempfile.TemporaryDirectory(prefix='boj_memprofile_') as tmp_dir:
+            stdout_path = Path(tmp_dir) / 'stdout'
+            result, report = memory_profile_case(solution_path, input_file, Path(tmp_dir) / 'memory.json',
+                                                 stdout_path=stdout_path, cwd=problem_dir, top=top)
+            mismatch = None
+            if output_file.exists() and not result.timed_out and result.returncode == 0:
+                mismatch = compare_output(stdout_path, output_file)
+
+        if result.timed_out:
+            print("[X] 시간 초과 (tracemalloc을 켜면 실행이 느려집니다)")
+        elif result.returncode != 0:
+            print("[X] 런타임 에러")
+            print(result.stderr.rstrip())
+        elif not output_file.exists():
+            print(f"[X] 출력 파일이 없습니다: {output_file.name}")
+        elif mismatch:
+            print("[X] 실패")
+            print(format_mismatch(mismatch))
+        else:
+            print("[O] 통과")
+
+        within_limit = True
+        if report:
+            case['peak'] = report['peak']
+            within_limit = print_memory_report(report, solution_path, limit_mb)
+        case['passed'] = (within_limit and not result.timed_out and result.returncode == 0
+                          and output_file.exists() and mismatch is None)
+        print()
+    return results
+
+
+def verify_solution(problem_dir: Path, jobs: int = 1, fail_fast: bool = False,
+                    runner_mode: str = 'auto', language: Optional[str] = 'Python 3',
+                    enforce_limits: bool = True,
+                    registry: Optional[ProblemRegistry] = None,
+                    memprofile_top: Optional[int] = None) -> bool:
     """
     solution.py를 input/output 파일들로 검증합니다.
 
     Args:
         problem_dir: 문제 디렉토리 경로
+        jobs: 동시에 실행할 테스트 케이스 수
+        fail_fast: 실패한 케이스가 나오면 남은 케이스를 취소할지 여부
+        runner_mode: 실행 방식 ('auto', 'fork', 'spawn')
+        language: 추가 시간/메모리를 계산할 언어 (None이면 문제의 원래 제한 사용)
+        enforce_limits: 문제의 시간/메모리 제한을 적용할지 여부
+        registry: 테스트 케이스와 제한을 조회할 레지스트리 (기본값: 문제 디렉토리의 상위 디렉토리)
+        memprofile_top: 지정하면 케이스마다 tracemalloc으로 최대 할당량과 할당이 많은 줄 상위 N개를 보여줌
+            (케이스를 하나씩 spawn으로 실행하며, jobs/fail_fast/runner_mode는 사용하지 않음)
 
     Returns:
         모든 테스트 통과 여부
@@ -21,84 +437,55 @@ def verify_solution(problem_dir: Path) -> bool:
         print(f"[X] solution.py가 없습니다: {problem_dir}")
         return False
 
-    # input, output 폴더 확인
-    input_dir = problem_dir / "input"
-    output_dir = problem_dir / "output"
-
-    if not input_dir.exists() or not output_dir.exists():
-        print(f"[X] input 또는 output 폴더가 없습니다: {problem_dir}")
-        return False
-
-    # 예제 파일 찾기
-    input_files = sorted(input_dir.glob("*.txt"), key=lambda x: int(x.stem))
-    if not input_files:
-        print(f"[X] 입력 파일이 없습니다: {input_dir}")
+    # 예제 파일 찾기 (레지스트리 인덱스에서 조회)
+    registry = registry or ProblemRegistry(problem_dir.parent)
+    problem = registry.describe(problem_dir)
+    cases = problem['cases']
+    if not cases:
+        print(f"[X] 입력 파일이 없습니다: {problem_dir / 'input'}")
         return False
 
     print(f"[*] 문제 디렉토리: {problem_dir.name}")
-    print(f"[*] {len(input_files)}개의 테스트 케이스를 실행합니다...\n")
 
-    all_passed = True
+    # 로컬 메타데이터 인덱스에 있으면 제목/티어도 표시 (네트워크 요청 없음)
+    problem_id = problem_dir.name.split('_', 1)[0]
+    meta = ProblemIndex().get(problem_id) if problem_id.isdigit() else None
+    if meta:
+        print(f"[*] 문제: {meta['id']}. {meta['title']} ({tier_name(meta['level'])})")
+    limits = problem['limits'] if enforce_limits else None
+    if limits:
+        limits = judge_limits(limits, language)
+        print(f"[*] 제한: 시간 {limits['time']:g}초, 메모리 {limits['memory']:g}MB"
+              f" ({language or '추가 시간 없음'} 기준)")
 
-    for input_file in input_files:
-        # 대응하는 output 파일 찾기
-        test_num = input_file.stem
-        output_file = output_dir / f"{test_num}.txt"
-        if not output_file.exists():
-            print(f"[X] 출력 파일이 없습니다: {output_file.name}")
-            all_passed = False
-            continue
+    if memprofile_top is not None:
+        from boj_profile import format_bytes
 
-        # solution.py 실행
-        try:
-            with open(input_file, 'r', encoding='utf-8') as f:
-                input_data = f.read()
+        print(f"[*] {len(cases)}개의 테스트 케이스를 tracemalloc으로 실행합니다...\n")
+        results = _memprofile_cases(problem_dir, cases, limits, memprofile_top)
+        all_passed = all(case['passed'] for case in results)
 
-            result = subprocess.run(
-                [sys.executable, str(solution_path)],
-                input=input_data,
-                capture_output=True,
-                text=True,
-                timeout=5,
-                cwd=problem_dir
-            )
+        print("=" * 50)
+        for case in results:
+            peak = format_bytes(case['peak']) if case['peak'] is not None else "-"
+            print(f"테스트 케이스 {case['num']}: 최대 할당량 {peak}{'' if case['passed'] else ' (실패)'}")
+        print("=" * 50)
+        if all_passed:
+            print("[O] 모든 테스트를 통과했습니다!")
+        else:
+            print("[X] 일부 테스트가 실패했습니다.")
+        return all_passed
 
-            # 예상 출력 읽기
-            with open(output_file, 'r', encoding='utf-8') as f:
-                expected = f.read().strip()
+    print(f"[*] {len(cases)}개의 테스트 케이스를 실행합니다...\n")
 
-            actual = result.stdout.strip()
-
-            # 결과 비교
-            print(f"테스트 케이스 {test_num}")
-            print("-" * 50)
-
-            if actual == expected:
-                print("[O] 통과")
-            else:
-                print("[X] 실패")
-                print(f"\n[입력]")
-                print(input_data)
-                print(f"\n[예상 출력]")
-                print(expected)
-                print(f"\n[실제 출력]")
-                print(actual)
-                all_passed = False
-
-            if result.stderr:
-                print(f"\n[에러]")
-                print(result.stderr)
-                all_passed = False
-
-            print()
-
-        except subprocess.TimeoutExpired:
-            print(f"[X] 테스트 케이스 {test_num}: 시간 초과")
-            all_passed = False
-        except Exception as e:
-            print(f"[X] 테스트 케이스 {test_num}: 오류 발생 - {e}")
-            all_passed = False
+    results, cancelled = _run_cases(problem_dir, cases, limits, jobs=jobs, fail_fast=fail_fast,
+                                    runner_mode=runner_mode, on_case=_print_case)
+    if cancelled:
+        print(f"[!] --fail-fast: 남은 {cancelled}개의 테스트 케이스를 취소했습니다.\n")
+    all_passed = all(case['passed'] for case in results)
 
+    print("=" * 50)
+    print_usage_table([(case['num'], case['verdict'], case['result']) for case in results])
     print("=" * 50)
     if all_passed:
         print("[O] 모든 테스트를 통과했습니다!")
@@ -108,30 +495,184 @@ def verify_solution(problem_dir: Path) -> bool:
     return all_passed
 
 
-def main():
-    if len(sys.argv) < 2:
-        print("사용법: python verify.py <문제번호>")
-        print("예시: python verify.py 1000")
-        sys.exit(1)
+def verify_all(problems_dir: Path, jobs: int = 1, force: bool = False,
+               runner_mode: str = 'auto', language: Optional[str] = 'Python 3',
+               enforce_limits: bool = True) -> bool:
+    """
+    problems/의 모든 문제를 검증합니다.
 
-    problem_id = sys.argv[1]
+    지난번에 같은 내용으로 통과한 문제는 건너뛰고, 바뀐 문제만 jobs개씩 동시에 검증합니다.
 
-    # 문제 디렉토리 찾기
+    Args:
+        problems_dir: 문제 디렉토리들이 있는 디렉토리
+        jobs: 동시에 검증할 문제 수
+        force: 캐시를 무시하고 모든 문제를 다시 검증할지 여부
+        runner_mode: 실행 방식 ('auto', 'fork', 'spawn')
+        language: 추가 시간/메모리를 계산할 언어 (None이면 문제의 원래 제한 사용)
+        enforce_limits: 문제의 시간/메모리 제한을 적용할지 여부
+
+    Returns:
+        모든 문제 통과 여부
+    """
+    start = time.perf_counter()
+    registry = ProblemRegistry(problems_dir)
+    cache = VerifyCache()
+
+    pending = []
+    skipped = 0
+    no_solution = 0
+    for problem_id in registry.ids():
+        problem = registry.get(problem_id)
+        if not problem or not (problem['dir'] / "solution.py").exists() or not problem['cases']:
+            no_solution += 1
+            continue
+
+        limits = problem['limits'] if enforce_limits else None
+        if limits:
+            limits = judge_limits(limits, language)
+        # 같은 파일이라도 적용한 제한이 다르면 결과가 달라질 수 있으므로 해시에 포함
+        settings = json.dumps({'limits': limits, 'runner': runner_mode, 'compare': COMPARE_RULES},
+                              sort_keys=True)
+        digest, stats = cache.fingerprint(problem, settings)
+
+        if not force and cache.passed(problem['dir'], digest):
+            skipped += 1
+            continue
+        pending.append((problem, limits, settings, digest, stats))
+
+    print(f"[*] 문제 {skipped + len(pending)}개 중 {len(pending)}개를 검증합니다. "
+          f"(변경 없음 {skipped}개 건너뜀{', --force' if force else ''})\n")
+
+    failed = []
+    with ThreadPoolExecutor(max_workers=max(1, jobs)) as executor:
+        # 문제 안의 케이스는 순서대로 실행하고, 실패하면 나머지 케이스는 실행하지 않음
+        futures = {}
+        for item in pending:
+            problem, limits = item[:2]
+            future = executor.submit(_run_cases, problem['dir'], problem['cases'], limits,
+                                     fail_fast=True, runner_mode=runner_mode)
+            futures[future] = item
+
+        for future in as_completed(futures):
+            problem, limits, settings, digest, stats = futures[future]
+            name = problem['dir'].name
+            try:
+                results, _ = future.result()
+            except Exception as e:
+                print(f"[X] {name}: 오류 발생 - {e}")
+                failed.append(name)
+                continue
+
+            passed = all(case['passed'] for case in results)
+            cache.record(problem['dir'], digest, stats, settings, passed)
+
+            if passed:
+                slowest = max((case['result'].wall_time for case in results if case['result']), default=0)
+                print(f"[O] {name}: {len(results)}개 통과 (최대 {slowest * 1000:.1f} ms)")
+            else:
+                case = results[-1]
+                print(f"[X] {name}: 테스트 케이스 {case['num']} {case['error'] or case['verdict']}")
+                failed.append(name)
+
+    cache.save()
+
+    elapsed = time.perf_counter() - start
+    print("\n" + "=" * 50)
+    print(f"[*] 통과 {len(pending) - len(failed)}개, 실패 {len(failed)}개, "
+          f"건너뜀 {skipped}개 ({elapsed:.1f}초)")
+    if no_solution:
+        print(f"[!] solution.py 또는 예제가 없는 문제 {no_solution}개는 검증하지 않았습니다.")
+    if failed:
+        print(f"[X] 실패한 문제: {' '.join(sorted(failed))}")
+        print("    자세한 결과는 python tools/verify.py <문제 번호>로 확인하세요.")
+        return False
+
+    print("[O] 모든 문제를 통과했습니다!")
+    return True
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(
+        description='백준 문제 풀이를 예제 입출력으로 검증합니다.',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+사용 예시:
+  python verify.py 1000
+  python verify.py 21394 --memprofile          # 케이스별 최대 할당량과 할당이 많은 줄
+  python verify.py 1411 --interpreters python3.11,python3.12,pypy3   # 인터프리터별 실행 시간 비교
+  python verify.py --all
+        """
+    )
+    parser.add_argument('problem_id', type=str, nargs='?', help='백준 문제 번호')
+    parser.add_argument('--all', action='store_true',
+                        help='problems/의 모든 문제를 검증 (지난번 이후 바뀐 문제만 실행)')
+    parser.add_argument('--force', action='store_true',
+                        help='--all에서 캐시를 무시하고 모든 문제를 다시 검증')
+    parser.add_argument('-j', '--jobs', type=int, default=None,
+                        help='동시에 실행할 테스트 케이스 수, --all에서는 동시에 검증할 문제 수 '
+                             '(기본값: 1, --all은 CPU 코어 수)')
+    parser.add_argument('--fail-fast', action='store_true',
+                        help='실패한 테스트 케이스가 나오면 나머지를 취소')
+    parser.add_argument('--runner', type=str, choices=RUNNER_MODES, default='auto',
+                        help='실행 방식: fork(미리 로딩된 인터프리터), spawn(케이스마다 새 인터프리터), '
+                             'auto(가능하면 fork) (기본값: auto)')
+    parser.add_argument('--strict-limits', action='store_true',
+                        help='Python 3 추가 시간/메모리 없이 문제의 원래 제한을 적용')
+    parser.add_argument('--no-limits', action='store_true',
+                        help='문제의 시간/메모리 제한을 적용하지 않음 (고정 5초 시간 초과만 사용)')
+    parser.add_argument('--memprofile', action='store_true',
+                        help='tracemalloc으로 케이스별 최대 할당량과 할당이 많은 줄을 보여주고, '
+                             '메모리 제한에 가까우면 경고')
+    parser.add_argument('--top', type=int, default=5,
+                        help='--memprofile에서 보여줄 줄 수 (기본값: 5)')
+    parser.add_argument('--interpreters', type=str, nargs='?', const=','.join(DEFAULT_INTERPRETERS),
+                        help='쉼표로 구분한 인터프리터들로 모든 케이스를 실행해서 실행 시간을 비교하고 '
+                             f'제출할 언어를 추천 (값을 생략하면 {",".join(DEFAULT_INTERPRETERS)})')
+
+    args = parser.parse_args(argv)
+    problem_id = args.problem_id
     problems_dir = Path(__file__).parent.parent / "problems"
-    problem_dirs = list(problems_dir.glob(f"{problem_id}_*"))
+    language = None if args.strict_limits else 'Python 3'
+
+    if args.all == bool(problem_id):
+        parser.error('문제 번호 또는 --all 중 하나를 지정해야 합니다.')
+
+    if args.all and (args.memprofile or args.interpreters):
+        parser.error('--memprofile, --interpreters는 문제 하나에만 사용할 수 있습니다.')
+    if args.memprofile and args.interpreters:
+        parser.error('--memprofile과 --interpreters는 함께 사용할 수 없습니다.')
 
-    if not problem_dirs:
+    if args.all:
+        success = verify_all(problems_dir, jobs=args.jobs or os.cpu_count() or 1, force=args.force,
+                             runner_mode=args.runner, language=language,
+                             enforce_limits=not args.no_limits)
+        sys.exit(0 if success else 1)
+
+    # 문제 디렉토리 찾기
+    registry = ProblemRegistry(problems_dir)
+    problem = registry.get(problem_id)
+
+    if not problem:
         print(f"[X] 문제 {problem_id}를 찾을 수 없습니다.")
         sys.exit(1)
 
-    if len(problem_dirs) > 1:
+    if problem['conflicts']:
         print(f"[X] 여러 개의 문제가 발견되었습니다:")
-        for d in problem_dirs:
-            print(f"  - {d.name}")
+        for name in sorted([problem['dir'].name] + problem['conflicts']):
+            print(f"  - {name}")
         sys.exit(1)
 
-    problem_dir = problem_dirs[0]
-    success = verify_solution(problem_dir)
+    if args.interpreters:
+        names = [name.strip() for name in args.interpreters.split(',') if name.strip()]
+        success = verify_interpreters(problem['dir'], names, jobs=args.jobs or 1, runner_mode=args.runner,
+                                      enforce_limits=not args.no_limits, strict_limits=args.strict_limits,
+                                      registry=registry)
+        sys.exit(0 if success else 1)
+
+    success = verify_solution(problem['dir'], jobs=args.jobs or 1, fail_fast=args.fail_fast,
+                              runner_mode=args.runner, language=language,
+                              enforce_limits=not args.no_limits, registry=registry,
+                              memprofile_top=args.top if args.memprofile else None)
 
     sys.exit(0 if success else 1)
 